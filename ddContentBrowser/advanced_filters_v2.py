@@ -347,8 +347,9 @@ class AdvancedFiltersPanelV2(QWidget):
         start_prep = time.time()
         # Use _ungrouped_assets if available (to work with ungrouped files)
         # This ensures advanced filters work on individual files, not grouped sequences
+        # (the ungrouped list holds every loaded item - only the ones the view filters show count)
         if hasattr(self.file_model, '_ungrouped_assets') and self.file_model._ungrouped_assets:
-            self.original_assets = self.file_model._ungrouped_assets.copy()
+            self.original_assets = self.file_model._visible(self.file_model._ungrouped_assets)
             print(f"[AdvancedFilters] Using _ungrouped_assets: {len(self.original_assets)} assets")
         else:
             self.original_assets = self.file_model.assets.copy()
@@ -0,0 +1,664 @@
+"""
+Performance benchmarks for ddContentBrowser hot paths
+
+Each benchmark compares the previous implementation (where one existed) with the
+current one on synthetic data, and prints timings.
+
+Usage:
+    python benchmark_browser.py              # Run all benchmarks
+    python benchmark_browser.py visible_range
+    python benchmark_browser.py generator_dispatch
+    python benchmark_browser.py parallel_walk [folder]   # Synthetic tree unless a folder is given
+    python benchmark_browser.py asset_memory
+    python benchmark_browser.py search_matcher
+    python benchmark_browser.py sequence_grouping
+    python benchmark_browser.py sort_keys
+    python benchmark_browser.py filter_toggle
+    python benchmark_browser.py stat_loader
+    python benchmark_browser.py fetch_more
+
+Requirements:
+    - ddContentBrowser importable (PySide6 or PySide2)
+    - Runs offscreen, no display needed
+"""
+
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PySide6 import QtCore, QtWidgets
+except ImportError:
+    from PySide2 import QtCore, QtWidgets
+
+
+def _timeit(func, repeat=5):
+    """Best wall time of func() in milliseconds, and its last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _print_header(title):
+    print("\n" + "=" * 60)
+    print(title)
+    print("=" * 60)
+
+
+def bench_visible_range(item_count=100000):
+    """Visible row range: full visualRect() scan vs viewport probing"""
+    from ddContentBrowser.widgets import MayaStyleListView
+
+    _print_header(f"Visible row range ({item_count:,} items)")
+
+    model = QtCore.QStringListModel([f"asset_{i:06d}.exr" for i in range(item_count)])
+
+    for mode_name, icon_mode in (("Grid", True), ("List", False)):
+        view = MayaStyleListView()
+        view.setModel(model)
+        view.setUniformItemSizes(True)
+        if icon_mode:
+            view.setViewMode(QtWidgets.QListView.IconMode)
+            view.setFlow(QtWidgets.QListView.LeftToRight)
+            view.setWrapping(True)
+            view.setSpacing(10)
+            view.setGridSize(QtCore.QSize(148, 168))
+        view.resize(1200, 800)
+        view.show()
+        QtWidgets.QApplication.processEvents()
+
+        # Scroll to the middle so neither edge of the model is visible
+        scrollbar = view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum() // 2)
+        QtWidgets.QApplication.processEvents()
+
+        def full_scan():
+            viewport_rect = view.viewport().rect()
+            start_row = end_row = None
+            for row in range(model.rowCount()):
+                rect = view.visualRect(model.index(row, 0))
+                if rect.isValid() and viewport_rect.intersects(rect):
+                    if start_row is None:
+                        start_row = row
+                    end_row = row
+            return start_row, end_row
+
+        scan_ms, scan_range = _timeit(full_scan, repeat=1)
+        probe_ms, probe_range = _timeit(view.visible_row_range, repeat=20)
+
+        print(f"{mode_name:>5} | full scan: {scan_ms:9.2f} ms -> rows {scan_range}")
+        print(f"{mode_name:>5} | probing:   {probe_ms:9.3f} ms -> rows {probe_range}")
+        if scan_range != probe_range:
+            print("      ⚠️  Range mismatch!")
+
+        view.close()
+
+
+def bench_generator_dispatch(job_count=500):
+    """ThumbnailGenerator dispatcher: idle CPU and queue-to-result latency"""
+    from ddContentBrowser.cache import ThumbnailGenerator
+    
+    _print_header(f"Generator dispatch loop ({job_count} jobs)")
+    
+    class NullMemoryCache:
+        def get(self, key):
+            return None
+        
+        def set(self, key, pixmap):
+            pass
+    
+    class NullDiskCache:
+        def contains(self, file_path, mtime):
+            return False
+        
+        def get(self, file_path, mtime):
+            return None
+        
+        def set(self, *args):
+            pass
+        
+        def flush(self):
+            pass
+    
+    generator = ThumbnailGenerator(NullMemoryCache(), NullDiskCache(), max_workers=4)
+    
+    # Decoding is not measured here - jobs return instantly, results are timestamped
+    delivered = {}
+    all_delivered = threading.Event()
+    generator._generate_thumbnail_data = lambda file_path, asset: {"file_path": file_path}
+    
+    def record_result(img_data):
+        delivered[img_data["file_path"]] = time.perf_counter()
+        if len(delivered) == job_count + 1:
+            all_delivered.set()
+        return None
+    
+    generator._numpy_to_pixmap = record_result
+    
+    # run() directly on a plain thread - no event loop needed for the dispatcher
+    loop_thread = threading.Thread(target=generator.run, daemon=True)
+    loop_thread.start()
+    time.sleep(0.2)
+    
+    # Idle: nothing queued, process CPU time over wall time
+    idle_seconds = 2.0
+    cpu_start = time.process_time()
+    time.sleep(idle_seconds)
+    idle_cpu = (time.process_time() - cpu_start) / idle_seconds * 100
+    
+    # Latency of a single job on an idle generator
+    submitted = time.perf_counter()
+    generator.add_to_queue("/bench/single.exr", 0.0, priority=True)
+    while "/bench/single.exr" not in delivered:
+        time.sleep(0.0005)
+    single_ms = (delivered["/bench/single.exr"] - submitted) * 1000
+    
+    # Throughput of a burst
+    submitted = time.perf_counter()
+    for i in range(job_count):
+        generator.add_to_queue(f"/bench/file_{i:05d}.exr", 0.0, priority=True)
+    all_delivered.wait(30)
+    burst_ms = (max(delivered.values()) - submitted) * 1000
+    
+    generator.stop()
+    loop_thread.join(5)
+    
+    print(f"Idle CPU:        {idle_cpu:8.2f} % of one core")
+    print(f"Single latency:  {single_ms:8.3f} ms")
+    print(f"Burst of {job_count}:  {burst_ms:8.2f} ms ({len(delivered) - 1} results)")
+
+
+def bench_parallel_walk(root=None, latency_ms=3.0):
+    """Recursive listing: os.walk vs walk_parallel (same order)"""
+    import shutil
+    import tempfile
+    from ddContentBrowser.models import walk_parallel, PARALLEL_WALK_WORKERS
+    
+    synthetic = root is None
+    if synthetic:
+        # 20 x 20 folders with 10 files each - per-listing latency simulates a network share
+        root = tempfile.mkdtemp(prefix="ddcb_walk_")
+        for i in range(20):
+            for j in range(20):
+                folder = os.path.join(root, f"shot_{i:03d}", f"render_{j:03d}")
+                os.makedirs(folder)
+                for k in range(10):
+                    open(os.path.join(folder, f"frame.{k:04d}.exr"), "w").close()
+    
+    _print_header(f"Recursive walk ({'synthetic, %.1f ms per listing' % latency_ms if synthetic else root})")
+    
+    real_scandir = os.scandir
+    
+    def slow_scandir(path="."):
+        time.sleep(latency_ms / 1000.0)
+        return real_scandir(path)
+    
+    if synthetic:
+        os.scandir = slow_scandir
+    try:
+        walk_ms, walk_result = _timeit(lambda: list(os.walk(root)), repeat=1)
+        stats = {}
+        parallel_ms, parallel_result = _timeit(lambda: list(walk_parallel(root, stats=stats)), repeat=1)
+    finally:
+        os.scandir = real_scandir
+        if synthetic:
+            shutil.rmtree(root, ignore_errors=True)
+    
+    dir_count = len(walk_result)
+    print(f"os.walk:        {walk_ms:9.1f} ms ({dir_count / walk_ms * 1000:8.0f} dirs/s)")
+    print(f"walk_parallel:  {parallel_ms:9.1f} ms ({stats['dirs_per_sec']:8.0f} dirs/s, "
+          f"{PARALLEL_WALK_WORKERS} workers)")
+    print(f"Speedup:        {walk_ms / parallel_ms:9.1f}x")
+    if walk_result != parallel_result:
+        print("      ⚠️  Order mismatch!")
+    
+    # Unreadable folders (permission-restricted shares) list no children - a run of them
+    # longer than the prefetch depth must not leave the walk without queued listings
+    root = tempfile.mkdtemp(prefix="ddcb_walk_")
+    try:
+        sibling_count = PARALLEL_WALK_WORKERS * 4
+        for i in range(sibling_count):
+            os.makedirs(os.path.join(root, f"locked_{i:03d}", "inner"))
+        readable = os.path.join(root, f"locked_{sibling_count - 1:03d}")
+        
+        def restricted_scandir(path="."):
+            path_str = os.fspath(path)
+            if os.path.basename(path_str).startswith("locked_") and path_str != readable:
+                raise PermissionError(path_str)
+            return real_scandir(path)
+        
+        os.scandir = restricted_scandir
+        try:
+            walk_result = list(os.walk(root))
+            parallel_result = list(walk_parallel(root))
+        finally:
+            os.scandir = real_scandir
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    
+    print(f"Unreadable:     {sibling_count - 1} of {sibling_count} sibling folders -> "
+          f"{len(parallel_result)} folders listed")
+    if walk_result != parallel_result:
+        print("      ⚠️  Order mismatch!")
+
+
+def bench_asset_memory(item_count=100000):
+    """AssetItem memory per item: previous dict-based layout vs __slots__ layout"""
+    import gc
+    import tracemalloc
+    from datetime import datetime
+    from ddContentBrowser.models import AssetItem
+    
+    _print_header(f"AssetItem memory ({item_count:,} items)")
+    
+    class LegacyAssetItem:
+        """Attribute layout of the previous AssetItem (Path, datetime, bool per type)"""
+        
+        def __init__(self, file_path, category, mtime, size):
+            self.file_path = Path(file_path)
+            self.name = self.file_path.name
+            self.is_folder = False
+            self.extension = self.file_path.suffix.lower()
+            self.is_sequence = False
+            self.sequence = None
+            self._stat_loaded = True
+            self._size = size
+            self._modified_time = mtime
+            self._modified = datetime.fromtimestamp(mtime)
+            self.category = category
+            self.is_maya_file = category == "maya"
+            self.is_image_file = category == "images"
+            self.is_script_file = category in ["scripts", "text"]
+            self.is_pdf_file = category == "pdf"
+            self.is_hda_file = category == "houdini"
+            self.is_blend_file = category == "blender"
+            self.is_sbsar_file = category == "substance"
+            self.is_video_file = category == "video"
+            self.should_generate_thumbnail = True
+    
+    # Typical render listing - long shared folder prefix, frame-numbered names
+    folder = "//fileserver/projects/show/seq010/sh0420/render/beauty/v012"
+    paths = [f"{folder}/sh0420_beauty_v012.{i:07d}.exr" for i in range(item_count)]
+    stat_result = os.stat_result((0o100644, 0, 0, 1, 0, 0, 24117248, 0, 1700000000, 1700000000))
+    
+    def measure(create):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        items = create()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return (after - before) / item_count, items
+    
+    legacy_bytes, legacy_items = measure(
+        lambda: [LegacyAssetItem(p, "images", 1700000000.0, 24117248) for p in paths]
+    )
+    del legacy_items
+    
+    def create_assets():
+        assets = [AssetItem(p, lazy_load=True, is_folder=False) for p in paths]
+        for asset in assets:
+            asset._apply_stat(stat_result)
+        return assets
+    
+    slots_bytes, assets = measure(create_assets)
+    
+    # Paths built for every item (e.g. after a full thumbnail pass)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for asset in assets:
+        asset.file_path
+    path_bytes = (tracemalloc.get_traced_memory()[0] - before) / item_count
+    tracemalloc.stop()
+    
+    print(f"Previous layout:        {legacy_bytes:8.0f} bytes/item ({legacy_bytes * item_count / 1048576:6.1f} MB)")
+    print(f"__slots__ layout:       {slots_bytes:8.0f} bytes/item ({slots_bytes * item_count / 1048576:6.1f} MB)")
+    print(f"  + Path materialized:  {slots_bytes + path_bytes:8.0f} bytes/item")
+    print(f"Saved:                  {(1 - slots_bytes / legacy_bytes) * 100:8.1f} %")
+
+
+def bench_search_matcher(name_count=100000):
+    """Search filter: previous per-name _matches_search vs compiled SearchMatcher"""
+    import re
+    from ddContentBrowser.models import SearchMatcher
+    
+    _print_header(f"Search matching ({name_count:,} names)")
+    
+    def legacy_matches(filename, search_text, case_sensitive, regex):
+        """Previous FileSystemModel._matches_search - flags and lowering per name"""
+        if regex:
+            try:
+                flags = 0 if case_sensitive else re.IGNORECASE
+                return bool(re.search(search_text, filename, flags))
+            except re.error:
+                pass
+        if case_sensitive:
+            return search_text in filename
+        return search_text.lower() in filename.lower()
+    
+    passes = ["beauty", "diffuse", "specular", "depth", "normal"]
+    names = [f"sh{i % 97:04d}_{passes[i % 5]}_v{i % 13:03d}.{i:07d}.exr" for i in range(name_count)]
+    
+    for label, text, regex in (("Plain", "Beauty_v0", False), ("Regex", r"beauty_v00[0-4]\.", True)):
+        legacy_ms, legacy_result = _timeit(
+            lambda: [name for name in names if legacy_matches(name, text, False, regex)])
+        matcher = SearchMatcher(text, regex=regex)
+        match = matcher.match  # Bound once, as the scanner's per-entry loop does
+        call_ms, call_result = _timeit(lambda: [name for name in names if match(name)])
+        batch_ms, batch_result = _timeit(lambda: matcher.filter(names))
+        
+        print(f"{label} | per-name (previous): {legacy_ms:8.2f} ms -> {len(legacy_result)} matches")
+        print(f"{label} | matcher.match:       {call_ms:8.2f} ms")
+        print(f"{label} | matcher.filter():    {batch_ms:8.2f} ms ({legacy_ms / batch_ms:.1f}x)")
+        if not legacy_result == call_result == batch_result:
+            print("      ⚠️  Result mismatch!")
+    
+    # Term syntax has no previous equivalent - cost of a typical multi-term search
+    matcher = SearchMatcher("beauty | diffuse -v000 *.exr", terms=True)
+    terms_ms, terms_result = _timeit(lambda: matcher.filter(names))
+    print(f"Terms | 'beauty | diffuse -v000 *.exr': {terms_ms:8.2f} ms -> {len(terms_result)} matches")
+
+
+def bench_sequence_grouping(frame_count=50000):
+    """Sequence grouping: previous multi-parse grouping vs one-pass group_sequence_names"""
+    from ddContentBrowser.models import AssetItem, FileSystemModel
+    from ddContentBrowser.utils import detect_sequence_pattern, extract_frame_number, get_sequence_frame_range
+    
+    _print_header(f"Sequence grouping ({frame_count:,} frames in one folder)")
+    
+    def legacy_group(assets):
+        """Previous _group_sequences: parse per file, again per sort key, range and frame map, O(n^2) singles"""
+        paths = [asset.file_path for asset in assets]
+        sequences, singles = {}, {}
+        for path in paths:
+            info = detect_sequence_pattern(path.name)
+            if info:
+                base_name, frame, padding, separator = info
+                sequences.setdefault(f"{base_name}{separator}{'#' * padding}{path.suffix}", []).append(path)
+            else:
+                singles[path.name] = [path]
+        for key, files in sequences.items():
+            sequences[key] = sorted(files, key=lambda p: extract_frame_number(p.name))
+        grouped = {key: files for key, files in sequences.items() if len(files) > 1}
+        grouped.update((files[0].name, files) for files in sequences.values() if len(files) == 1)
+        grouped.update(singles)
+        
+        result = []
+        for key, files in grouped.items():
+            if len(files) > 1:
+                # ImageSequence.__init__: sort again, range and frame map parse every name again
+                files = sorted(files, key=lambda p: extract_frame_number(p.name))
+                detect_sequence_pattern(files[0].name)
+                get_sequence_frame_range(files)
+                frame_map = {extract_frame_number(p.name): p for p in files}
+                result.append((key, files, frame_map))
+            else:
+                result.extend(asset for asset in assets if asset.file_path == files[0])
+        return result
+    
+    # Render output: passes of frame_count / 10 frames each, plus stills
+    folder = "//fileserver/projects/show/seq010/sh0420/render/v012"
+    passes = ["beauty", "diffuse", "specular", "depth", "normal", "albedo", "emission", "crypto", "motion", "ao"]
+    frames_per_pass = frame_count // len(passes)
+    names = [f"sh0420_{name}_v012.{frame:04d}.exr" for name in passes for frame in range(1001, 1001 + frames_per_pass)]
+    names += [f"still_{i:03d}_final.jpg" for i in range(200)]
+    
+    def create_assets():
+        return [AssetItem(f"{folder}/{name}", lazy_load=True, is_folder=False) for name in names]
+    
+    # Listing items are created outside the timed part
+    legacy_assets = create_assets()
+    legacy_ms, legacy_result = _timeit(lambda: legacy_group(legacy_assets), repeat=1)
+    
+    model = FileSystemModel()
+    assets = create_assets()
+    
+    def group_one_pass():
+        model.assets = list(assets)
+        model._group_sequences()
+        return model.assets
+    
+    one_pass_ms, one_pass_result = _timeit(group_one_pass, repeat=3)
+    
+    print(f"Previous grouping:  {legacy_ms:9.1f} ms -> {len(legacy_result)} items")
+    print(f"One-pass grouping:  {one_pass_ms:9.1f} ms -> {len(one_pass_result)} items")
+    print(f"Speedup:            {legacy_ms / one_pass_ms:9.1f}x")
+    if len(legacy_result) != len(one_pass_result):
+        print("      ⚠️  Item count mismatch!")
+
+
+def bench_sort_keys(item_count=100000):
+    """Name sort: natural_sort_key per item per sort vs cached AssetItem.sort_key, direction flip"""
+    import random
+    from ddContentBrowser.models import AssetItem, FileSystemModel, natural_sort_key
+    
+    _print_header(f"Sorting ({item_count:,} names)")
+    
+    folder = "//fileserver/projects/show/seq010/sh0420/render/v012"
+    passes = ["beauty", "diffuse", "specular", "depth", "normal"]
+    names = [f"sh{i % 97:04d}_{passes[i % 5]}_v{i % 13:03d}.{i:07d}.exr" for i in range(item_count)]
+    random.Random(0).shuffle(names)
+    assets = [AssetItem(f"{folder}/{name}", lazy_load=True, is_folder=False) for name in names]
+    
+    def legacy_sort():
+        """Previous _sort_assets name branch - key rebuilt on every sort"""
+        ordered = list(assets)
+        ordered.sort(key=lambda x: (not x.is_folder, natural_sort_key(x.name)))
+        return ordered
+    
+    legacy_ms, legacy_result = _timeit(legacy_sort, repeat=3)
+    
+    model = FileSystemModel()
+    model.assets = list(assets)
+    first_ms, _ = _timeit(lambda: model._sort_assets(), repeat=1)   # Computes and caches the keys
+    
+    def resort():
+        model.assets = list(assets)
+        model._sort_assets()
+        return model.assets
+    
+    cached_ms, cached_result = _timeit(resort, repeat=3)
+    flip_ms, _ = _timeit(lambda: model.assets[::-1], repeat=5)
+    
+    print(f"Previous (key per sort):  {legacy_ms:8.1f} ms")
+    print(f"First sort (keys cached): {first_ms:8.1f} ms")
+    print(f"Re-sort (cached keys):    {cached_ms:8.1f} ms ({legacy_ms / cached_ms:.1f}x)")
+    print(f"Direction flip (reverse): {flip_ms:8.2f} ms")
+    if [a.name for a in legacy_result] != [a.name for a in cached_result]:
+        print("      ⚠️  Order mismatch!")
+
+
+def bench_filter_toggle(item_count=100000):
+    """Filter change: refresh (filter + sort the listing again) vs masking the loaded set"""
+    from ddContentBrowser.models import AssetItem, FileSystemModel
+    
+    _print_header(f"Filter toggle ({item_count:,} items)")
+    
+    folder = "//fileserver/projects/show/seq010/sh0420/publish"
+    extensions = [".exr", ".png", ".py", ".ma", ".mb", ".abc", ".mel", ".jpg"]
+    assets = [AssetItem(f"{folder}/asset_{i:06d}{extensions[i % len(extensions)]}", lazy_load=True, is_folder=False)
+              for i in range(item_count)]
+    for i, asset in enumerate(assets):
+        asset._size, asset._modified_time = (i * 7919) % 100000, 1.6e9 + i
+        asset._flags |= AssetItem._STAT_LOADED
+    
+    model = FileSystemModel()
+    model._loaded_assets = model._sorted_assets(assets)
+    
+    def legacy_toggle():
+        """Previous setShowImages - filter every listed item again, then sort (no grouping here)"""
+        visible = [asset for asset in assets
+                   if asset.extension in model.supported_formats and
+                   not (asset.is_image_file and not model.show_images) and
+                   not (asset.is_script_file and not model.show_scripts) and
+                   not (model.filter_min_size > 0 and asset.size < model.filter_min_size)]
+        return model._sorted_assets(visible)
+    
+    def mask_toggle():
+        return model._visible(model._loaded_assets)
+    
+    model.show_images = False
+    first_ms, _ = _timeit(mask_toggle, repeat=1)   # Builds the filter columns
+    legacy_ms, legacy_result = _timeit(legacy_toggle, repeat=3)
+    mask_ms, mask_result = _timeit(mask_toggle, repeat=5)
+    model.filter_min_size = 50000
+    sized_legacy_ms, _ = _timeit(legacy_toggle, repeat=3)
+    sized_ms, _ = _timeit(mask_toggle, repeat=5)
+    
+    print(f"Previous (filter + sort):    {legacy_ms:8.1f} ms -> {len(legacy_result)} items")
+    print(f"Mask, first (builds columns):{first_ms:8.1f} ms")
+    print(f"Mask (show images off):      {mask_ms:8.1f} ms -> {len(mask_result)} items ({legacy_ms / mask_ms:.1f}x)")
+    print(f"Mask (+ size filter):        {sized_ms:8.1f} ms (previous {sized_legacy_ms:.1f} ms)")
+    if [a.path_str for a in legacy_result] != [a.path_str for a in mask_result]:
+        print("      ⚠️  Result mismatch!")
+
+
+def bench_stat_loader(page_rows=60, latency_ms=2.0):
+    """List view page: stat() inside paint vs StatBatchLoader, on a simulated network share"""
+    import tempfile
+    import shutil
+    from ddContentBrowser import models
+    from ddContentBrowser.models import AssetItem, StatBatchLoader
+    
+    _print_header(f"Stat loading ({page_rows} rows, {latency_ms:.0f} ms per stat)")
+    
+    folder = tempfile.mkdtemp(prefix="ddcb_stat_")
+    real_stat = models.os.stat
+    try:
+        for i in range(page_rows):
+            with open(os.path.join(folder, f"shot_{i:04d}.ma"), "wb") as f:
+                f.write(b"x" * i)
+        paths = sorted(os.path.join(folder, name) for name in os.listdir(folder))
+        
+        def slow_stat(path, *args, **kwargs):
+            time.sleep(latency_ms / 1000.0)
+            return real_stat(path, *args, **kwargs)
+        models.os.stat = slow_stat
+        
+        def paint_blocking():
+            """Previous paint - size / date text stats each row in the GUI thread"""
+            assets = [AssetItem(path, lazy_load=True, is_folder=False) for path in paths]
+            return [(asset.get_size_string(), asset.get_modified_string()) for asset in assets]
+        
+        blocking_ms, _ = _timeit(paint_blocking, repeat=3)
+        
+        def paint_background():
+            """Placeholder paint, rows queued - returns (GUI thread ms, ms until all rows loaded)"""
+            assets = [AssetItem(path, lazy_load=True, is_folder=False) for path in paths]
+            done = threading.Event()
+            loaded = []
+            
+            def listener(batch):
+                loaded.extend(batch)
+                if len(loaded) == len(assets):
+                    done.set()
+            
+            loader = StatBatchLoader(listener)
+            start = time.perf_counter()
+            texts = ["..." for asset in assets if not asset._flags & AssetItem._STAT_LOADED]
+            loader.request(assets)
+            paint_ms = (time.perf_counter() - start) * 1000
+            done.wait(10)
+            return paint_ms, (time.perf_counter() - start) * 1000, len(texts)
+        
+        results = [paint_background() for _ in range(3)]
+        paint_ms = min(result[0] for result in results)
+        total_ms = min(result[1] for result in results)
+    finally:
+        models.os.stat = real_stat
+        shutil.rmtree(folder, ignore_errors=True)
+    
+    print(f"Stat in paint (GUI blocked):  {blocking_ms:8.1f} ms")
+    print(f"Background paint (GUI):       {paint_ms:8.2f} ms")
+    print(f"Background, all rows loaded:  {total_ms:8.1f} ms ({StatBatchLoader.MAX_WORKERS} workers)")
+
+
+def bench_fetch_more(item_count=100000):
+    """Large listing shown in the grid: every row at reset vs rows fetched in chunks"""
+    from ddContentBrowser.models import AssetItem, FileSystemModel
+    
+    _print_header(f"Populating the grid ({item_count:,} items)")
+    
+    folder = "//fileserver/projects/show/seq010/sh0420/publish"
+    assets = [AssetItem(f"{folder}/asset_{i:06d}.exr", lazy_load=True, is_folder=False)
+              for i in range(item_count)]
+    
+    def populate(fetch_chunk):
+        model = FileSystemModel()
+        model.FETCH_CHUNK = fetch_chunk
+        view = QtWidgets.QListView()
+        view.setViewMode(QtWidgets.QListView.IconMode)
+        view.setFlow(QtWidgets.QListView.LeftToRight)
+        view.setWrapping(True)
+        view.setUniformItemSizes(True)
+        view.setGridSize(QtCore.QSize(148, 168))
+        view.resize(1200, 800)
+        view.setModel(model)
+        view.show()
+        QtWidgets.QApplication.processEvents()
+        
+        start = time.perf_counter()
+        model.beginResetModel()
+        model.assets = list(assets)
+        model.endResetModel()
+        view.doItemsLayout()
+        QtWidgets.QApplication.processEvents()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rows = model.rowCount()
+        view.deleteLater()
+        return elapsed_ms, rows
+    
+    legacy_ms, legacy_rows = min(populate(item_count) for _ in range(3))
+    chunked_ms, chunked_rows = min(populate(FileSystemModel.FETCH_CHUNK) for _ in range(3))
+    
+    print(f"Previous (all rows at reset): {legacy_ms:8.1f} ms -> {legacy_rows:,} rows")
+    print(f"Chunked (fetchMore):          {chunked_ms:8.1f} ms -> {chunked_rows:,} rows ({legacy_ms / chunked_ms:.1f}x)")
+
+
+BENCHMARKS = {
+    "visible_range": bench_visible_range,
+    "generator_dispatch": bench_generator_dispatch,
+    "parallel_walk": bench_parallel_walk,
+    "asset_memory": bench_asset_memory,
+    "search_matcher": bench_search_matcher,
+    "sequence_grouping": bench_sequence_grouping,
+    "sort_keys": bench_sort_keys,
+    "filter_toggle": bench_filter_toggle,
+    "stat_loader": bench_stat_loader,
+    "fetch_more": bench_fetch_more,
+}
+
+
+def main():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    # (name, args) - a folder right after a name is passed on (e.g. parallel_walk //server/share/assets)
+    runs = []
+    for arg in sys.argv[1:]:
+        if os.path.isdir(arg) and runs:
+            runs[-1][1].append(arg)
+        else:
+            runs.append((arg, []))
+    
+    for name, args in runs or [(name, []) for name in BENCHMARKS]:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name](*args)
+
+
+if __name__ == "__main__":
+    main()
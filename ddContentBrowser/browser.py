@@ -17,8 +17,8 @@ from datetime import datetime
 from . import __version__
 from .config import ContentBrowserConfig
 from .utils import get_maya_main_window, MAYA_AVAILABLE
-from .cache import ThumbnailCache, ThumbnailDiskCache, ThumbnailGenerator
-from .models import AssetItem, FileSystemModel
+from .cache import ThumbnailCache, ThumbnailDiskCache, DirectoryListingCache, ThumbnailGenerator
+from .models import AssetItem, FileSystemModel, DirectoryChangeTracker
 from .delegates import ThumbnailDelegate
 from .widgets import BreadcrumbWidget, PreviewPanel, MayaStyleListView
 from .settings import SettingsManager, SettingsDialog
@@ -417,7 +417,19 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Initialize cache systems
         self.memory_cache = ThumbnailCache(self.config.config["thumbnail_cache_size"])
         disk_cache_size_mb = self.settings_manager.get("thumbnails", "cache_size_mb", 500)
-        self.disk_cache = ThumbnailDiskCache(max_size_mb=disk_cache_size_mb)
+        packed_cache = self.settings_manager.get("thumbnails", "packed_cache", False)
+        self.disk_cache = ThumbnailDiskCache(max_size_mb=disk_cache_size_mb, packed=packed_cache)
+        
+        # Folder listings persisted across sessions (known folders show up before they are listed)
+        self.listing_cache = None
+        if self.settings_manager.get("general", "listing_cache_enabled", True):
+            try:
+                self.listing_cache = DirectoryListingCache(
+                    max_size_mb=self.settings_manager.get("general", "listing_cache_size_mb", 50),
+                    ttl_days=self.settings_manager.get("general", "listing_cache_ttl_days", 30)
+                )
+            except Exception as e:
+                print(f"[Browser] Folder listing cache unavailable: {e}")
         
         # Get metadata manager for tag-based operations (needed by thumbnail generator)
         from .metadata import get_metadata_manager
@@ -450,7 +462,8 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         )
         
         # Connect thumbnail generator signals
-        self.thumbnail_generator.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_generator.thumbnails_ready.connect(self.on_thumbnails_ready)
+        self.thumbnail_generator.cached_thumbnails_ready.connect(self.on_cached_thumbnails_ready)
         self.thumbnail_generator.progress_update.connect(self.on_thumbnail_progress)
         self.thumbnail_generator.generation_failed.connect(self.on_thumbnail_failed)
         
@@ -475,16 +488,9 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Quick View window (macOS Quick Look style)
         self.quick_view_window = None
         
-        # File system watcher for automatic refresh
-        if PYSIDE_VERSION == 6:
-            from PySide6.QtCore import QFileSystemWatcher
-        else:
-            from PySide2.QtCore import QFileSystemWatcher
-        self.file_watcher = QFileSystemWatcher()
-        self.file_watcher.directoryChanged.connect(self.on_directory_changed)
-        
-        # Debounce timer flag (simpler approach without QTimer object)
-        self._watcher_pending_refresh = False
+        # File system watcher for automatic refresh (current folder, subfolder tree or collection folders)
+        self.file_watcher = DirectoryChangeTracker(self)
+        self.file_watcher.directoriesChanged.connect(self.on_directories_changed)
         
         # Start thumbnail generator thread
         self.thumbnail_generator.start()
@@ -1072,6 +1078,7 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         
         # File list with custom delegate - Use MayaStyleListView
         self.file_model = FileSystemModel()
+        self.file_model.set_listing_cache(self.listing_cache)
         self.file_list = MayaStyleListView()
         self.file_list.setModel(self.file_model)
         self.file_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
@@ -1304,6 +1311,13 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         
         # Model change connections - trigger thumbnail loading when filters change
         self.file_model.modelReset.connect(self.on_model_reset)
+        self.file_model.rowsInserted.connect(self.on_rows_inserted)
+        self.file_model.scanFinished.connect(self.on_scan_finished)
+        self.file_model.assetsChanged.connect(self.on_assets_changed)
+        self.file_model.sequenceSizeReady.connect(self.preview_panel.update_sequence_size)
+        for listing_signal in (self.file_model.modelReset, self.file_model.rowsInserted,
+                               self.file_model.rowsRemoved, self.file_model.layoutChanged):
+            listing_signal.connect(self.on_listing_changed)
         
         # Progress connections
         self.file_model.searchProgress.connect(self.on_search_progress)
@@ -1330,6 +1344,7 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         search_subfolders = self.settings_manager.get("filters", "search_in_subfolders", False)
         self.file_model.case_sensitive_search = case_sensitive
         self.file_model.regex_search = regex_enabled
+        self.file_model.term_search = self.settings_manager.get("filters", "term_search", False)
         self.file_model.search_in_subfolders = search_subfolders
         self.search_bar.set_case_sensitive(case_sensitive)
         self.search_bar.set_regex_enabled(regex_enabled)
@@ -1456,18 +1471,10 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         self.load_more_btn.setVisible(False)
         # Clear the limit flag
         self._limit_reached_shown = False
-        # Load more files
+        # Load more files - streamed in the background, on_scan_finished reports the result
+        # (and shows the button again if the new limit is reached too)
         self.file_model.load_more(increment=10000)
-        
-        # Check if limit was reached again after loading
-        if self.file_model.limit_reached:
-            self.load_more_btn.setVisible(True)
-            self._limit_reached_shown = True
-            file_count = len(self.file_model.assets)
-            self.safe_show_status(f"⚠️ Limit reached: {file_count} files loaded. Click 'Load More' to continue.")
-        else:
-            file_count = len(self.file_model.assets)
-            self.safe_show_status(f"✓ Loaded {file_count} files from subfolders")
+        self.safe_show_status("⏳ Loading more files...")
     
     def on_search_options_changed(self):
         """Handle search option (case/regex/subfolders) toggle"""
@@ -1559,30 +1566,10 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         
         # Refresh the file list with force=True to bypass cache
         # (cache doesn't track include_subfolders state)
+        # Files stream in from a scanner thread - on_scan_finished() reports the final count
         self.file_model.beginResetModel()
         self.file_model.refresh(force=True)
         self.file_model.endResetModel()
-        
-        # Clear loading flag so thumbnail progress can resume
-        self._loading_in_progress = False
-        
-        # Check if limit was reached and show button
-        if self.file_model.limit_reached:
-            self.load_more_btn.setVisible(True)
-            self._limit_reached_shown = True
-        
-        # Update status bar with file count
-        file_count = len(self.file_model.assets)
-        if include_subfolders:
-            if self.file_model.limit_reached:
-                self.safe_show_status(f"⚠️ Limit reached: {file_count} files loaded. Click 'Load More' to continue.")
-            else:
-                self.safe_show_status(f"✓ Loaded {file_count} files from subfolders")
-        else:
-            self.safe_show_status(f"✓ Loaded {file_count} files")
-        
-        # Request thumbnails for visible items
-        QTimer.singleShot(100, self.request_thumbnails_for_visible_items)
     
     def navigate_to_path(self, path):
         """Navigate to specified path"""
@@ -1609,9 +1596,6 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Update UI to reflect cleared filters
         self.update_filter_visual_feedback()
         
-        # Update file watcher to monitor new directory
-        self._update_file_watcher(path)
-        
         # Add to history if not navigating through history
         if not self.is_navigating_history:
             # Remove forward history if we navigate from middle of history
@@ -1627,6 +1611,9 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         self.file_model.setPath(path)
         self.breadcrumb.set_path(path)
         
+        # Update file watcher to monitor new directory
+        self._update_file_watcher()
+        
         # CLEAR thumbnail generator queue when navigating to new folder
         # This prevents generating thumbnails for old folder after navigation
         if hasattr(self, 'thumbnail_generator'):
@@ -2613,6 +2600,62 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Small delay to let the view update, then request thumbnails
         QtCore.QTimer.singleShot(10, self.request_thumbnails_for_visible_items)
     
+    def on_listing_changed(self, *args):
+        """Listed assets changed (reset, rows added/removed, filter or sort) - rebuild the background tier"""
+        self._background_listing_stale = True
+    
+    def on_rows_inserted(self, parent, first, last):
+        """Handle a batch streamed in by the folder scanner - request thumbnails once it settles"""
+        if hasattr(self, '_rows_inserted_timer') and self._rows_inserted_timer.isActive():
+            return
+        
+        self._rows_inserted_timer = QTimer()
+        self._rows_inserted_timer.setSingleShot(True)
+        self._rows_inserted_timer.timeout.connect(self.request_thumbnails_for_visible_items)
+        self._rows_inserted_timer.start(100)
+    
+    def on_scan_finished(self):
+        """Handle background folder scan completion - final counts, Load More, thumbnails"""
+        # Clear loading flag so thumbnail progress can resume
+        self._loading_in_progress = False
+        
+        # Check if limit was reached and show button
+        file_count = len(self.file_model.assets)
+        if self.file_model.limit_reached:
+            self.load_more_btn.setVisible(True)
+            self._limit_reached_shown = True
+            self.safe_show_status(f"⚠️ Limit reached: {file_count} files loaded. Click 'Load More' to continue.")
+        elif self.file_model.include_subfolders:
+            self.safe_show_status(f"✓ Loaded {file_count} files from subfolders")
+        
+        if self.search_bar.get_text():
+            self.update_search_match_count()
+        
+        self.request_thumbnails_for_visible_items()
+        
+        # Subfolder listings are tracked folder by folder once their tree is known
+        self._update_file_watcher()
+        
+        callbacks, self._after_scan_callbacks = getattr(self, '_after_scan_callbacks', []), []
+        for callback in callbacks:
+            callback()
+    
+    def on_assets_changed(self, cache_keys):
+        """Files changed on disk (watcher update) - drop their thumbnails so they are generated again"""
+        for cache_key in cache_keys:
+            self.memory_cache.remove(cache_key)
+        self.thumbnail_delegate.invalidate_thumbnails(cache_keys)
+        self.request_thumbnails_for_visible_items()
+    
+    def call_after_scan(self, callback):
+        """Run callback once the current folder listing is complete (right away if it is)"""
+        if self.file_model.is_scanning():
+            if not hasattr(self, '_after_scan_callbacks'):
+                self._after_scan_callbacks = []
+            self._after_scan_callbacks.append(callback)
+        else:
+            QTimer.singleShot(0, callback)
+    
     def on_scroll_changed(self, value):
         """Handle scroll - load thumbnails for newly visible items"""
         # Request thumbnails immediately for instant feedback
@@ -2643,10 +2686,7 @@ class DDContentBrowser(QtWidgets.QMainWindow):
             # Hide panel
             self.preview_panel.setVisible(False)
             
-            # Clear thumbnail queue and refresh for currently visible items
-            # This stops generating thumbnails for items that scrolled out of view
-            if hasattr(self, 'thumbnail_generator'):
-                self.thumbnail_generator.clear_queue()
+            # Reprioritize thumbnails for the items visible after the resize
             QTimer.singleShot(100, self.request_thumbnails_for_visible_items)
         else:
             # Show panel and restore last sizes
@@ -2656,10 +2696,7 @@ class DDContentBrowser(QtWidgets.QMainWindow):
             assets = self.get_selected_assets()
             self.preview_panel.update_preview(assets)
             
-            # Clear thumbnail queue and refresh for currently visible items
-            # This stops generating thumbnails for items that scrolled out of view
-            if hasattr(self, 'thumbnail_generator'):
-                self.thumbnail_generator.clear_queue()
+            # Reprioritize thumbnails for the items visible after the resize
             QTimer.singleShot(100, self.request_thumbnails_for_visible_items)
             
             # Restore previous sizes if available
@@ -2960,21 +2997,30 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         self.update_filter_visual_feedback()
         self.safe_show_status("All filters cleared")
     
-    def on_thumbnail_ready(self, file_path, pixmap):
-        """Handle thumbnail ready from generator"""
-        # Use fast O(1) lookup instead of looping through all rows
+    def on_thumbnails_ready(self, batch):
+        """Handle a frame's batch of finished thumbnails (already in memory cache)"""
+        self._refresh_thumbnail_rows(file_path for file_path, pixmap in batch)
+    
+    def on_cached_thumbnails_ready(self, hits):
+        """Apply a batch of disk cache hits (decoded in workers) with one model update"""
+        for file_path, cache_key, image in hits:
+            # QPixmap must be created in the GUI thread
+            self.memory_cache.set(cache_key, QtGui.QPixmap.fromImage(image))
+        
+        self.cache_hits += len(hits)
+        self._refresh_thumbnail_rows(file_path for file_path, cache_key, image in hits)
+    
+    def _refresh_thumbnail_rows(self, file_paths):
+        """Repaint rows whose thumbnails changed - one dataChanged and one viewport update"""
         model = self.file_list.model()
-        if model:
-            row = model.get_row_for_path(file_path)
-            if row is not None:
-                index = model.index(row, 0)
-                # Update the model data with the new thumbnail
-                model.setData(index, pixmap, Qt.DecorationRole)
-                # Force the view to repaint this specific item
-                self.file_list.update(index)
-        
-        # Also update viewport for good measure
-        self.file_list.viewport().update()
+        if not model:
+            return
+        
+        # Use fast O(1) lookup instead of looping through all rows
+        rows = [row for row in map(model.get_row_for_path, file_paths) if row is not None]
+        if rows:
+            model.dataChanged.emit(model.index(min(rows), 0), model.index(max(rows), 0), [Qt.DecorationRole])
+            self.file_list.viewport().update()
     
     def on_cache_status(self, status):
         """Handle cache status updates"""
@@ -3020,45 +3066,68 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         if not model:
             return
         
-        # OPTIMIZATION: Get viewport rectangle once
-        viewport_rect = self.file_list.viewport().rect()
-        
         # OPTIMIZATION: Early exit if no rows
         row_count = model.rowCount()
         if row_count == 0:
             return
         
-        # Collect visible items that need thumbnails
-        visible_items = []
-        
-        # Find visible items by checking which items intersect with viewport
-        # More reliable than indexAt() which doesn't work well in all cases
-        start_row = None
-        end_row = None
+        # Find visible rows from viewport probes - cost scales with visible items, not row count
+        start_row, end_row = self.file_list.visible_row_range()
         
-        for row in range(row_count):
-            index = model.index(row, 0)
-            rect = self.file_list.visualRect(index)
-            
-            # Check if this item is visible
-            if rect.isValid() and viewport_rect.intersects(rect):
-                if start_row is None:
-                    start_row = row
-                end_row = row
-        
-        # If we found visible items, add buffer
-        if start_row is not None and end_row is not None:
-            start_row = max(0, start_row - 5)
-            end_row = min(row_count - 1, end_row + 10)
-        else:
+        if start_row is None or end_row is None:
             # No visible items found - load first batch as fallback
             start_row = 0
             end_row = min(row_count - 1, 50)
         
-        # Only loop through visible rows (huge performance gain!)
-        for row in range(start_row, end_row + 1):
-            index = model.index(row, 0)
-            asset = model.data(index, Qt.UserRole)
+        # Prefetch one screen in the scroll direction (both halves if direction is unknown)
+        page = end_row - start_row + 1
+        last_start_row = getattr(self, '_last_visible_start_row', None)
+        self._last_visible_start_row = start_row
+        if last_start_row is None or last_start_row == start_row:
+            prefetch_rows = list(range(end_row + 1, end_row + 1 + page // 2)) + \
+                            list(range(start_row - 1, start_row - 1 - page // 2, -1))
+        elif start_row > last_start_row:
+            prefetch_rows = range(end_row + 1, end_row + 1 + page)   # Scrolling down
+        else:
+            prefetch_rows = range(start_row - 1, start_row - 1 - page, -1)  # Scrolling up
+        
+        visible_items = self._collect_thumbnail_items(model, range(start_row, end_row + 1))
+        prefetch_items = self._collect_thumbnail_items(
+            model, [row for row in prefetch_rows if 0 <= row < row_count]
+        )
+        
+        # List mode shows size / date - stat the rows scrolled towards before they are painted
+        if not self.thumbnail_delegate.icon_mode and hasattr(model, 'request_stats'):
+            model.request_stats(prefetch_rows, prefetch=True)
+        
+        # Reprioritize: what was visible before moves to the background tier, nothing is discarded
+        if visible_items or prefetch_items:
+            # Disk hits come back as one cached_thumbnails_ready batch, misses are queued for generation
+            self.thumbnail_generator.request_cached(visible_items, prefetch_items)
+        
+        # Idle fill: rest of the folder warms the disk cache while nothing else is pending
+        if self.settings_manager.get("thumbnails", "background_generation", True):
+            # Rebuilt only when the listing changed - scrolling reuses it; a streaming scan
+            # gets it once complete (on_scan_finished requests thumbnails again)
+            stale = getattr(self, '_background_listing_stale', True)
+            if (stale or not self.thumbnail_generator.background_scheduled) and not self.file_model.is_scanning():
+                self._background_listing_stale = False
+                self.thumbnail_generator.set_background([
+                    (asset.path_str, asset) for asset in model.assets
+                    if asset.should_generate_thumbnail and not asset.is_sequence
+                ])
+        elif self.thumbnail_generator.background_scheduled:
+            self.thumbnail_generator.clear_background()
+    
+    def _collect_thumbnail_items(self, model, rows):
+        """
+        Get (file_path, cache_key, asset) for rows that need a thumbnail and are not in memory cache.
+        UI thread only checks the memory cache - stat, disk cache read and JPEG decode
+        happen in the worker pool (see ThumbnailGenerator.request_cached).
+        """
+        items = []
+        for row in rows:
+            asset = model.data(model.index(row, 0), Qt.UserRole)
             
             if asset and asset.should_generate_thumbnail:
                 file_path_str = str(asset.file_path)
@@ -3068,34 +3137,9 @@ class DDContentBrowser(QtWidgets.QMainWindow):
                 if asset.is_sequence and asset.sequence:
                     cache_key = str(asset.sequence.pattern)
                 
-                # OPTIMIZATION: Skip disk refresh check during scroll (too slow!)
-                # Only check memory cache - disk cache check happens on folder navigation
                 if self.memory_cache.get(cache_key) is None:
-                    # Not in memory cache - try to load from disk first
-                    cached_from_disk = self.disk_cache.get(file_path_str, asset.modified_time)
-                    if cached_from_disk:
-                        self.memory_cache.set(cache_key, cached_from_disk)
-                        # Update display immediately with cached thumbnail
-                        model.setData(index, cached_from_disk, Qt.DecorationRole)
-                        # Signal change (batch emit is more efficient)
-                        model.dataChanged.emit(index, index, [Qt.DecorationRole])
-                    else:
-                        # Not in disk cache either - need to generate
-                        visible_items.append((file_path_str, asset.modified_time, asset))
-        
-        # CLEAR the queue and add ONLY visible items with PRIORITY
-        # This ensures we prioritize what user is currently viewing
-        if visible_items:
-            # Clear old queue (non-visible items) and reset counters
-            self.thumbnail_generator.clear_queue()
-            
-            # Add visible items to queue in REVERSE order so they process top-to-bottom
-            # (since we pop() from the end, last added = first processed)
-            for file_path, modified_time, asset in reversed(visible_items):
-                self.thumbnail_generator.add_to_queue(file_path, modified_time, priority=True, asset=asset)
-        
-        # Background loading DISABLED during scroll for performance
-        # (preload_all_thumbnails feature removed from scroll event)
+                    items.append((file_path_str, cache_key, asset))
+        return items
     
     def on_splitter_moved(self, pos, index):
         """Handle splitter movement - optimized for fast updates"""
@@ -3295,6 +3339,17 @@ class DDContentBrowser(QtWidgets.QMainWindow):
             if DEBUG_MODE:
                 print(f"[Browser] Updated memory cache size to {memory_cache_size}")
         
+        # Apply folder listing cache limits
+        if getattr(self, 'listing_cache', None) is not None:
+            self.listing_cache.set_limits(
+                max_size_mb=self.settings_manager.get("general", "listing_cache_size_mb", 50),
+                ttl_days=self.settings_manager.get("general", "listing_cache_ttl_days", 30)
+            )
+            if not self.settings_manager.get("general", "listing_cache_enabled", True):
+                self.file_model.set_listing_cache(None)
+                self.listing_cache.close()
+                self.listing_cache = None
+        
         # Rebuild filter panel with updated file formats
         if hasattr(self, 'filter_panel'):
             self.filter_panel.rebuild_type_filters()
@@ -3329,7 +3384,7 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Those are managed by set_view_mode() and update_thumbnail_size()
         
         # Apply recursive file limits from settings
-        max_recursive = self.settings_manager.get("filters", "max_recursive_files", 10000)
+        max_recursive = self.settings_manager.get("filters", "max_recursive_files", 0)
         max_search = self.settings_manager.get("filters", "max_search_files", 100000)
         if hasattr(self, 'file_model'):
             self.file_model.max_recursive_files = max_recursive
@@ -3340,12 +3395,14 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         # Apply search/filter settings to file model
         case_sensitive = self.settings_manager.get("filters", "case_sensitive_search", False)
         regex_enabled = self.settings_manager.get("filters", "regex_search", False)
+        term_search = self.settings_manager.get("filters", "term_search", False)
         custom_extensions = self.settings_manager.get("filters", "custom_extensions", [])
-        max_recursive_files = self.settings_manager.get("filters", "max_recursive_files", 10000)
+        max_recursive_files = self.settings_manager.get("filters", "max_recursive_files", 0)
         
         if hasattr(self, 'file_model'):
             self.file_model.case_sensitive_search = case_sensitive
             self.file_model.regex_search = regex_enabled
+            self.file_model.term_search = term_search
             self.file_model.max_recursive_files = max_recursive_files
             
             # Apply custom extensions (check if method exists - for compatibility)
@@ -3429,13 +3486,9 @@ class DDContentBrowser(QtWidgets.QMainWindow):
                 if hasattr(self, 'memory_cache'):
                     self.memory_cache.clear()
                 
-                # Clear disk cache
+                # Clear disk cache (thumbnails + index, keeps the size ledger in sync)
                 if hasattr(self, 'disk_cache'):
-                    cache_dir = Path.home() / ".ddContentBrowser" / "cache"
-                    if cache_dir.exists():
-                        import shutil
-                        shutil.rmtree(cache_dir)
-                        cache_dir.mkdir(parents=True, exist_ok=True)
+                    self.disk_cache.clear()
                 
                 QtWidgets.QMessageBox.information(self, "Success", "Thumbnail cache cleared successfully!")
                 self.safe_show_status("Cache cleared", 3000)
@@ -3650,10 +3703,19 @@ class DDContentBrowser(QtWidgets.QMainWindow):
         if hasattr(self, 'preview_panel') and self.preview_panel:
             self.preview_panel.cleanup()
         
+        # Stop folder scanning threads (a running QThread must not be destroyed)
+        if hasattr(self, 'file_model'):
+            self.file_model.stop_scanning()
+        if hasattr(self, 'file_watcher'):
+            self.file_watcher.clear()
+        if getattr(self, 'listing_cache', None) is not None:
+            self.listing_cache.close()
+        
         # Disconnect thumbnail generator signals BEFORE stopping (prevents RuntimeError)
         if hasattr(self, 'thumbnail_generator'):
             try:
-                self.thumbnail_generator.thumbnail_ready.disconnect()
+                self.thumbnail_generator.thumbnails_ready.disconnect()
+                self.thumbnail_generator.cached_thumbnails_ready.disconnect()
                 self.thumbnail_generator.progress_update.disconnect()
                 self.thumbnail_generator.generation_failed.disconnect()
                 if hasattr(self.thumbnail_generator, 'cache_status'):
@@ -4117,8 +4179,8 @@ class DDContentBrowser(QtWidgets.QMainWindow):
             
             self.safe_show_status(f"File shown in directory: {file_path.name}")
         
-        # Delay selection to ensure view is updated
-        QTimer.singleShot(300, select_file)
+        # Select once the folder listing is complete
+        self.call_after_scan(select_file)
     
     def regenerate_selected_thumbnails(self):
         """Regenerate thumbnails for selected files by clearing their cache entries"""
@@ -4471,10 +4533,8 @@ Type: {'Folder' if asset.is_folder else asset.extension.upper()[1:] + ' File'}
             # Update breadcrumb to show collection name (not path)
             self.breadcrumb.set_collection_mode(collection_name)
             
-            # Stop watching directory in collection mode
-            watched_dirs = self.file_watcher.directories()
-            if watched_dirs:
-                self.file_watcher.removePaths(watched_dirs)
+            # Watch the folders of the collection items instead of the current directory
+            self._update_file_watcher()
             
             # Update status
             self.safe_show_status(f"📁 Collection: {collection_name} ({len(collection_files)} items)")
@@ -4516,8 +4576,7 @@ Type: {'Folder' if asset.is_folder else asset.extension.upper()[1:] + ' File'}
         self.collections_panel.clear_btn.setVisible(False)
         
         # Resume watching current directory
-        if self.breadcrumb.current_path:
-            self._update_file_watcher(Path(self.breadcrumb.current_path))
+        self._update_file_watcher()
         
         # Update navigation buttons (may disable back button if no history)
         self.update_navigation_buttons()
@@ -4638,55 +4697,21 @@ Type: {'Folder' if asset.is_folder else asset.extension.upper()[1:] + ' File'}
     
     # ========== File System Watcher Methods ==========
     
-    def _update_file_watcher(self, path):
-        """Update file system watcher to monitor new directory"""
-        # Remove all previously watched directories
-        watched_dirs = self.file_watcher.directories()
-        if watched_dirs:
-            self.file_watcher.removePaths(watched_dirs)
-        
-        # Add new directory to watch (only in normal browse mode)
-        if path and not self.file_model.collection_mode:
-            path_str = str(path)
-            self.file_watcher.addPath(path_str)
+    def _update_file_watcher(self):
+        """Track the folders the current view is built from (current folder, subfolder tree or collection)"""
+        self.file_watcher.set_directories(self.file_model.watch_directories())
     
-    def on_directory_changed(self, path):
-        """Handle directory change event from file system watcher"""
+    def on_directories_changed(self, dirs):
+        """Handle changed folders reported by the file watcher (already debounced)"""
         try:
-            # Ignore if in collection mode or search mode
-            if self.file_model.collection_mode:
-                return
-            if hasattr(self, 'include_subfolders_checkbox') and self.include_subfolders_checkbox.isChecked():
-                return
-            if hasattr(self, 'search_input') and self.search_input.text().strip():
-                return
-            
-            # Debounce: only schedule refresh if not already pending
-            if not self._watcher_pending_refresh:
-                self._watcher_pending_refresh = True
-                QTimer.singleShot(300, self._refresh_from_watcher)
+            # Rescan only the changed folders in the background and apply the differences - selection,
+            # scroll position, thumbnails and the thumbnail queue stay (scanFinished requests new thumbnails)
+            self.file_model.update_directories(dirs)
             
+            # Update status
+            self.safe_show_status("📂 Directory updated automatically")
+        
         except Exception as e:
             import traceback
             print(f"[FileWatcher] ERROR: {e}")
-            traceback.print_exc()
-    
-    def _refresh_from_watcher(self):
-        """Refresh directory view after file system change detected"""
-        # Reset pending flag
-        self._watcher_pending_refresh = False
-        
-        # Clear thumbnail generator queue
-        if hasattr(self, 'thumbnail_generator'):
-            self.thumbnail_generator.clear_queue()
-        
-        # Refresh file model with proper reset signals (force=True to bypass cache)
-        self.file_model.beginResetModel()
-        self.file_model.refresh(force=True)
-        self.file_model.endResetModel()
-        
-        # Update status
-        self.safe_show_status("📂 Directory updated automatically")
-        
-        # Request thumbnails for visible items
-        QTimer.singleShot(100, self.request_thumbnails_for_visible_items)
\ No newline at end of file
+            traceback.print_exc()
\ No newline at end of file
@@ -14,6 +14,7 @@ License: MIT
 __all__ = [
     'ThumbnailCache',
     'ThumbnailDiskCache', 
+    'DirectoryListingCache',
     'ThumbnailGenerator',
     'apply_exif_orientation'
 ]
@@ -29,8 +30,15 @@ import sys
 import time
 import hashlib
 import json
-from concurrent.futures import ThreadPoolExecutor, Future
+import sqlite3
+import mmap
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, CancelledError
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from queue import Queue
+from collections import deque
 import threading
 
 # IMPORTANT: Disable ffmpeg report file generation BEFORE any imageio_ffmpeg import
@@ -100,12 +108,12 @@ except Exception as e:
 try:
     from PySide6.QtCore import QThread, Signal, Qt
     from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QFont, QLinearGradient, QBrush, QTransform
-    from PySide6.QtCore import QRect
+    from PySide6.QtCore import QRect, QByteArray, QBuffer, QIODevice
     PYSIDE_VERSION = 6
 except ImportError:
     from PySide2.QtCore import QThread, Signal, Qt
     from PySide2.QtGui import QPixmap, QPainter, QColor, QPen, QFont, QLinearGradient, QBrush, QTransform
-    from PySide2.QtCore import QRect
+    from PySide2.QtCore import QRect, QByteArray, QBuffer, QIODevice
     PYSIDE_VERSION = 2
 
 
@@ -234,16 +242,175 @@ class ThumbnailCache:
                 del self.access_times[file_path]
 
 
+class ThumbnailPackStore:
+    """
+    Append-only pack files for the disk cache (optional storage backend)
+    
+    Thumbnails are appended to packs/pack_NNNN.dat and addressed by
+    (pack_id, offset, size) rows in the disk cache index. Reads go through one
+    memory map per pack, so a page of thumbnails costs a handful of syscalls
+    instead of an open() per file. Not thread-safe on its own - the owning
+    ThumbnailDiskCache serializes access with its lock. Maps returned by
+    map_range() may be sliced outside that lock; slicing a map that was closed
+    meanwhile (remap, compaction) raises ValueError.
+    """
+    
+    PACK_MAX_BYTES = 64 * 1024 * 1024  # Start a new pack above 64 MB
+    
+    def __init__(self, pack_dir):
+        self.pack_dir = Path(pack_dir)
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._maps = {}        # pack_id -> (file object, mmap)
+        self._pack_sizes = {}  # pack_id -> bytes on disk
+        self._writer = None    # Open append handle of the current pack
+        
+        for entry in os.scandir(self.pack_dir):
+            match = re.match(r'^pack_(\d+)\.dat$', entry.name)
+            if match:
+                self._pack_sizes[int(match.group(1))] = entry.stat().st_size
+        
+        self._current_id = max(self._pack_sizes) if self._pack_sizes else 1
+    
+    def pack_path(self, pack_id):
+        """Get path of a pack file"""
+        return self.pack_dir / f"pack_{pack_id:04d}.dat"
+    
+    def pack_sizes(self):
+        """Get {pack_id: bytes on disk} for all packs"""
+        return dict(self._pack_sizes)
+    
+    @property
+    def current_pack_id(self):
+        """Pack that receives new appends"""
+        return self._current_id
+    
+    def append(self, payload):
+        """
+        Append thumbnail bytes to the current pack
+        
+        Returns:
+            tuple: (pack_id, offset)
+        """
+        current_size = self._pack_sizes.get(self._current_id, 0)
+        if current_size and current_size + len(payload) > self.PACK_MAX_BYTES:
+            self.rotate()
+        
+        if self._writer is None:
+            self._writer = open(self.pack_path(self._current_id), 'ab')
+            self._writer.seek(0, os.SEEK_END)
+        
+        offset = self._writer.tell()
+        self._writer.write(payload)
+        self._writer.flush()  # Make bytes visible to readers mapping this pack
+        self._pack_sizes[self._current_id] = offset + len(payload)
+        return self._current_id, offset
+    
+    def rotate(self):
+        """Close the current pack and direct new appends to a fresh one"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._current_id = max(list(self._pack_sizes) + [self._current_id]) + 1
+    
+    def read(self, pack_id, offset, size):
+        """Read thumbnail bytes from a pack (None if the range is not available)"""
+        mapped = self.map_range(pack_id, offset, size)
+        if mapped is None:
+            return None
+        return mapped[offset:offset + size]
+    
+    def map_range(self, pack_id, offset, size):
+        """Get the memory map of a pack covering offset + size (None if not available)"""
+        return self._map(pack_id, offset + size)
+    
+    def _map(self, pack_id, min_length):
+        """Get a memory map of a pack covering at least min_length bytes"""
+        entry = self._maps.get(pack_id)
+        if entry is not None:
+            if len(entry[1]) >= min_length:
+                return entry[1]
+            # Pack grew since it was mapped - remap
+            self._unmap(pack_id)
+        
+        try:
+            pack_file = open(self.pack_path(pack_id), 'rb')
+        except OSError:
+            return None
+        
+        length = os.fstat(pack_file.fileno()).st_size
+        if length < min_length:
+            pack_file.close()
+            return None
+        
+        mapped = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[pack_id] = (pack_file, mapped)
+        return mapped
+    
+    def _unmap(self, pack_id):
+        """Close the memory map of a pack"""
+        entry = self._maps.pop(pack_id, None)
+        if entry is not None:
+            pack_file, mapped = entry
+            mapped.close()
+            pack_file.close()
+    
+    def remove_pack(self, pack_id):
+        """Delete a pack file (its index rows must already point elsewhere)"""
+        self._unmap(pack_id)
+        if pack_id == self._current_id:
+            self.rotate()
+        self._pack_sizes.pop(pack_id, None)
+        try:
+            self.pack_path(pack_id).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def close(self):
+        """Close all maps and the append handle"""
+        for pack_id in list(self._maps):
+            self._unmap(pack_id)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+    
+    def clear(self):
+        """Delete all packs"""
+        self.close()
+        for pack_id in list(self._pack_sizes):
+            self.remove_pack(pack_id)
+        self._current_id = 1
+
+
 class ThumbnailDiskCache:
-    """Persistent disk-based thumbnail cache"""
+    """
+    Persistent disk-based thumbnail cache
     
-    def __init__(self, cache_dir=None, max_size_mb=500):
+    Layout:
+    - Thumbnails are JPEGs in sharded subdirectories (first 2 hex chars of the key),
+      so no single directory grows beyond a few hundred files
+    - index.db (SQLite) tracks key, source path, size and last access of every entry
+    - file_path is indexed as well (reverse index source path -> cache keys), so stale
+      thumbnails of an edited file are dropped as soon as its new thumbnail is written
+    - An in-memory size ledger mirrors SUM(size) of the index, so size checks
+      and LRU eviction never glob or stat the cache directory
+    - Optional packed storage (packed=True): thumbnails are appended to a few large
+      pack files read through mmap (ThumbnailPackStore) instead of one JPEG per entry
+    """
+    
+    SHARD_LENGTH = 2            # Hex chars of the cache key used as subdirectory name
+    ACCESS_FLUSH_INTERVAL = 5.0 # Seconds between batched last_access writes to the index
+    COMPACT_DEAD_RATIO = 0.25   # Rewrite a pack once this fraction of it is evicted data
+    
+    def __init__(self, cache_dir=None, max_size_mb=500, packed=False):
         """
         Initialize disk cache.
         
         Args:
             cache_dir: Directory to store thumbnails (default: %LOCALAPPDATA%/ddContentBrowser/thumbnails)
             max_size_mb: Maximum cache size in megabytes (default: 500 MB)
+            packed: Store new thumbnails in pack files instead of one JPEG per entry.
+                    Existing per-file thumbnails are migrated in the background.
         """
         if cache_dir is None:
             # Use AppData/Local on Windows, ~/.local/share on Linux/Mac
@@ -264,9 +431,107 @@ class ThumbnailDiskCache:
             'generated': 0
         }
         
+        # Index state (guarded by _lock - set() is called from worker threads)
+        self._lock = threading.RLock()
+        self._total_bytes = 0        # Size ledger: SUM(size) of all indexed entries
+        self._entry_count = 0
+        self._pending_access = {}    # cache_key -> last access time (flushed in batches)
+        self._last_flush = time.time()
+        self._known_shards = set()   # Shard directories already created this session
+        
         # Load or create cache info
         self.info_file = self.cache_dir / "cache_info.json"
         self.load_info()
+        
+        # Open index and adopt thumbnails from the old flat layout
+        self.index_file = self.cache_dir / "index.db"
+        self._init_index()
+        self._migrate_flat_layout()
+        
+        # Pack store - also opened when packing is off but packs exist, so packed entries stay readable
+        self.packed = packed
+        self.pack_store = None
+        pack_dir = self.cache_dir / "packs"
+        if packed or pack_dir.exists():
+            self.pack_store = ThumbnailPackStore(pack_dir)
+        
+        if packed:
+            threading.Thread(target=self.migrate_to_packed, name="ThumbPackMigration", daemon=True).start()
+    
+    def _init_index(self):
+        """Open the SQLite index and load the size ledger"""
+        # Shared between the generator thread and worker threads (serialized by _lock)
+        self.conn = sqlite3.connect(str(self.index_file), check_same_thread=False)
+        cursor = self.conn.cursor()
+        
+        # WAL + NORMAL: commits don't fsync, a crash loses at most the last few entries
+        try:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.Error:
+            pass
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                cache_key TEXT PRIMARY KEY,
+                file_path TEXT,
+                file_mtime REAL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                pack_id INTEGER,
+                pack_offset INTEGER
+            )
+        ''')
+        
+        # Indexes created before packed storage existed lack the pack columns (NULL = loose file)
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(entries)')}
+        for column in ('pack_id', 'pack_offset'):
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE entries ADD COLUMN {column} INTEGER')
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_entries_path ON entries(file_path)')
+        self.conn.commit()
+        
+        self._entry_count, self._total_bytes = cursor.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+        ).fetchone()
+    
+    def _migrate_flat_layout(self):
+        """Move thumbnails of the old flat layout into shards and index them (one-time)"""
+        try:
+            legacy = [entry for entry in os.scandir(self.cache_dir)
+                      if entry.name.endswith('.jpg') and entry.is_file()]
+        except OSError:
+            return
+        
+        if not legacy:
+            return
+        
+        rows = []
+        for entry in legacy:
+            cache_key = entry.name[:-4]
+            try:
+                stat_info = entry.stat()
+                target = self._shard_path(cache_key)
+                self._ensure_shard(target.parent)
+                os.replace(entry.path, target)
+                # Source path is unknown for legacy entries - only LRU eviction can remove them
+                rows.append((cache_key, None, None, stat_info.st_size, stat_info.st_atime))
+            except OSError as e:
+                print(f"[DiskCache] Could not migrate {entry.name}: {e}")
+        
+        with self._lock:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO entries (cache_key, file_path, file_mtime, size, last_access) '
+                'VALUES (?, ?, ?, ?, ?)', rows
+            )
+            self.conn.commit()
+            self._entry_count, self._total_bytes = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+            ).fetchone()
+        
+        print(f"[DiskCache] Migrated {len(rows)} thumbnails to sharded layout")
     
     def load_info(self):
         """Load cache information"""
@@ -299,10 +564,102 @@ class ThumbnailDiskCache:
         key_string = f"{file_path}_{file_mtime}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def _shard_path(self, cache_key):
+        """Get sharded path for a cache key (e.g. thumbnails/3f/3fa1...c2.jpg)"""
+        return self.cache_dir / cache_key[:self.SHARD_LENGTH] / f"{cache_key}.jpg"
+    
+    def _ensure_shard(self, shard_dir):
+        """Create shard directory once per session"""
+        if shard_dir not in self._known_shards:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._known_shards.add(shard_dir)
+    
     def get_thumbnail_path(self, file_path, file_mtime):
         """Get path to cached thumbnail file"""
         cache_key = self.get_cache_key(file_path, file_mtime)
-        return self.cache_dir / f"{cache_key}.jpg"
+        return self._shard_path(cache_key)
+    
+    def _has_entry(self, cache_key):
+        """Check the index for a cache key (no filesystem access). Caller holds _lock."""
+        row = self.conn.execute(
+            'SELECT 1 FROM entries WHERE cache_key = ?', (cache_key,)
+        ).fetchone()
+        return row is not None
+    
+    def contains(self, file_path, file_mtime):
+        """Check if a thumbnail is cached (index lookup only, no read)"""
+        cache_key = self.get_cache_key(file_path, file_mtime)
+        with self._lock:
+            return self._has_entry(cache_key)
+    
+    def _lookup(self, cache_keys):
+        """
+        Batched index lookup. Caller holds _lock.
+        
+        Returns:
+            dict: cache_key -> (size, pack_id, pack_offset)
+        """
+        rows = {}
+        cache_keys = list(cache_keys)
+        # Stay below SQLite's host parameter limit
+        for start in range(0, len(cache_keys), 500):
+            chunk = cache_keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for cache_key, size, pack_id, pack_offset in self.conn.execute(
+                f'SELECT cache_key, size, pack_id, pack_offset FROM entries WHERE cache_key IN ({placeholders})',
+                chunk
+            ):
+                rows[cache_key] = (size, pack_id, pack_offset)
+        return rows
+    
+    def _locate_entry(self, cache_key, row):
+        """
+        Resolve where the bytes of an indexed entry live, without reading them. Caller holds _lock.
+        
+        Returns:
+            (mmap, offset, size) for packed entries, the shard Path otherwise, None if the pack is gone
+        """
+        size, pack_id, pack_offset = row
+        if pack_id is not None:
+            if self.pack_store is None:
+                return None
+            mapped = self.pack_store.map_range(pack_id, pack_offset, size)
+            return None if mapped is None else (mapped, pack_offset, size)
+        return self._shard_path(cache_key)
+    
+    @staticmethod
+    def _read_location(location):
+        """Read the bytes at a _locate_entry() result - no lock needed (None if gone meanwhile)"""
+        if location is None:
+            return None
+        if isinstance(location, tuple):
+            mapped, offset, size = location
+            try:
+                return mapped[offset:offset + size]
+            except ValueError:
+                return None  # Map closed by a remap or compaction since the lookup
+        try:
+            with open(location, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _read_entry(self, cache_key, row):
+        """Read the JPEG bytes of an indexed entry (None if missing). Caller holds _lock."""
+        return self._read_location(self._locate_entry(cache_key, row))
+    
+    def flush(self):
+        """Write pending access times and stats to disk"""
+        with self._lock:
+            if self._pending_access:
+                self.conn.executemany(
+                    'UPDATE entries SET last_access = ? WHERE cache_key = ?',
+                    [(atime, key) for key, atime in self._pending_access.items()]
+                )
+                self._pending_access.clear()
+            self.conn.commit()
+            self._last_flush = time.time()
+            self.save_info()
     
     def get(self, file_path, file_mtime):
         """
@@ -315,20 +672,82 @@ class ThumbnailDiskCache:
         Returns:
             QPixmap if found, None otherwise
         """
-        # Check our own cache
-        thumb_path = self.get_thumbnail_path(file_path, file_mtime)
+        return self.get_many([(file_path, file_mtime)]).get(file_path)
+    
+    def read_many(self, items):
+        """
+        Read raw JPEG bytes for several thumbnails with one index query.
+        Packed entries are sliced from memory-mapped packs. Safe to call from worker threads:
+        only the index lookup runs under the lock, the reads happen outside it.
         
-        if thumb_path.exists():
-            try:
-                pixmap = QPixmap(str(thumb_path))
-                if not pixmap.isNull():
-                    self.stats['hits'] += 1
-                    return pixmap
-            except Exception as e:
-                print(f"Error loading thumbnail from {thumb_path}: {e}")
+        Args:
+            items: Iterable of (file_path, file_mtime)
         
-        self.stats['misses'] += 1
-        return None
+        Returns:
+            dict: file_path -> bytes (misses are omitted)
+        """
+        keys = {}
+        for file_path, file_mtime in items:
+            keys[self.get_cache_key(file_path, file_mtime)] = file_path
+        
+        with self._lock:
+            # Index lookup first - a miss costs no filesystem access at all
+            locations = {cache_key: self._locate_entry(cache_key, row)
+                         for cache_key, row in self._lookup(keys).items()}
+        
+        found = {}
+        failed = []
+        for cache_key, location in locations.items():
+            data = self._read_location(location)
+            if data:
+                found[keys[cache_key]] = data
+            else:
+                failed.append(cache_key)
+        
+        stale = []
+        with self._lock:
+            if failed:
+                # Rewritten or remapped since the lookup - retry with a fresh lookup under the lock
+                for cache_key, row in self._lookup(failed).items():
+                    data = self._read_entry(cache_key, row)
+                    if data:
+                        found[keys[cache_key]] = data
+            now = time.time()
+            for cache_key in locations:
+                if keys[cache_key] in found:
+                    self._pending_access[cache_key] = now
+                else:
+                    stale.append(cache_key)
+        
+        # Indexed but missing on disk - drop the stale entries
+        if stale:
+            self._remove_entries(stale)
+        
+        self.stats['hits'] += len(found)
+        self.stats['misses'] += len(keys) - len(found)
+        
+        if time.time() - self._last_flush > self.ACCESS_FLUSH_INTERVAL:
+            self.flush()
+        return found
+    
+    def get_many(self, items):
+        """
+        Get several thumbnails from disk cache (one index query, one map per pack)
+        
+        Args:
+            items: Iterable of (file_path, file_mtime)
+        
+        Returns:
+            dict: file_path -> QPixmap (misses are omitted)
+        """
+        pixmaps = {}
+        for file_path, data in self.read_many(items).items():
+            pixmap = QPixmap()
+            if pixmap.loadFromData(data, "JPEG") and not pixmap.isNull():
+                pixmaps[file_path] = pixmap
+            else:
+                print(f"Error decoding cached thumbnail for {file_path}")
+        return pixmaps
     
     def set(self, file_path, file_mtime, pixmap, quality=85):
         """
@@ -340,40 +759,142 @@ class ThumbnailDiskCache:
             pixmap: QPixmap to save
             quality: JPEG quality (0-100)
         """
-        thumb_path = self.get_thumbnail_path(file_path, file_mtime)
+        cache_key = self.get_cache_key(file_path, file_mtime)
+        thumb_path = self._shard_path(cache_key)
         
         try:
-            # Ensure parent directory exists
-            thumb_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Convert QPixmap to QImage for thread-safe saving
             # QPixmap.save() is NOT thread-safe, but QImage.save() IS
             image = pixmap.toImage()
             
-            # Save as JPEG for smaller file size
-            success = image.save(str(thumb_path), "JPEG", quality)
+            # Encode to memory first - the byte count feeds the size ledger without a stat()
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.WriteOnly)
+            success = image.save(buffer, "JPEG", quality)
+            buffer.close()
             
-            if success:
+            if not success:
+                return False
+            
+            payload = bytes(data)
+            pack_id = pack_offset = None
+            if not self.packed:
+                self._ensure_shard(thumb_path.parent)
+                with open(thumb_path, 'wb') as f:
+                    f.write(payload)
+            
+            with self._lock:
+                if self.packed:
+                    pack_id, pack_offset = self.pack_store.append(payload)
+                self._index_entry(cache_key, str(file_path), file_mtime, len(payload), pack_id, pack_offset)
                 self.stats['generated'] += 1
-                self.save_info()
-                
-                # Check if we need to cleanup old cache
-                self._check_cache_size()
+                over_limit = self._total_bytes > self.max_size_mb * 1024 * 1024
+            
+            # New mtime written - thumbnails of previous versions are orphans now
+            self._cleanup_old_thumbnails_for_file(file_path, file_mtime)
+            
+            # Check if we need to cleanup old cache (ledger check - O(1))
+            if over_limit:
+                print(f"Cache size {self.get_cache_size():.1f}MB exceeds limit {self.max_size_mb}MB, cleaning up...")
+                self._cleanup_old_cache()
             
-            return success
+            return True
             
         except Exception as e:
             print(f"Error saving thumbnail to {thumb_path}: {e}")
             return False
     
+    def _index_entry(self, cache_key, file_path, file_mtime, size, pack_id=None, pack_offset=None):
+        """Insert or replace an index row and update the ledger. Caller holds _lock."""
+        previous = self.conn.execute(
+            'SELECT size, pack_id FROM entries WHERE cache_key = ?', (cache_key,)
+        ).fetchone()
+        
+        self.conn.execute(
+            'INSERT OR REPLACE INTO entries '
+            '(cache_key, file_path, file_mtime, size, last_access, pack_id, pack_offset) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (cache_key, file_path, file_mtime, size, time.time(), pack_id, pack_offset)
+        )
+        self._pending_access.pop(cache_key, None)
+        
+        if previous:
+            # Entry moved from a loose file into a pack - the file is garbage now
+            if previous[1] is None and pack_id is not None:
+                try:
+                    self._shard_path(cache_key).unlink()
+                except OSError:
+                    pass
+            self._total_bytes += size - previous[0]
+        else:
+            self._total_bytes += size
+            self._entry_count += 1
+        
+        if time.time() - self._last_flush > self.ACCESS_FLUSH_INTERVAL:
+            self.flush()
+    
+    def _remove_entries(self, cache_keys):
+        """
+        Delete thumbnails and their index rows, keeping the ledger in sync
+        
+        Returns:
+            int: Number of entries removed
+        """
+        if not cache_keys:
+            return 0
+        
+        removed = 0
+        with self._lock:
+            for cache_key in cache_keys:
+                row = self.conn.execute(
+                    'SELECT size, pack_id FROM entries WHERE cache_key = ?', (cache_key,)
+                ).fetchone()
+                if row is None:
+                    continue
+                
+                # Packed entries only lose their index row - compact() reclaims the bytes
+                if row[1] is None:
+                    try:
+                        self._shard_path(cache_key).unlink()
+                    except FileNotFoundError:
+                        pass
+                    except Exception as e:
+                        print(f"Error removing thumbnail {cache_key}: {e}")
+                        continue
+                
+                self.conn.execute('DELETE FROM entries WHERE cache_key = ?', (cache_key,))
+                self._pending_access.pop(cache_key, None)
+                self._total_bytes -= row[0]
+                self._entry_count -= 1
+                removed += 1
+            
+            self.conn.commit()
+        
+        return removed
+    
     def clear(self):
         """Clear all cached thumbnails"""
         try:
-            for thumb_file in self.cache_dir.glob("*.jpg"):
-                thumb_file.unlink()
+            import shutil
             
-            self.stats = {'hits': 0, 'misses': 0, 'generated': 0}
-            self.save_info()
+            with self._lock:
+                for entry in os.scandir(self.cache_dir):
+                    if entry.is_dir() and len(entry.name) == self.SHARD_LENGTH:
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                
+                if self.pack_store is not None:
+                    self.pack_store.clear()
+                
+                self.conn.execute('DELETE FROM entries')
+                self.conn.commit()
+                self._pending_access.clear()
+                self._known_shards.clear()
+                self._total_bytes = 0
+                self._entry_count = 0
+                
+                self.stats = {'hits': 0, 'misses': 0, 'generated': 0}
+                self.save_info()
             
             print(f"Cache cleared: {self.cache_dir}")
             
@@ -397,12 +918,12 @@ class ThumbnailDiskCache:
         try:
             file_path = Path(file_path)
             
-            # Check if thumbnail with CURRENT mtime exists
-            current_thumb_path = self.get_thumbnail_path(file_path, file_mtime)
-            
-            if current_thumb_path.exists():
-                # Cache is up-to-date
-                return False
+            # Check if thumbnail with CURRENT mtime exists (index lookup only)
+            cache_key = self.get_cache_key(file_path, file_mtime)
+            with self._lock:
+                if self._has_entry(cache_key):
+                    # Cache is up-to-date
+                    return False
             
             # Cache doesn't exist with current mtime - refresh needed
             # Also clean up any old cached versions (optional optimization)
@@ -424,21 +945,31 @@ class ThumbnailDiskCache:
             current_mtime: Current file modification timestamp
         """
         try:
-            # We need to find old cache entries for this file
-            # Since cache key = MD5(filepath + "_" + mtime), we can't directly search by filepath
-            # Instead, we'll use a metadata file approach or just skip cleanup
-            # (cleanup will happen naturally through LRU policy in _cleanup_old_cache)
+            # Cache key = MD5(filepath + "_" + mtime) can't be searched by path,
+            # so use the file_path reverse index instead
+            current_key = self.get_cache_key(file_path, current_mtime)
+            stale_keys = [key for key in self._get_keys_for_file(file_path) if key != current_key]
             
-            # For now, skip explicit cleanup - let LRU handle it
-            # Future optimization: maintain a filepath -> cache_keys mapping
-            pass
+            if stale_keys:
+                removed = self._remove_entries(stale_keys)
+                if DEBUG_MODE:
+                    print(f"[DiskCache] Removed {removed} outdated thumbnail(s) for {Path(file_path).name}")
             
         except Exception as e:
             print(f"Error cleaning up old thumbnails for {file_path}: {e}")
     
+    def _get_keys_for_file(self, file_path):
+        """Get all cache keys stored for a source file (any mtime)"""
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT cache_key FROM entries WHERE file_path = ?', (str(file_path),)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
     def clear_thumbnail(self, file_path):
         """
-        Clear cached thumbnail for a specific file
+        Clear all cached thumbnails for a specific file.
+        Works from the reverse index, so the source file doesn't need to exist anymore.
         
         Args:
             file_path: Path to the source file
@@ -448,17 +979,15 @@ class ThumbnailDiskCache:
         """
         try:
             file_path = Path(file_path)
-            if not file_path.exists():
-                return False
             
-            # Get file modification time
-            file_mtime = file_path.stat().st_mtime
+            cache_keys = self._get_keys_for_file(file_path)
             
-            # Get cache path
-            thumb_path = self.get_thumbnail_path(file_path, file_mtime)
+            # Entries indexed without a source path (migrated from the flat layout)
+            # can still be found through the current mtime
+            if not cache_keys and file_path.exists():
+                cache_keys = [self.get_cache_key(file_path, file_path.stat().st_mtime)]
             
-            if thumb_path.exists():
-                thumb_path.unlink()
+            if self._remove_entries(cache_keys):
                 print(f"Cleared thumbnail cache for: {file_path.name}")
                 return True
             else:
@@ -469,12 +998,8 @@ class ThumbnailDiskCache:
             return False
     
     def get_cache_size(self):
-        """Get current cache size in MB"""
-        total_size = 0
-        for thumb_file in self.cache_dir.glob("*.jpg"):
-            total_size += thumb_file.stat().st_size
-        
-        return total_size / (1024 * 1024)  # Convert to MB
+        """Get current cache size in MB (from the in-memory ledger)"""
+        return self._total_bytes / (1024 * 1024)  # Convert to MB
     
     def _check_cache_size(self):
         """Check cache size and cleanup if needed"""
@@ -485,57 +1010,520 @@ class ThumbnailDiskCache:
             self._cleanup_old_cache()
     
     def _cleanup_old_cache(self):
-        """Remove oldest thumbnails based on access time (LRU)"""
+        """Remove least recently accessed thumbnails (LRU) until 80% of the limit"""
         try:
-            # Get all thumbnail files with their stats
-            thumbs = []
-            for thumb_file in self.cache_dir.glob("*.jpg"):
-                stat = thumb_file.stat()
-                thumbs.append({
-                    'path': thumb_file,
-                    'size': stat.st_size,
-                    'atime': stat.st_atime,  # Access time
-                    'mtime': stat.st_mtime   # Modification time
-                })
-            
-            if not thumbs:
-                return
-            
-            # Sort by access time (least recently accessed first)
-            thumbs.sort(key=lambda x: x['atime'])
-            
             # Calculate target size (80% of max to leave headroom)
             target_size = self.max_size_mb * 0.8 * 1024 * 1024  # Convert to bytes
-            current_size = sum(t['size'] for t in thumbs)
             
-            # Remove files until we're under target
-            removed_count = 0
-            for thumb in thumbs:
-                if current_size <= target_size:
-                    break
+            with self._lock:
+                # Persist pending accesses so the index order is current
+                self.flush()
                 
-                try:
-                    thumb['path'].unlink()
-                    current_size -= thumb['size']
-                    removed_count += 1
-                except Exception as e:
-                    print(f"Error removing {thumb['path']}: {e}")
+                excess = self._total_bytes - target_size
+                if excess <= 0:
+                    return
+                
+                # Walk the last_access index from the oldest entry, stop once enough is freed
+                victims = []
+                freed = 0
+                for cache_key, size in self.conn.execute(
+                    'SELECT cache_key, size FROM entries ORDER BY last_access'
+                ):
+                    if freed >= excess:
+                        break
+                    victims.append(cache_key)
+                    freed += size
+                
+                removed_count = self._remove_entries(victims)
             
-            print(f"Removed {removed_count} old thumbnails, cache now {current_size / (1024*1024):.1f}MB")
+            print(f"Removed {removed_count} old thumbnails, cache now {self.get_cache_size():.1f}MB")
+            
+            # Evicted packed entries stay on disk as dead bytes until their pack is rewritten
+            if self.pack_store is not None:
+                self.compact()
             
         except Exception as e:
             print(f"Error during cache cleanup: {e}")
     
+    def compact(self, min_dead_ratio=None):
+        """
+        Rewrite packs whose evicted (dead) bytes exceed min_dead_ratio of the pack.
+        Live entries are appended to the current pack, then the old pack is deleted.
+        
+        Args:
+            min_dead_ratio: Dead fraction that triggers a rewrite (default: COMPACT_DEAD_RATIO, 0 = all packs)
+        
+        Returns:
+            int: Bytes reclaimed on disk
+        """
+        if self.pack_store is None:
+            return 0
+        
+        if min_dead_ratio is None:
+            min_dead_ratio = self.COMPACT_DEAD_RATIO
+        
+        reclaimed = 0
+        try:
+            with self._lock:
+                live_bytes = dict(self.conn.execute(
+                    'SELECT pack_id, SUM(size) FROM entries WHERE pack_id IS NOT NULL GROUP BY pack_id'
+                ))
+                
+                for pack_id, disk_bytes in self.pack_store.pack_sizes().items():
+                    live = live_bytes.get(pack_id, 0)
+                    if disk_bytes == 0 or (disk_bytes - live) / disk_bytes < min_dead_ratio:
+                        continue
+                    if min_dead_ratio == 0 and live == disk_bytes:
+                        continue  # Nothing to reclaim
+                    
+                    # Never append into the pack being rewritten
+                    if pack_id == self.pack_store.current_pack_id:
+                        self.pack_store.rotate()
+                    
+                    rows = self.conn.execute(
+                        'SELECT cache_key, pack_offset, size FROM entries WHERE pack_id = ? ORDER BY pack_offset',
+                        (pack_id,)
+                    ).fetchall()
+                    
+                    updates = []
+                    lost = []
+                    for cache_key, pack_offset, size in rows:
+                        data = self.pack_store.read(pack_id, pack_offset, size)
+                        if data is None:
+                            lost.append(cache_key)
+                            continue
+                        new_pack_id, new_offset = self.pack_store.append(data)
+                        updates.append((new_pack_id, new_offset, cache_key))
+                    
+                    self.conn.executemany(
+                        'UPDATE entries SET pack_id = ?, pack_offset = ? WHERE cache_key = ?', updates
+                    )
+                    self.conn.commit()
+                    self._remove_entries(lost)
+                    
+                    self.pack_store.remove_pack(pack_id)
+                    reclaimed += disk_bytes - live
+            
+            if reclaimed:
+                print(f"[DiskCache] Compacted packs, reclaimed {reclaimed / (1024 * 1024):.1f}MB")
+        
+        except Exception as e:
+            print(f"Error during pack compaction: {e}")
+        
+        return reclaimed
+    
+    def migrate_to_packed(self):
+        """
+        Move per-file thumbnails into pack files (runs in a background thread when packed=True).
+        Entries stay readable throughout - each row switches to its pack location under the lock.
+        
+        Returns:
+            int: Number of migrated thumbnails
+        """
+        if self.pack_store is None:
+            return 0
+        
+        try:
+            with self._lock:
+                loose_keys = [row[0] for row in self.conn.execute(
+                    'SELECT cache_key FROM entries WHERE pack_id IS NULL'
+                )]
+            
+            if not loose_keys:
+                return 0
+            
+            migrated = 0
+            missing = []
+            for cache_key in loose_keys:
+                thumb_path = self._shard_path(cache_key)
+                try:
+                    with open(thumb_path, 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    missing.append(cache_key)
+                    continue
+                
+                with self._lock:
+                    row = self.conn.execute(
+                        'SELECT size, pack_id FROM entries WHERE cache_key = ?', (cache_key,)
+                    ).fetchone()
+                    # Evicted or rewritten while the file was read
+                    if row is None or row[1] is not None:
+                        continue
+                    
+                    pack_id, pack_offset = self.pack_store.append(data)
+                    self.conn.execute(
+                        'UPDATE entries SET pack_id = ?, pack_offset = ?, size = ? WHERE cache_key = ?',
+                        (pack_id, pack_offset, len(data), cache_key)
+                    )
+                    self._total_bytes += len(data) - row[0]
+                    migrated += 1
+                    if migrated % 500 == 0:
+                        self.conn.commit()
+                    
+                    try:
+                        thumb_path.unlink()
+                    except OSError:
+                        pass
+            
+            with self._lock:
+                self.conn.commit()
+            self._remove_entries(missing)
+            
+            # Drop shard directories emptied by the migration
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_dir() and len(entry.name) == self.SHARD_LENGTH:
+                    try:
+                        os.rmdir(entry.path)
+                        self._known_shards.discard(Path(entry.path))
+                    except OSError:
+                        pass  # Not empty
+            
+            print(f"[DiskCache] Migrated {migrated} thumbnails into pack files")
+            return migrated
+        
+        except Exception as e:
+            print(f"Error migrating thumbnails into pack files: {e}")
+            return 0
+    
+    def get_stats(self):
+        """Get cache statistics"""
+        pack_sizes = self.pack_store.pack_sizes() if self.pack_store is not None else {}
+        return {
+            **self.stats,
+            'cache_size_mb': self.get_cache_size(),
+            'cache_dir': str(self.cache_dir),
+            'file_count': self._entry_count,
+            'storage': 'packed' if self.packed else 'files',
+            'pack_count': len(pack_sizes),
+            'pack_size_mb': sum(pack_sizes.values()) / (1024 * 1024)
+        }
+
+
+class DirectoryListingCache:
+    """
+    Persistent directory listing cache (survives restarts)
+    
+    Layout:
+    - listings.db (SQLite), one row per folder: folder path, folder mtime when listed,
+      last validation / access time and the listing itself
+    - The listing is stored column-wise (names, folder flags, sizes, mtimes) as
+      zlib-compressed JSON - one row read gives everything an AssetItem needs
+    - A listing is served only while the folder mtime is unchanged and it was validated
+      within ttl_days; the least recently used folders are evicted beyond max_size_mb
+    
+    Thread-safe: the GUI thread reads, DirectoryScanner threads write (serialized by _lock).
+    """
+    
+    def __init__(self, cache_file=None, max_size_mb=50, ttl_days=30):
+        """
+        Initialize listing cache.
+        
+        Args:
+            cache_file: SQLite file (default: ~/.ddContentBrowser/listings.db)
+            max_size_mb: Maximum size of stored listings in megabytes (default: 50 MB)
+            ttl_days: Listings not validated for this many days are not used (default: 30)
+        """
+        if cache_file is None:
+            from .utils import get_browser_data_dir
+            cache_file = get_browser_data_dir() / "listings.db"
+        
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_mb = max_size_mb
+        self.ttl_days = ttl_days
+        self.stats = {'hits': 0, 'misses': 0, 'stale': 0}
+        
+        self._lock = threading.RLock()
+        self._total_bytes = 0  # SUM(length(payload)) of all rows
+        
+        self.conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        try:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.Error:
+            pass
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS listings (
+                dir_path TEXT PRIMARY KEY,
+                dir_mtime REAL NOT NULL,
+                validated REAL NOT NULL,
+                last_access REAL NOT NULL,
+                entry_count INTEGER NOT NULL,
+                payload BLOB NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_listings_access ON listings(last_access)')
+        self.conn.commit()
+        self._total_bytes = self.conn.execute(
+            'SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM listings'
+        ).fetchone()[0]
+    
+    def set_limits(self, max_size_mb=None, ttl_days=None):
+        """Change size / TTL limits - evicts right away if the cache is over the new size"""
+        if max_size_mb is not None:
+            self.max_size_mb = max_size_mb
+        if ttl_days is not None:
+            self.ttl_days = ttl_days
+        with self._lock:
+            self._evict()
+    
+    def get(self, dir_path, dir_mtime):
+        """
+        Get the stored listing of a folder
+        
+        Args:
+            dir_path: Folder path string
+            dir_mtime: Current folder modification time
+            
+        Returns:
+            list: [(name, is_folder, size, mtime), ...] or None if unknown, changed or expired
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT dir_mtime, validated, payload FROM listings WHERE dir_path = ?', (dir_path,)
+                ).fetchone()
+                if row is None:
+                    self.stats['misses'] += 1
+                    return None
+                
+                now = time.time()
+                if row[0] != dir_mtime or now - row[1] > self.ttl_days * 86400:
+                    self.stats['stale'] += 1
+                    self._remove(dir_path)
+                    self.conn.commit()
+                    return None
+                
+                self.conn.execute('UPDATE listings SET last_access = ? WHERE dir_path = ?', (now, dir_path))
+                self.conn.commit()
+                self.stats['hits'] += 1
+            
+            names, folder_flags, sizes, mtimes = json.loads(zlib.decompress(row[2]))
+            return list(zip(names, map(bool, folder_flags), sizes, mtimes))
+        except Exception as e:
+            print(f"[ListingCache] Error reading {dir_path}: {e}")
+            return None
+    
+    def put(self, dir_path, dir_mtime, entries):
+        """
+        Store the listing of a folder (replaces the previous one)
+        
+        Args:
+            dir_path: Folder path string
+            dir_mtime: Folder modification time the listing belongs to
+            entries: [(name, is_folder, size, mtime), ...]
+        """
+        columns = [list(column) for column in zip(*entries)] if entries else [[], [], [], []]
+        columns[1] = [int(flag) for flag in columns[1]]
+        payload = zlib.compress(json.dumps(columns, separators=(',', ':')).encode('utf-8'), 1)
+        
+        try:
+            with self._lock:
+                now = time.time()
+                self._remove(dir_path)
+                self.conn.execute(
+                    'INSERT INTO listings (dir_path, dir_mtime, validated, last_access, entry_count, payload) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (dir_path, dir_mtime, now, now, len(entries), sqlite3.Binary(payload))
+                )
+                self._total_bytes += len(payload)
+                self._evict()
+                self.conn.commit()
+        except Exception as e:
+            print(f"[ListingCache] Error writing {dir_path}: {e}")
+    
+    def remove(self, dir_path):
+        """Forget the listing of a folder"""
+        try:
+            with self._lock:
+                self._remove(dir_path)
+                self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"[ListingCache] Error removing {dir_path}: {e}")
+    
+    def _remove(self, dir_path):
+        """Delete one row and update the size ledger (caller holds _lock)"""
+        row = self.conn.execute(
+            'SELECT LENGTH(payload) FROM listings WHERE dir_path = ?', (dir_path,)
+        ).fetchone()
+        if row is not None:
+            self.conn.execute('DELETE FROM listings WHERE dir_path = ?', (dir_path,))
+            self._total_bytes -= row[0]
+    
+    def _evict(self):
+        """Drop expired listings, then least recently used ones beyond max_size_mb (caller holds _lock)"""
+        expired_before = time.time() - self.ttl_days * 86400
+        if self.conn.execute('DELETE FROM listings WHERE validated < ?', (expired_before,)).rowcount:
+            self._total_bytes = self.conn.execute(
+                'SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM listings'
+            ).fetchone()[0]
+        
+        max_bytes = self.max_size_mb * 1024 * 1024
+        if self._total_bytes <= max_bytes:
+            return
+        
+        evicted = 0
+        for dir_path, size in self.conn.execute(
+            'SELECT dir_path, LENGTH(payload) FROM listings ORDER BY last_access'
+        ).fetchall():
+            if self._total_bytes <= max_bytes * 0.9:
+                break
+            self.conn.execute('DELETE FROM listings WHERE dir_path = ?', (dir_path,))
+            self._total_bytes -= size
+            evicted += 1
+        
+        if DEBUG_MODE:
+            print(f"[ListingCache] Evicted {evicted} listings")
+    
+    def clear(self):
+        """Remove all stored listings"""
+        try:
+            with self._lock:
+                self.conn.execute('DELETE FROM listings')
+                self.conn.commit()
+                self._total_bytes = 0
+        except sqlite3.Error as e:
+            print(f"[ListingCache] Error clearing cache: {e}")
+    
+    def close(self):
+        """Close the database (on application exit)"""
+        with self._lock:
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+    
     def get_stats(self):
         """Get cache statistics"""
+        with self._lock:
+            folder_count = self.conn.execute('SELECT COUNT(*) FROM listings').fetchone()[0]
         return {
             **self.stats,
-            'cache_size_mb': self.get_cache_size(),
-            'cache_dir': str(self.cache_dir),
-            'file_count': len(list(self.cache_dir.glob("*.jpg")))
+            'folder_count': folder_count,
+            'cache_size_mb': self._total_bytes / (1024 * 1024),
+            'cache_file': str(self.cache_file)
         }
 
 
+class ThumbnailCancelled(Exception):
+    """Raised inside a worker when its thumbnail job was cancelled (item left the viewport)"""
+
+
+class ThumbnailScheduler:
+    """
+    Tiered work queue for ThumbnailGenerator
+    
+    Tiers (lower number = served first):
+    - VISIBLE: tiles on screen right now, in display order
+    - PREFETCH: about one screen ahead/behind in the scroll direction
+    - BACKGROUND: rest of the folder, generated while nothing else is pending
+    
+    Every file is queued at most once (dict lookup instead of a list scan).
+    Rescheduling moves an entry to another tier instead of dropping it - the old
+    deque slot goes stale and is skipped on pop (lazy deletion).
+    Not thread-safe on its own - ThumbnailGenerator guards it with queue_lock.
+    """
+    
+    VISIBLE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+    
+    def __init__(self):
+        self._tiers = (deque(), deque(), deque())
+        self._entries = {}  # file_path -> [tier, file_mtime, asset]
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, file_path):
+        return file_path in self._entries
+    
+    def add(self, file_path, file_mtime, asset=None, tier=BACKGROUND):
+        """
+        Queue a file, or move it up if it is already queued at a lower tier
+        
+        Returns:
+            int or None: Previous tier of the file (None if it was not queued)
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            self._entries[file_path] = [tier, file_mtime, asset]
+            self._tiers[tier].append(file_path)
+            return None
+        
+        previous_tier = entry[0]
+        if tier < previous_tier:
+            entry[0] = tier
+            self._tiers[tier].append(file_path)
+        if file_mtime is not None:
+            entry[1] = file_mtime
+        return previous_tier
+    
+    def demote(self, from_tier, to_tier=BACKGROUND):
+        """
+        Move all entries of a tier down (e.g. items that scrolled out of view).
+        They go to the FRONT of the target tier, keeping their order - they are
+        still closest to the viewport.
+        """
+        moved = []
+        seen = set()
+        for file_path in self._tiers[from_tier]:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == from_tier and file_path not in seen:
+                seen.add(file_path)
+                moved.append(file_path)
+        self._tiers[from_tier].clear()
+        
+        for file_path in reversed(moved):
+            self._entries[file_path][0] = to_tier
+            self._tiers[to_tier].appendleft(file_path)
+    
+    def next_tier(self):
+        """Tier of the next entry pop() would return (None if empty)"""
+        for tier, queue in enumerate(self._tiers):
+            while queue:
+                entry = self._entries.get(queue[0])
+                if entry is not None and entry[0] == tier:
+                    return tier
+                queue.popleft()  # Stale slot
+        return None
+    
+    def pop(self):
+        """
+        Take the highest-priority entry
+        
+        Returns:
+            tuple: (file_path, file_mtime, asset, tier) or None if empty
+        """
+        for tier, queue in enumerate(self._tiers):
+            while queue:
+                file_path = queue.popleft()
+                entry = self._entries.get(file_path)
+                if entry is not None and entry[0] == tier:
+                    del self._entries[file_path]
+                    return file_path, entry[1], entry[2], tier
+        return None
+    
+    def count(self, tier):
+        """Number of entries queued at a tier (O(n) - for stats only)"""
+        return sum(1 for entry in self._entries.values() if entry[0] == tier)
+    
+    def clear(self, tier=None):
+        """Drop all entries, or only those of one tier"""
+        if tier is None:
+            self._entries.clear()
+            for queue in self._tiers:
+                queue.clear()
+            return
+        
+        for file_path in self._tiers[tier]:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == tier:
+                del self._entries[file_path]
+        self._tiers[tier].clear()
+
+
 class ThumbnailGenerator(QThread):
     """
     Hybrid multithreaded thumbnail generator
@@ -550,10 +1538,13 @@ class ThumbnailGenerator(QThread):
     """
     
     # Signals
-    thumbnail_ready = Signal(str, object)  # (file_path, pixmap)
+    thumbnails_ready = Signal(object)      # [(file_path, pixmap), ...] batched per frame
     progress_update = Signal(int, int)     # (current, total)
     generation_failed = Signal(str, str)    # (file_path, error_message)
     cache_status = Signal(str)             # Status message: "cache" or "generating"
+    cached_thumbnails_ready = Signal(object)  # [(file_path, cache_key, QImage), ...] batched disk cache hits
+    
+    READY_BATCH_INTERVAL = 0.016  # Seconds - finished thumbnails are delivered at most once per frame
     
     def __init__(self, memory_cache, disk_cache, thumbnail_size=128, jpeg_quality=85, metadata_manager=None, max_workers=None):
         super().__init__()
@@ -562,11 +1553,15 @@ class ThumbnailGenerator(QThread):
         self.thumbnail_size = thumbnail_size
         self.jpeg_quality = jpeg_quality  # JPEG quality for disk cache (0-100)
         self.metadata_manager = metadata_manager  # For auto-tagging color spaces
-        self.queue = []
+        self.scheduler = ThumbnailScheduler()  # Visible / prefetch / background tiers
+        self.queue_lock = threading.Lock()     # Scheduler is fed from UI and worker threads
+        self.background_scheduled = False      # Background tier holds the current folder
         self.is_running = True
         self.current_file = None
         self.processed_count = 0  # Track how many we've processed
         self.total_count = 0      # Track total in current batch
+        self._lookup_generation = 0  # Bumped by request_cached() - superseded lookups queue misses as background
+        self._queue_epoch = 0        # Bumped by clear_queue() - lookups from before are dropped
         
         # Performance tracking
         self._last_stats_time = 0
@@ -580,15 +1575,32 @@ class ThumbnailGenerator(QThread):
             # Use CPU count but cap at 12 to avoid excessive threads
             max_workers = min(cpu_count, 12)
         self.max_workers = max_workers
+        self.background_workers = max(1, max_workers // 2)  # In-flight cap for background fill
         self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ThumbWorker")
         
         # Thread-safe result queue for worker threads
         self.result_queue = Queue()
         
+        # run() sleeps on this until there is something to do (new work, a finished job, stop)
+        self._wakeup = threading.Condition()
+        self._wake_pending = True
+        
+        # Finished thumbnails waiting for the next thumbnails_ready batch (run() thread only)
+        self._ready_batch = []
+        self._ready_deadline = None   # perf_counter time the pending batch is due
+        self._emitted_progress = None  # Last (processed, total) sent with progress_update
+        
         # Track active futures to avoid processing duplicate files
         self.active_futures = {}  # file_path -> Future
         self.futures_lock = threading.Lock()
         
+        # Cancel token of the job running on each worker thread (see _check_cancelled)
+        self._job_state = threading.local()
+        
+        # Process pool for extensions routed to backend 'process' (created on first use)
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
+        
         # Clean up any ffmpeg log files generated by imageio_ffmpeg imports
         self._cleanup_ffmpeg_logs()
         
@@ -627,44 +1639,229 @@ class ThumbnailGenerator(QThread):
         except:
             pass  # Don't let cleanup errors affect initialization
         
-    def add_to_queue(self, file_path, file_mtime, priority=False, asset=None):
-        """Add file to generation queue with optional priority and asset
+    def add_to_queue(self, file_path, file_mtime, priority=False, asset=None, tier=None):
+        """Add file to generation queue (or move it up if already queued)
         
         Args:
             file_path: Path to file
-            file_mtime: File modification time
-            priority: Priority flag (unused, kept for compatibility)
+            file_mtime: File modification time (None = stat when dequeued)
+            priority: Queue at the VISIBLE tier (default tier if tier is not given)
             asset: Optional AssetItem object (for sequence support)
+            tier: ThumbnailScheduler tier - VISIBLE, PREFETCH or BACKGROUND
+        """
+        if tier is None:
+            tier = ThumbnailScheduler.VISIBLE if priority else ThumbnailScheduler.BACKGROUND
+        
+        # Items are added in display order (top to bottom) and served FIFO per tier
+        with self.queue_lock:
+            previous_tier = self.scheduler.add(file_path, file_mtime, asset, tier)
+        
+        # Progress counts what the user is waiting for - not background fill
+        if tier != ThumbnailScheduler.BACKGROUND and previous_tier in (None, ThumbnailScheduler.BACKGROUND):
+            self.total_count += 1
+        
+        self._wake()
+    
+    def set_background(self, items):
+        """
+        Replace the background tier with the rest of the folder (called from UI thread).
+        Background items are generated only while nothing visible or prefetched is pending,
+        and only warm the disk cache - they never evict visible thumbnails from memory.
+        
+        Args:
+            items: List of (file_path, asset) in display order - mtime is read when dequeued
+        """
+        with self.queue_lock:
+            self.scheduler.clear(ThumbnailScheduler.BACKGROUND)
+            for file_path, asset in items:
+                self.scheduler.add(file_path, None, asset, ThumbnailScheduler.BACKGROUND)
+        self.background_scheduled = True
+        self._wake()
+    
+    def _wake(self):
+        """Wake the run() loop (thread-safe, cheap if it is already awake)"""
+        with self._wakeup:
+            self._wake_pending = True
+            self._wakeup.notify()
+    
+    def clear_background(self):
+        """Drop queued background work (e.g. background generation disabled)"""
+        with self.queue_lock:
+            self.scheduler.clear(ThumbnailScheduler.BACKGROUND)
+        self.background_scheduled = False
+    
+    def request_cached(self, items, prefetch_items=()):
+        """
+        Reprioritize the queue for a new viewport (called from UI thread)
+        
+        Whatever was visible or prefetched before moves to the background tier - it is
+        not discarded. A worker then stats the new items, reads all disk cache hits with
+        one index query, decodes them to QImage and emits them as one
+        cached_thumbnails_ready batch. Misses are queued at the VISIBLE / PREFETCH tier.
+        
+        Args:
+            items: List of (file_path, cache_key, asset) on screen, in display order
+            prefetch_items: Same for the next screen in the scroll direction
         """
-        # Check if already in queue
-        for item in self.queue:
-            if item[0] == file_path:
+        with self.queue_lock:
+            self.scheduler.demote(ThumbnailScheduler.VISIBLE)
+            self.scheduler.demote(ThumbnailScheduler.PREFETCH)
+        
+        # In-flight decodes for tiles that are gone stop at their next stage boundary
+        wanted = {item[0] for item in items}
+        wanted.update(item[0] for item in prefetch_items)
+        self.cancel_jobs(keep=wanted)
+        
+        # Progress restarts for the new viewport
+        self.processed_count = 0
+        self.total_count = 0
+        self._lookup_generation += 1
+        
+        try:
+            self.executor.submit(
+                self._lookup_cached_batch, items, prefetch_items,
+                self._lookup_generation, self._queue_epoch
+            )
+        except RuntimeError:
+            pass  # Executor already shut down
+    
+    def _lookup_cached_batch(self, items, prefetch_items, generation, epoch):
+        """Worker side of request_cached() - stat, batched disk cache read, QImage decode"""
+        try:
+            if PYSIDE_VERSION == 6:
+                from PySide6.QtGui import QImage
+            else:
+                from PySide2.QtGui import QImage
+            
+            lookups = []
+            for tier, tier_items in ((ThumbnailScheduler.VISIBLE, items),
+                                     (ThumbnailScheduler.PREFETCH, prefetch_items)):
+                for file_path, cache_key, asset in tier_items:
+                    is_sequence = bool(asset.is_sequence and asset.sequence)
+                    # Lazy stat happens here instead of on the UI thread
+                    lookups.append((file_path, cache_key, asset, asset.modified_time, is_sequence, tier))
+            
+            # Sequences are never written to disk cache
+            found = self.disk_cache.read_many(
+                (file_path, file_mtime) for file_path, _, _, file_mtime, is_sequence, _ in lookups
+                if not is_sequence
+            )
+            
+            hits = []
+            misses = []
+            for file_path, cache_key, asset, file_mtime, is_sequence, tier in lookups:
+                data = found.get(file_path)
+                image = QImage.fromData(data, "JPEG") if data else None
+                if image is not None and not image.isNull():
+                    hits.append((file_path, cache_key, image))
+                else:
+                    misses.append((file_path, file_mtime, asset, tier))
+            
+            if DEBUG_MODE:
+                print(f"[CACHE-LOOKUP] {len(hits)} disk cache hits, {len(misses)} to generate")
+            
+            if hits:
+                self.cached_thumbnails_ready.emit(hits)
+            
+            # Queue was cleared meanwhile (navigation, refresh) - misses belong to old content
+            if epoch != self._queue_epoch:
                 return
+            
+            # A newer viewport was requested meanwhile - still worth generating, but last
+            superseded = generation != self._lookup_generation
+            for file_path, file_mtime, asset, tier in misses:
+                if superseded:
+                    tier = ThumbnailScheduler.BACKGROUND
+                self.add_to_queue(file_path, file_mtime, asset=asset, tier=tier)
         
-        # Just append to queue - priority is handled by clearing old items
-        # Items are added in visible order (top to bottom)
-        self.queue.append((file_path, file_mtime, asset))
-        self.total_count += 1  # Increment total when adding to queue
+        except Exception as e:
+            print(f"[ThumbnailGenerator] Disk cache lookup failed: {e}")
     
     def clear_queue(self):
-        """Clear generation queue"""
-        self.queue.clear()
+        """Clear generation queue (all tiers - the listed content changed) and cancel running jobs"""
+        self._queue_epoch += 1
+        self._lookup_generation += 1
+        with self.queue_lock:
+            self.scheduler.clear()
+        self.background_scheduled = False
+        self.cancel_jobs(include_background=True)
         self.processed_count = 0
         self.total_count = 0
     
+    def cancel_jobs(self, keep=(), include_background=False):
+        """
+        Cancel in-flight worker jobs (cooperative).
+        Jobs not started yet are cancelled right away; running jobs raise
+        ThumbnailCancelled at their next stage boundary (decode / tonemap / resize).
+        
+        Args:
+            keep: File paths whose jobs keep running (still visible)
+            include_background: Also cancel background fill jobs
+        """
+        cancelled = []
+        with self.futures_lock:
+            for file_path, job in self.active_futures.items():
+                if file_path in keep or job['cancel_event'].is_set():
+                    continue
+                if job['tier'] == ThumbnailScheduler.BACKGROUND and not include_background:
+                    continue
+                job['cancel_event'].set()
+                cancelled.append(job['future'])
+        
+        # Outside the lock - cancelling a pending future runs its done callback right here
+        for future in cancelled:
+            future.cancel()
+        
+        if DEBUG_MODE and cancelled:
+            print(f"[CACHE-THREAD] ✂ Cancelled {len(cancelled)} in-flight job(s)")
+    
+    def _is_job_cancelled(self):
+        """Check if the job running on this worker thread was cancelled"""
+        cancel_event = getattr(self._job_state, 'cancel_event', None)
+        return cancel_event is not None and cancel_event.is_set()
+    
+    def _check_cancelled(self):
+        """Stage boundary in worker code - abort if the current job was cancelled"""
+        if self._is_job_cancelled():
+            raise ThumbnailCancelled()
+    
+    def _run_job(self, cancel_event, file_path, asset):
+        """Worker entry point - binds the job's cancel token to this thread"""
+        self._job_state.cancel_event = cancel_event
+        try:
+            self._check_cancelled()
+            return self._generate_thumbnail_data(file_path, asset)
+        finally:
+            self._job_state.cancel_event = None
+    
     def stop(self):
         """Stop the generator thread and worker pool gracefully"""
         self.is_running = False
-        self.queue.clear()
+        with self.queue_lock:
+            self.scheduler.clear()
         self.current_file = None  # Clear current processing file
+        self._wake()
         
         # Shutdown thread pool (wait for active tasks to complete)
         if hasattr(self, 'executor'):
             if DEBUG_MODE:
                 print("[ThumbnailGenerator] Shutting down worker pool...")
+            self.cancel_jobs(include_background=True)
             self.executor.shutdown(wait=True, cancel_futures=True)
             if DEBUG_MODE:
                 print("[ThumbnailGenerator] Worker pool shut down")
+        
+        # Worker threads are gone, so nothing waits on the process pool anymore
+        with self._process_pool_lock:
+            if self._process_pool:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = False
+        
+        # Persist batched disk cache index writes (access times, stats)
+        try:
+            self.disk_cache.flush()
+        except Exception as e:
+            print(f"[ThumbnailGenerator] Could not flush disk cache: {e}")
     
     def run(self):
         """
@@ -673,83 +1870,116 @@ class ThumbnailGenerator(QThread):
         Balanced two-stage pipeline:
         1. Submit jobs to ThreadPoolExecutor (controlled rate)
         2. Process completed results (QPixmap conversion in main thread)
+        
+        Event-driven: the loop blocks on _wakeup while idle and is woken by
+        add_to_queue() / set_background(), finished worker jobs and stop().
         """
         if DEBUG_MODE:
             print("[CACHE-THREAD] 🚀 Main loop started")
         
         while self.is_running:
+            # Sleep until something changed - no timeout (zero CPU) unless a batch is due
+            with self._wakeup:
+                while not self._wake_pending and self.is_running:
+                    if self._ready_deadline is None:
+                        self._wakeup.wait()
+                        continue
+                    remaining = self._ready_deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                self._wake_pending = False
+            if not self.is_running:
+                break
+            
             # Stage 1: Submit MULTIPLE new jobs if capacity available (fill the pool!)
             # Submit up to max_workers jobs per iteration to saturate CPU
             jobs_submitted = 0
-            while self.queue and self.is_running and jobs_submitted < self.max_workers:
+            while self.is_running and jobs_submitted < self.max_workers:
                 # Check if we have capacity (don't overwhelm the pool)
                 with self.futures_lock:
                     active_count = len(self.active_futures)
+                    background_count = sum(
+                        1 for job in self.active_futures.values()
+                        if job['tier'] == ThumbnailScheduler.BACKGROUND
+                    )
                 
                 # Limit in-flight jobs to avoid memory buildup
                 # Max in-flight = max_workers + 2 (tight control)
-                if active_count < self.max_workers + 2:
-                    # Get next item from queue (pop from END for correct order)
-                    queue_item = self.queue.pop()  # pop() = pop(-1) = last item
-                    
-                    # Extract components (backwards compatible with old tuple format)
-                    if len(queue_item) == 3:
-                        file_path, file_mtime, asset = queue_item
-                    else:
-                        file_path, file_mtime = queue_item
-                        asset = None
-                    
-                    # Check if already processing this file
-                    already_processing = False
-                    with self.futures_lock:
-                        if file_path in self.active_futures:
-                            already_processing = True
-                    
-                    if not already_processing:
-                        # For sequences, use pattern as cache key instead of file path
-                        cache_key = file_path
-                        is_sequence = asset and asset.is_sequence and asset.sequence
-                        if is_sequence:
-                            cache_key = str(asset.sequence.pattern)
-                        
+                if active_count >= self.max_workers + 2:
+                    break
+                
+                with self.queue_lock:
+                    next_tier = self.scheduler.next_tier()
+                    # Background fill keeps half of the workers free for the viewport
+                    if next_tier == ThumbnailScheduler.BACKGROUND and background_count >= self.background_workers:
+                        next_tier = None
+                    queue_item = self.scheduler.pop() if next_tier is not None else None
+                
+                if queue_item is None:
+                    break
+                
+                file_path, file_mtime, asset, tier = queue_item
+                is_background = tier == ThumbnailScheduler.BACKGROUND
+                
+                # Check if already processing this file
+                with self.futures_lock:
+                    job = self.active_futures.get(file_path)
+                    if job is not None:
+                        # Promote the running job so its result is treated as visible
+                        job['tier'] = min(job['tier'], tier)
+                if job is not None:
+                    continue
+                
+                # For sequences, use pattern as cache key instead of file path
+                cache_key = file_path
+                is_sequence = asset and asset.is_sequence and asset.sequence
+                if is_sequence:
+                    cache_key = str(asset.sequence.pattern)
+                
+                if DEBUG_MODE:
+                    print(f"[CACHE-THREAD] Processing: {Path(file_path).name} (tier {tier})")
+                
+                if is_background:
+                    # Background fill only warms the disk cache - skip anything already cached
+                    if is_sequence or self.memory_cache.get(cache_key) is not None:
+                        continue
+                    if file_mtime is None:
+                        file_mtime = asset.modified_time if asset else os.path.getmtime(file_path)
+                    if self.disk_cache.contains(file_path, file_mtime):
+                        continue
+                    self._submit_worker_job(file_path, file_mtime, asset, cache_key, is_sequence, tier)
+                    jobs_submitted += 1
+                    continue
+                
+                # Check memory cache first
+                cached = self.memory_cache.get(cache_key)
+                if cached:
+                    if DEBUG_MODE:
+                        print(f"[CACHE-THREAD] → Found in memory cache")
+                    self.cache_status.emit("cache")
+                    self.processed_count += 1
+                    self._queue_ready(file_path, cached)
+                    # DON'T continue here - fall through to Stage 2
+                # Check disk cache (skip for sequences)
+                elif not is_sequence:
+                    cached = self.disk_cache.get(file_path, file_mtime)
+                    if cached and not cached.isNull():
                         if DEBUG_MODE:
-                            print(f"[CACHE-THREAD] Processing: {Path(file_path).name}")
-                        
-                        # Check memory cache first
-                        cached = self.memory_cache.get(cache_key)
-                        if cached:
-                            if DEBUG_MODE:
-                                print(f"[CACHE-THREAD] → Found in memory cache")
-                            self.cache_status.emit("cache")
-                            self.thumbnail_ready.emit(file_path, cached)
-                            self.processed_count += 1
-                            if self.total_count > 0:
-                                self.progress_update.emit(self.processed_count, self.total_count)
-                            # DON'T continue here - fall through to Stage 2
-                        # Check disk cache (skip for sequences)
-                        elif not is_sequence:
-                            cached = self.disk_cache.get(file_path, file_mtime)
-                            if cached and not cached.isNull():
-                                if DEBUG_MODE:
-                                    print(f"[CACHE-THREAD] → Found in disk cache")
-                                self.cache_status.emit("cache")
-                                self.memory_cache.set(file_path, cached)
-                                self.thumbnail_ready.emit(file_path, cached)
-                                self.processed_count += 1
-                                if self.total_count > 0:
-                                    self.progress_update.emit(self.processed_count, self.total_count)
-                                # DON'T continue here - fall through to Stage 2
-                            else:
-                                # Need to generate - submit to worker pool
-                                self._submit_worker_job(file_path, file_mtime, asset, cache_key, is_sequence)
-                        else:
-                            # Sequence - submit to worker pool
-                            self._submit_worker_job(file_path, file_mtime, asset, cache_key, is_sequence)
-                        
-                        jobs_submitted += 1
+                            print(f"[CACHE-THREAD] → Found in disk cache")
+                        self.cache_status.emit("cache")
+                        self.memory_cache.set(file_path, cached)
+                        self.processed_count += 1
+                        self._queue_ready(file_path, cached)
+                        # DON'T continue here - fall through to Stage 2
+                    else:
+                        # Need to generate - submit to worker pool
+                        self._submit_worker_job(file_path, file_mtime, asset, cache_key, is_sequence, tier)
                 else:
-                    # Pool is full, stop submitting
-                    break
+                    # Sequence - submit to worker pool
+                    self._submit_worker_job(file_path, file_mtime, asset, cache_key, is_sequence, tier)
+                
+                jobs_submitted += 1
             
             # Stage 2: Process completed results from worker threads
             # Convert numpy arrays to QPixmap and emit signals
@@ -759,19 +1989,32 @@ class ThumbnailGenerator(QThread):
             
             while results_processed < max_results_per_iteration:
                 try:
-                    # Non-blocking check for results (timeout=0.01 seconds)
-                    result = self.result_queue.get(timeout=0.01)
+                    # Non-blocking - finished jobs wake the loop themselves
+                    result = self.result_queue.get_nowait()
                     
                     if DEBUG_MODE:
                         print(f"[CACHE-THREAD] ← Received result from queue")
                     
                     file_path = result['file_path']
                     success = result['success']
+                    is_background = result['tier'] == ThumbnailScheduler.BACKGROUND
                     
-                    # Increment progress
-                    self.processed_count += 1
-                    if self.total_count > 0:
-                        self.progress_update.emit(self.processed_count, self.total_count)
+                    # Cancelled in the worker, or finished after leaving the viewport -
+                    # drop before any QPixmap work
+                    if result['cancel_event'].is_set():
+                        if DEBUG_MODE:
+                            print(f"[CACHE-THREAD] ✂ Dropped stale result: {Path(file_path).name}")
+                        # Same folder still listed - let background fill pick it up again later
+                        if result['epoch'] == self._queue_epoch and self.background_scheduled:
+                            self.add_to_queue(file_path, result['file_mtime'], asset=result['asset'],
+                                              tier=ThumbnailScheduler.BACKGROUND)
+                        results_processed += 1
+                        continue
+                    
+                    # Increment progress (background fill is not part of it)
+                    if not is_background:
+                        self.processed_count += 1
+                        self._queue_ready()
                     
                     if success:
                         # Convert numpy array to QPixmap (MUST be done in main thread)
@@ -791,11 +2034,13 @@ class ThumbnailGenerator(QThread):
                                 if DEBUG_MODE:
                                     print(f"[CACHE-THREAD] ✓ QPixmap created: {pixmap.width()}×{pixmap.height()}")
                                 
-                                # Save to memory cache immediately (fast)
-                                self.memory_cache.set(cache_key, pixmap)
-                                
-                                # Emit signal FIRST (UI updates immediately)
-                                self.thumbnail_ready.emit(file_path, pixmap)
+                                # Background fill goes to disk only - don't evict visible thumbnails
+                                if not is_background:
+                                    # Save to memory cache immediately (fast)
+                                    self.memory_cache.set(cache_key, pixmap)
+                                    
+                                    # UI picks it up with the rest of this frame's batch
+                                    self._queue_ready(file_path, pixmap)
                                 
                                 # Save to disk cache ASYNC in worker pool (don't block UI)
                                 # QImage.save() is thread-safe, so we can do this in background
@@ -809,7 +2054,7 @@ class ThumbnailGenerator(QThread):
                                     )
                                 
                                 if DEBUG_MODE:
-                                    print(f"[CACHE-THREAD] ✓ Thumbnail ready signal emitted: {Path(file_path).name}")
+                                    print(f"[CACHE-THREAD] ✓ Thumbnail ready: {Path(file_path).name}")
                             else:
                                 if DEBUG_MODE:
                                     print(f"[CACHE-THREAD] Failed to convert to QPixmap: {Path(file_path).name}")
@@ -832,26 +2077,51 @@ class ThumbnailGenerator(QThread):
                     # Queue empty or timeout - break inner loop
                     break
             
-            # Small sleep if nothing to do
-            if not self.queue and self.result_queue.empty():
-                self.msleep(10)  # Shorter sleep for better responsiveness
-            else:
-                # Yield to other threads briefly
-                self.msleep(1)
+            # Deliver this frame's thumbnails and progress in one go
+            if self._ready_deadline is not None and time.perf_counter() >= self._ready_deadline:
+                self._flush_ready_batch()
+            
+            # Stopped on a batch limit (not on an empty queue / full pool) - go around again.
+            # Otherwise the next add_to_queue() or finished job wakes us.
+            if jobs_submitted >= self.max_workers or results_processed >= max_results_per_iteration:
+                self._wake()
             
             # Debug stats (periodic)
             if DEBUG_MODE:
-                import time
                 current_time = time.time()
                 if current_time - self._last_stats_time > self._stats_interval:
                     self._last_stats_time = current_time
                     with self.futures_lock:
                         active_count = len(self.active_futures)
-                    queue_size = len(self.queue)
+                    queue_size = len(self.scheduler)
                     result_queue_size = self.result_queue.qsize()
                     print(f"[STATS] Queue: {queue_size} | Active: {active_count} | Results: {result_queue_size} | Progress: {self.processed_count}/{self.total_count}")
     
-    def _submit_worker_job(self, file_path, file_mtime, asset, cache_key, is_sequence):
+    def _queue_ready(self, file_path=None, pixmap=None):
+        """
+        Add a finished thumbnail to the pending batch (run() thread only).
+        Without arguments only marks progress as changed.
+        """
+        if file_path is not None:
+            self._ready_batch.append((file_path, pixmap))
+        if self._ready_deadline is None:
+            self._ready_deadline = time.perf_counter() + self.READY_BATCH_INTERVAL
+    
+    def _flush_ready_batch(self):
+        """Emit pending thumbnails as one thumbnails_ready batch, and the latest progress"""
+        self._ready_deadline = None
+        
+        if self._ready_batch:
+            batch = self._ready_batch
+            self._ready_batch = []
+            self.thumbnails_ready.emit(batch)
+        
+        progress = (self.processed_count, self.total_count)
+        if progress != self._emitted_progress and self.total_count > 0:
+            self._emitted_progress = progress
+            self.progress_update.emit(*progress)
+    
+    def _submit_worker_job(self, file_path, file_mtime, asset, cache_key, is_sequence, tier=ThumbnailScheduler.VISIBLE):
         """Submit a job to the worker pool (extracted helper method)."""
         if DEBUG_MODE:
             print(f"[CACHE-THREAD] → Submitting to worker pool...")
@@ -875,8 +2145,10 @@ class ThumbnailGenerator(QThread):
         self.cache_status.emit("generating")
         
         # Submit worker job (CPU-intensive work happens here in parallel)
+        cancel_event = threading.Event()
         future = self.executor.submit(
-            self._generate_thumbnail_data,
+            self._run_job,
+            cancel_event,
             file_path,
             asset
         )
@@ -893,7 +2165,10 @@ class ThumbnailGenerator(QThread):
                 'file_mtime': file_mtime,
                 'asset': asset,
                 'cache_key': cache_key,
-                'is_sequence': is_sequence
+                'is_sequence': is_sequence,
+                'tier': tier,
+                'cancel_event': cancel_event,
+                'epoch': self._queue_epoch
             }
         
         # Add callback AFTER metadata is stored
@@ -918,35 +2193,33 @@ class ThumbnailGenerator(QThread):
             thread_name = threading.current_thread().name
             print(f"[{thread_name}] 📥 Callback triggered for: {Path(file_path).name}")
         
-        import time
-        
-        # Try to get job info (with retry in case metadata not yet stored)
-        job_info = None
-        for retry in range(100):  # Try up to 100 times (100ms total)
-            with self.futures_lock:
-                job_info = self.active_futures.pop(file_path, None)
-            
-            if job_info:
-                if DEBUG_MODE:
-                    import threading
-                    thread_name = threading.current_thread().name
-                    print(f"[{thread_name}] ✓ Job info found (retry: {retry})")
-                break
-            
-            # Metadata not yet stored, wait briefly and retry
-            if DEBUG_MODE and retry == 0:
-                import threading
-                thread_name = threading.current_thread().name
-                print(f"[{thread_name}] ⏳ Waiting for metadata to be stored...")
-            time.sleep(0.001)  # 1ms wait
+        # Metadata is stored before the callback is registered, so it is always here
+        with self.futures_lock:
+            job_info = self.active_futures.get(file_path)
+            if job_info is not None and job_info['future'] is future:
+                del self.active_futures[file_path]
+            else:
+                job_info = None
         
         if not job_info:
             if DEBUG_MODE:
                 import threading
                 thread_name = threading.current_thread().name
-                print(f"[{thread_name}] ✗ No job info found after retries: {Path(file_path).name}")
+                print(f"[{thread_name}] ✗ No job info found: {Path(file_path).name}")
             return
         
+        # Fields every result carries back to the main loop
+        job_result = {
+            'file_path': file_path,
+            'file_mtime': job_info['file_mtime'],
+            'asset': job_info['asset'],
+            'cache_key': job_info['cache_key'],
+            'is_sequence': job_info['is_sequence'],
+            'tier': job_info['tier'],
+            'cancel_event': job_info['cancel_event'],
+            'epoch': job_info['epoch']
+        }
+        
         try:
             # Get result from future
             result_data = future.result()
@@ -958,33 +2231,27 @@ class ThumbnailGenerator(QThread):
                 print(f"[{thread_name}] ✓ Worker completed: {Path(file_path).name} ({result_type})")
             
             # Put in result queue for main thread
-            self.result_queue.put({
-                'file_path': file_path,
-                'file_mtime': job_info['file_mtime'],
-                'cache_key': job_info['cache_key'],
-                'is_sequence': job_info['is_sequence'],
-                'success': True,
-                'data': result_data
-            })
+            self.result_queue.put({**job_result, 'success': True, 'data': result_data})
             
             if DEBUG_MODE:
                 import threading
                 thread_name = threading.current_thread().name
                 print(f"[{thread_name}] → Result queued for main thread")
             
+        except (ThumbnailCancelled, CancelledError):
+            # Cancelled before or while running - the main loop drops it (cancel_event is set)
+            job_info['cancel_event'].set()
+            self.result_queue.put({**job_result, 'success': False, 'error': 'cancelled'})
+        
         except Exception as e:
             # Worker encountered an error
             if DEBUG_MODE:
                 print(f"[WORKER] Error generating thumbnail for {Path(file_path).name}: {e}")
             
-            self.result_queue.put({
-                'file_path': file_path,
-                'file_mtime': job_info['file_mtime'],
-                'cache_key': job_info['cache_key'],
-                'is_sequence': job_info['is_sequence'],
-                'success': False,
-                'error': str(e)
-            })
+            self.result_queue.put({**job_result, 'success': False, 'error': str(e)})
+        
+        # Result to deliver, and a pool slot is free again
+        self._wake()
     
     def _numpy_to_pixmap(self, img_data):
         """
@@ -1081,7 +2348,7 @@ class ThumbnailGenerator(QThread):
         try:
             # Reuse existing _generate_thumbnail logic but return numpy array
             # instead of QPixmap
-            from .utils import get_thumbnail_method
+            from .utils import get_thumbnail_method, get_thumbnail_backend
             
             # Check if this is a sequence - use middle frame for thumbnail
             if asset and asset.is_sequence and asset.sequence:
@@ -1095,6 +2362,19 @@ class ThumbnailGenerator(QThread):
             thumbnail_method = get_thumbnail_method(extension)
             
             if thumbnail_method != 'none':
+                # GIL-bound decoders can be routed to worker processes (file_formats.json)
+                if get_thumbnail_backend(extension) == 'process' and self._get_process_pool() is not None:
+                    try:
+                        return self._generate_in_process(file_path, extension)
+                    except BrokenProcessPool as pool_error:
+                        print(f"[ThumbnailGenerator] Process pool failed, using threads: {pool_error}")
+                        with self._process_pool_lock:
+                            self._process_pool = False
+                    except ValueError as size_error:
+                        # Image does not fit the shared memory block - decode this one in the thread
+                        if DEBUG_MODE:
+                            print(f"[ThumbnailGenerator] Process job failed, using thread for {file_path}: {size_error}")
+                
                 # Generate actual thumbnail from file - returns numpy array data
                 return self._generate_image_thumbnail_data(file_path)
             
@@ -1106,6 +2386,67 @@ class ThumbnailGenerator(QThread):
                 print(f"[WORKER] Error in _generate_thumbnail_data: {e}")
             raise
     
+    def _get_process_pool(self):
+        """Get the worker process pool, creating it on first use (None if unavailable)"""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                try:
+                    import multiprocessing
+                    executable = _get_worker_process_executable()
+                    if executable is None:
+                        raise RuntimeError("no standalone Python interpreter found (mayapy)")
+                    
+                    # Spawn - forking a process that runs Qt is not safe
+                    mp_context = multiprocessing.get_context('spawn')
+                    mp_context.set_executable(executable)
+                    self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=mp_context)
+                    print(f"[ThumbnailGenerator] Process backend started ({self.max_workers} processes)")
+                except Exception as e:
+                    print(f"[ThumbnailGenerator] Process backend unavailable, using threads: {e}")
+                    self._process_pool = False
+            return self._process_pool or None
+    
+    def _generate_in_process(self, file_path, extension):
+        """
+        Generate thumbnail data in the process pool - runs in worker thread.
+        
+        The pixel buffer comes back through a shared memory block allocated here
+        (thumbnail_size² RGBA bytes) - only the shape/format metadata is pickled.
+        Cancellation is checked while waiting; a running process job finishes but its
+        result is discarded. Raises ValueError when the decoded image does not fit the
+        block - the caller decodes that file in the thread instead.
+        """
+        import numpy as np
+        from multiprocessing import shared_memory
+        
+        # ACES tags live in the metadata DB - resolve them here, not in the child
+        use_aces = extension in ('.exr', '.tx') and self._uses_aces_view(file_path)
+        
+        shm = shared_memory.SharedMemory(create=True, size=self.thumbnail_size * self.thumbnail_size * 4)
+        try:
+            future = self._process_pool.submit(
+                _process_thumbnail_job, str(file_path), self.thumbnail_size, use_aces, shm.name
+            )
+            while True:
+                try:
+                    meta = future.result(timeout=0.05)
+                    break
+                except FuturesTimeoutError:
+                    if self._is_job_cancelled():
+                        future.cancel()
+                        raise ThumbnailCancelled()
+            
+            if meta is None:
+                return None
+            
+            shape = meta.pop('shape')
+            dtype = np.dtype(meta.pop('dtype'))
+            array = np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+            return {**meta, 'array': array}
+        finally:
+            shm.close()
+            shm.unlink()
+    
     def _generate_image_thumbnail_data(self, file_path):
         """
         Worker-thread-safe version of _generate_image_thumbnail.
@@ -1167,6 +2508,8 @@ class ThumbnailGenerator(QThread):
                         if DEBUG_MODE:
                             print(f"[{thread_name}] ✓ TurboJPEG loaded: {img.shape}")
                         
+                        self._check_cancelled()  # Decoded - still wanted before resize?
+                        
                         # TurboJPEG returns RGB format (not BGR like OpenCV!)
                         height, width = img.shape[:2]
                         channels = img.shape[2] if len(img.shape) == 3 else 1
@@ -1190,6 +2533,8 @@ class ThumbnailGenerator(QThread):
                             'channels': channels,
                             'is_rgb': True  # TurboJPEG outputs RGB
                         }
+                    except ThumbnailCancelled:
+                        raise
                     except Exception as turbo_error:
                         if DEBUG_MODE:
                             print(f"[{thread_name}] ✗ TurboJPEG failed: {turbo_error}, falling back to OpenCV")
@@ -1236,6 +2581,8 @@ class ThumbnailGenerator(QThread):
                     if DEBUG_MODE:
                         print(f"[{thread_name}] ✓ OpenCV loaded: {img.shape}")
                     
+                    self._check_cancelled()  # Decoded - still wanted before convert/resize?
+                    
                     # Keep in BGR format (will be converted to RGB in _numpy_to_pixmap)
                     if len(img.shape) == 3:
                         channels = img.shape[2]
@@ -1304,6 +2651,7 @@ class ThumbnailGenerator(QThread):
                 
                 pil_img = Image.open(str(file_path))
                 pil_img = pil_img.convert('RGB')
+                self._check_cancelled()  # Decoded - still wanted before resize?
                 pil_img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
                 
                 img_array = np.array(pil_img)
@@ -1320,6 +2668,8 @@ class ThumbnailGenerator(QThread):
                     'channels': channels,
                     'is_rgb': True  # PIL outputs RGB
                 }
+            except ThumbnailCancelled:
+                raise
             except Exception as pil_error:
                 if DEBUG_MODE:
                     print(f"[{thread_name}] ✗ PIL fallback failed: {pil_error}")
@@ -1462,24 +2812,14 @@ class ThumbnailGenerator(QThread):
                     print(f"[EXR-DATA] No usable channels found")
                 return None
             
+            self._check_cancelled()  # Decoded - still wanted before tonemapping?
+            
             # Check if we should use ACES color management
-            use_aces = False
-            if self.metadata_manager:
-                try:
-                    file_metadata = self.metadata_manager.get_file_metadata(str(file_path))
-                    file_tags = file_metadata.get('tags', [])
-                    tag_names_lower = [tag['name'].lower() for tag in file_tags]
-                    
-                    # Check for ACEScg tag (case-insensitive)
-                    if "acescg" in tag_names_lower or "srgb(aces)" in tag_names_lower:
-                        use_aces = True
-                        if DEBUG_MODE:
-                            import threading
-                            thread_name = threading.current_thread().name
-                            print(f"[{thread_name}] → EXR: Using ACES view transform")
-                except Exception as tag_error:
-                    if DEBUG_MODE:
-                        print(f"[EXR-DATA] Tag check failed: {tag_error}")
+            use_aces = self._uses_aces_view(file_path)
+            if use_aces and DEBUG_MODE:
+                import threading
+                thread_name = threading.current_thread().name
+                print(f"[{thread_name}] → EXR: Using ACES view transform")
             
             # Apply tone mapping (ACES or standard)
             if use_aces:
@@ -1511,6 +2851,8 @@ class ThumbnailGenerator(QThread):
             # Convert to 8-bit
             rgb_8bit = (rgb_tonemapped * 255).astype(np.uint8)
             
+            self._check_cancelled()  # Tonemapped - still wanted before resize?
+            
             # Resize if needed
             if width > self.thumbnail_size or height > self.thumbnail_size:
                 import cv2
@@ -1533,6 +2875,22 @@ class ThumbnailGenerator(QThread):
                 print(f"[EXR-DATA] Error: {e}")
             raise
     
+    def _uses_aces_view(self, file_path):
+        """Check if file is tagged ACEScg / sRGB(ACES) - needs the ACES view transform"""
+        if not self.metadata_manager:
+            return False
+        try:
+            file_metadata = self.metadata_manager.get_file_metadata(str(file_path))
+            file_tags = file_metadata.get('tags', [])
+            tag_names_lower = [tag['name'].lower() for tag in file_tags]
+            
+            # Check for ACEScg tag (case-insensitive)
+            return "acescg" in tag_names_lower or "srgb(aces)" in tag_names_lower
+        except Exception as tag_error:
+            if DEBUG_MODE:
+                print(f"[ACES] Tag check failed: {tag_error}")
+            return False
+    
     def _generate_tx_thumbnail_data(self, file_path):
         """
         Generate TX (RenderMan texture) thumbnail as numpy array (worker thread safe).
@@ -1556,24 +2914,14 @@ class ThumbnailGenerator(QThread):
             height, width = rgb.shape[:2]
             channels = rgb.shape[2] if len(rgb.shape) == 3 else 1
             
+            self._check_cancelled()  # Decoded - still wanted before tonemapping?
+            
             # Check if we should use ACES color management (same logic as EXR)
-            use_aces = False
-            if self.metadata_manager:
-                try:
-                    file_metadata = self.metadata_manager.get_file_metadata(str(file_path))
-                    file_tags = file_metadata.get('tags', [])
-                    tag_names_lower = [tag['name'].lower() for tag in file_tags]
-                    
-                    # Check for ACEScg tag (case-insensitive)
-                    if "acescg" in tag_names_lower or "srgb(aces)" in tag_names_lower:
-                        use_aces = True
-                        if DEBUG_MODE:
-                            import threading
-                            thread_name = threading.current_thread().name
-                            print(f"[{thread_name}] → TX: Using ACES view transform")
-                except Exception as tag_error:
-                    if DEBUG_MODE:
-                        print(f"[TX-DATA] Tag check failed: {tag_error}")
+            use_aces = self._uses_aces_view(file_path)
+            if use_aces and DEBUG_MODE:
+                import threading
+                thread_name = threading.current_thread().name
+                print(f"[{thread_name}] → TX: Using ACES view transform")
             
             # Apply tone mapping (ACES or standard)
             if use_aces:
@@ -1631,9 +2979,11 @@ class ThumbnailGenerator(QThread):
             try:
                 from psd_tools import PSDImage
                 psd = PSDImage.open(str(file_path))
+                self._check_cancelled()  # Parsed - still wanted before compositing?
                 pil_img = psd.composite()
                 
                 if pil_img:
+                    self._check_cancelled()  # Composited - still wanted before resize?
                     pil_img = pil_img.convert('RGB')
                     pil_img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
                     
@@ -1647,6 +2997,8 @@ class ThumbnailGenerator(QThread):
                         'channels': 3,
                         'is_rgb': True  # PIL/psd-tools output RGB
                     }
+            except ThumbnailCancelled:
+                raise
             except Exception as psd_error:
                 if DEBUG_MODE:
                     print(f"[PSD-DATA] psd-tools failed: {psd_error}")
@@ -1655,6 +3007,7 @@ class ThumbnailGenerator(QThread):
             Image.MAX_IMAGE_PIXELS = None
             pil_img = Image.open(str(file_path))
             pil_img = pil_img.convert('RGB')
+            self._check_cancelled()  # Decoded - still wanted before resize?
             pil_img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
             
             img_array = np.array(pil_img)
@@ -1704,6 +3057,10 @@ class ThumbnailGenerator(QThread):
                 doc.close()
                 return None
             
+            if self._is_job_cancelled():
+                doc.close()
+                raise ThumbnailCancelled()
+            
             # Get first page
             page = doc[0]
             
@@ -1733,6 +3090,8 @@ class ThumbnailGenerator(QThread):
                 'is_rgb': True  # PyMuPDF outputs RGB
             }
             
+        except ThumbnailCancelled:
+            raise
         except Exception as e:
             if DEBUG_MODE:
                 print(f"[PDF-DATA] Error: {e}")
@@ -3741,3 +5100,93 @@ class ThumbnailGenerator(QThread):
         painter.end()
         
         return pixmap
+
+
+def _get_worker_process_executable():
+    """
+    Python interpreter for thumbnail worker processes.
+    
+    Inside Maya sys.executable is the GUI binary - spawn the sibling mayapy instead.
+    
+    Returns:
+        str or None: Interpreter path, None if no usable interpreter exists
+    """
+    executable = Path(sys.executable)
+    if executable.stem.lower() not in ('maya', 'maya.bin'):
+        return str(executable)
+    
+    for name in ('mayapy.exe', 'mayapy'):
+        candidate = executable.parent / name
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+class _ProcessThumbnailWorker:
+    """
+    Minimal stand-in for ThumbnailGenerator inside a worker process.
+    
+    Borrows the decoding methods, without the Qt thread, caches or metadata DB.
+    Jobs are not cancellable here - the parent drops results it no longer needs.
+    """
+    
+    metadata_manager = None
+    
+    _generate_image_thumbnail_data = ThumbnailGenerator._generate_image_thumbnail_data
+    _generate_exr_thumbnail_data = ThumbnailGenerator._generate_exr_thumbnail_data
+    _generate_tx_thumbnail_data = ThumbnailGenerator._generate_tx_thumbnail_data
+    _generate_psd_thumbnail_data = ThumbnailGenerator._generate_psd_thumbnail_data
+    _generate_pdf_thumbnail_data = ThumbnailGenerator._generate_pdf_thumbnail_data
+    _generate_video_thumbnail_data = ThumbnailGenerator._generate_video_thumbnail_data
+    _get_opencv_imread_flags = ThumbnailGenerator._get_opencv_imread_flags
+    
+    def __init__(self, thumbnail_size, use_aces):
+        self.thumbnail_size = thumbnail_size
+        self.use_aces = use_aces
+    
+    def _uses_aces_view(self, file_path):
+        return self.use_aces
+    
+    def _is_job_cancelled(self):
+        return False
+    
+    def _check_cancelled(self):
+        pass
+
+
+def _process_thumbnail_job(file_path, thumbnail_size, use_aces, shm_name):
+    """
+    Generate thumbnail data in a worker process.
+    
+    The pixels are written into the shared memory block created by the parent,
+    so only a small metadata dict is pickled back.
+    
+    Returns:
+        dict or None: Thumbnail metadata with 'shape' and 'dtype' instead of 'array'
+    """
+    from multiprocessing import shared_memory
+    
+    worker = _ProcessThumbnailWorker(thumbnail_size, use_aces)
+    data = worker._generate_image_thumbnail_data(file_path)
+    if data is None:
+        return None
+    
+    array = data.pop('array')
+    
+    # The parent owns the block - keep this process's resource tracker away from it
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        if os.name == 'posix':
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+    try:
+        if array.nbytes > shm.size:
+            raise ValueError(f"Thumbnail buffer too large: {array.shape}")
+        import numpy as np
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    finally:
+        shm.close()
+    
+    return {**data, 'shape': array.shape, 'dtype': array.dtype.str}
@@ -50,6 +50,12 @@ class ThumbnailDelegate(QStyledItemDelegate):
         # Clear scaled cache when size changes
         self._scaled_cache.clear()
     
+    def invalidate_thumbnails(self, cache_keys):
+        """Drop scaled thumbnails of these cache keys (files changed on disk)"""
+        cache_keys = set(cache_keys)
+        for key in [key for key in self._scaled_cache if key[0] in cache_keys]:
+            del self._scaled_cache[key]
+    
     def draw_gradient_placeholder(self, painter, rect, extension):
         """Draw attractive gradient placeholder for file type"""
         from .utils import get_icon_colors
@@ -118,7 +124,7 @@ class ThumbnailDelegate(QStyledItemDelegate):
         if self.icon_mode:
             self._paint_grid_mode(painter, option, asset)
         else:
-            self._paint_list_mode(painter, option, asset)
+            self._paint_list_mode(painter, option, asset, index)
         
         painter.restore()
     
@@ -207,8 +213,12 @@ class ThumbnailDelegate(QStyledItemDelegate):
         elided_text = metrics.elidedText(asset.name, Qt.ElideMiddle, text_rect.width() - 10)
         painter.drawText(text_rect, Qt.AlignTop | Qt.AlignHCenter, elided_text)
     
-    def _paint_list_mode(self, painter, option, asset):
-        """Paint item in list mode with columns (Name, Type, Size, Date)"""
+    def _paint_list_mode(self, painter, option, asset, index):
+        """
+        Paint item in list mode with columns (Name, Type, Size, Date).
+        Size / date texts come from the model - a placeholder until stat info is loaded
+        in the background, so painting never waits for the file system.
+        """
         rect = option.rect
         
         # Get column widths from browser's header splitter if available
@@ -328,12 +338,12 @@ class ThumbnailDelegate(QStyledItemDelegate):
         # ===== COLUMN 3: SIZE =====
         size_rect = QRect(size_x + 5, rect.y(), size_width - 10, rect.height())
         painter.setFont(QFont(UI_FONT, 8))
-        painter.drawText(size_rect, Qt.AlignVCenter, asset.get_size_string())
+        painter.drawText(size_rect, Qt.AlignVCenter, index.sibling(index.row(), 1).data(Qt.DisplayRole) or "")
         
         # ===== COLUMN 4: DATE =====
         date_rect = QRect(date_x + 5, rect.y(), date_width - 10, rect.height())
         painter.setFont(QFont(UI_FONT, 8))
-        painter.drawText(date_rect, Qt.AlignVCenter, asset.get_modified_string())
+        painter.drawText(date_rect, Qt.AlignVCenter, index.sibling(index.row(), 2).data(Qt.DisplayRole) or "")
     
     def _draw_sequence_badge(self, painter, x, y, width, height, frame_count):
         """
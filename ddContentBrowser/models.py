@@ -8,7 +8,15 @@ License: MIT
 
 import os
 import re
+import sys
+import stat
 import time
+import bisect
+import fnmatch
+import threading
+from collections import deque
+from itertools import compress
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from datetime import datetime
 
@@ -36,6 +44,9 @@ from .utils import (
 # Debug flag - set to False to disable verbose logging
 DEBUG_MODE = False  # Set to True for debugging
 
+# Windows scandir (FindNextFile) returns size / mtime with the listing - DirEntry.stat() is free
+DIR_ENTRY_STAT_CACHED = os.name == 'nt'
+
 
 def natural_sort_key(text):
     """
@@ -48,14 +59,287 @@ def natural_sort_key(text):
     return [convert(c) for c in re.split(r'(\d+)', text)]
 
 
+# Key for SearchMatcher.filter() over AssetItems / os.DirEntry objects
+name_of = attrgetter('name')
+
+
+class SearchMatcher:
+    """
+    Search text compiled once, matched against many names.
+    
+    By default the text is one literal substring, spaces and all. Term syntax
+    (terms=True, the "term_search" setting):
+    - Space separated terms must all match (AND): beauty v012
+    - OR (or |) between terms: exr | tif
+    - -term or !term excludes: beauty -proxy
+    - Terms with * ? [ are globs matched against the whole name: *.exr
+    - "quoted text" is one literal term, spaces included
+    
+    In regex mode the whole text is one pattern - an invalid pattern falls back to
+    plain text search of the whole text (no term syntax).
+    """
+    
+    _TOKEN_RE = re.compile(r'"([^"]*)"|([^\s|]+)|(\|)')
+    
+    def __init__(self, text, case_sensitive=False, regex=False, terms=False):
+        """
+        Args:
+            text: Search text
+            case_sensitive: Match case
+            regex: Treat text as a regular expression
+            terms: Parse plain text into terms (AND / OR / exclusions / globs) instead of one substring
+        """
+        self.text = text
+        self.case_sensitive = case_sensitive
+        self.regex = regex
+        self.terms = terms
+        if regex:
+            self._groups = None
+        elif terms:
+            self._groups = self._parse()
+        else:
+            self._groups = [([('text', text)], [])] if text else []
+        self.match = self._compile()  # Callable(name) -> truthy - bind it locally in hot loops
+    
+    def __call__(self, name):
+        """Check if name matches (truthy / falsy)"""
+        return self.match(name)
+    
+    def filter(self, items, key=None):
+        """
+        Items whose name matches, in order - one loop with the compiled matcher bound locally
+        
+        Args:
+            items: Names, or objects with key(item) -> name (e.g. key=name_of)
+        """
+        match = self.match
+        if key is None:
+            return [item for item in items if match(item)]
+        return [item for item in items if match(key(item))]
+    
+    def narrows(self, previous):
+        """
+        Check if every name this matches is matched by previous too - the results of
+        previous can be filtered instead of everything ("tex" -> "text", "beauty" -> "beauty -proxy")
+        
+        Args:
+            previous: SearchMatcher of the earlier search (None = no search, matches all)
+        """
+        if previous is None:
+            return True
+        if (previous.case_sensitive != self.case_sensitive or previous.regex != self.regex or
+                previous.terms != self.terms):
+            return False
+        if previous.text == self.text:
+            return True
+        if self.regex or len(previous._groups) > 1:
+            return False
+        if not previous._groups:
+            return True  # Blank search matches all
+        if not self._groups:
+            return False
+        
+        fold = (lambda text: text) if self.case_sensitive else str.lower
+        old_positives, old_negatives = previous._groups[0]
+        for positives, negatives in self._groups:
+            # Each earlier term must be implied: a longer word containing it, the same glob, the same exclusion
+            for kind, text in old_positives:
+                if not any(new_kind == kind and (fold(text) in fold(new_text) if kind == 'text' else text == new_text)
+                           for new_kind, new_text in positives):
+                    return False
+            if not set(old_negatives) <= set(negatives):
+                return False
+        return True
+    
+    def _compile(self):
+        """Build the match function - Callable(name) -> truthy"""
+        if self.regex:
+            try:
+                return re.compile(self.text, 0 if self.case_sensitive else re.IGNORECASE).search
+            except re.error:
+                pass  # Invalid regex - plain text search
+            return self._substring(self.text)
+        
+        groups = self._groups
+        if not groups:
+            return lambda name: True
+        
+        # Most searches are a single word - no per-name term loop
+        if len(groups) == 1 and len(groups[0][0]) == 1 and not groups[0][1]:
+            kind, term = groups[0][0][0]
+            if kind == 'text':
+                return self._substring(term)
+        
+        case_sensitive = self.case_sensitive
+        compiled = [([self._term(term) for term in positives], [self._term(term) for term in negatives])
+                    for positives, negatives in groups]
+        
+        def match(name):
+            if not case_sensitive:
+                name = name.lower()
+            for positives, negatives in compiled:
+                if all(test(name) for test in positives) and not any(test(name) for test in negatives):
+                    return True
+            return False
+        return match
+    
+    def _substring(self, needle):
+        """Plain substring test - needle lowered once, not per name"""
+        if self.case_sensitive:
+            return lambda name: needle in name
+        needle = needle.lower()
+        return lambda name: needle in name.lower()
+    
+    def _term(self, term):
+        """Test for one term against an already lowered (case insensitive) name"""
+        kind, text = term
+        if not self.case_sensitive:
+            text = text.lower()
+        if kind == 'glob':
+            return re.compile(fnmatch.translate(text)).match
+        return lambda name: text in name
+    
+    def _parse(self):
+        """Split plain text into OR groups of (positive terms, negative terms)"""
+        groups = [([], [])]
+        for quoted, word, bar in self._TOKEN_RE.findall(self.text):
+            if bar or word == 'OR':
+                if groups[-1][0] or groups[-1][1]:
+                    groups.append(([], []))
+                continue
+            
+            negative = False
+            if quoted:
+                term = ('text', quoted)
+            else:
+                if word[0] in '-!' and len(word) > 1:
+                    negative, word = True, word[1:]
+                term = ('glob' if any(c in word for c in '*?[') else 'text', word)
+            groups[-1][1 if negative else 0].append(term)
+        
+        return [group for group in groups if group[0] or group[1]]
+
+
 # ============================================================================
 # IMAGE SEQUENCE
 # ============================================================================
 
+class FrameRanges:
+    """
+    Sorted frame numbers stored as runs of consecutive frames.
+    
+    A continuous 100k frame sequence is one (start, end) run; every hole adds one.
+    Index <-> frame lookups bisect the runs - constant time for continuous sequences.
+    """
+    
+    __slots__ = ('_starts', '_ends', '_offsets', '_count')
+    
+    def __init__(self, frames):
+        """
+        Args:
+            frames: Frame numbers in ascending order
+        """
+        starts, ends, offsets = [], [], []
+        count = 0
+        for frame in frames:
+            if ends and frame == ends[-1] + 1:
+                ends[-1] = frame
+            else:
+                starts.append(frame)
+                ends.append(frame)
+                offsets.append(count)
+            count += 1
+        self._starts = starts
+        self._ends = ends
+        self._offsets = offsets   # Index of each run's first frame
+        self._count = count
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+    
+    def __getitem__(self, index):
+        """Frame number at a list index"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("frame index out of range")
+        run = bisect.bisect_right(self._offsets, index) - 1
+        return self._starts[run] + index - self._offsets[run]
+    
+    def index(self, frame):
+        """List index of a frame number, -1 if it is not in the sequence"""
+        run = bisect.bisect_left(self._ends, frame)
+        if run < len(self._ends) and self._starts[run] <= frame:
+            return self._offsets[run] + frame - self._starts[run]
+        return -1
+    
+    @property
+    def runs(self):
+        """[(first, last), ...] of the consecutive frame runs"""
+        return list(zip(self._starts, self._ends))
+    
+    def holes(self):
+        """[(first, last), ...] of the missing frame ranges between the runs"""
+        return [(end + 1, start - 1) for end, start in zip(self._ends, self._starts[1:]) if start > end + 1]
+
+
+class SequenceFiles:
+    """
+    Read-only list view of a sequence's frame paths - Path objects are built on access.
+    Supports len(), indexing, slicing and iteration like the list it replaces.
+    """
+    
+    __slots__ = ('_sequence',)
+    
+    def __init__(self, sequence):
+        self._sequence = sequence
+    
+    def __len__(self):
+        return len(self._sequence._frames)
+    
+    def __bool__(self):
+        return len(self._sequence._frames) > 0
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Path(self._sequence._path_str(i)) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return Path(self._sequence._path_str(index))
+    
+    def __iter__(self):
+        for path_str in self._sequence.iter_path_strings():
+            yield Path(path_str)
+
+
+_sequence_size_executor = None
+_sequence_size_lock = threading.Lock()
+
+
+def _submit_sequence_size(sequence):
+    """Run sequence.compute_total_size() on the shared background pool"""
+    global _sequence_size_executor
+    with _sequence_size_lock:
+        if _sequence_size_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _sequence_size_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="SequenceSize")
+    _sequence_size_executor.submit(sequence.compute_total_size)
+
+
 class ImageSequence:
     """
     Represents an image sequence (e.g. render_0001.jpg, render_0002.jpg, ...)
     
+    Stored compactly: frame numbers as runs (FrameRanges), file paths derived from
+    directory, base name, padding and extension when accessed. Only names that cannot
+    be rebuilt that way (hash / printf style names) keep their path strings.
+    
     Attributes:
         base_name: Base name without frame number (e.g. 'render')
         pattern: Pattern string (e.g. 'render_####.jpg')
@@ -64,199 +348,439 @@ class ImageSequence:
         padding: Number of digits in frame number
         separator: Separator character ('_', '.', '#', '%')
         extension: File extension (e.g. '.jpg')
-        files: List of Path objects (sorted by frame number)
+        files: List-like view of Path objects (sorted by frame number)
         missing_frames: List of missing frame numbers
     """
     
-    def __init__(self, pattern: str, files: list):
+    __slots__ = (
+        'pattern', 'base_name', 'padding', 'separator', 'extension', 'directory',
+        'first_frame', 'last_frame', '_frames', '_prefix', '_paths',
+        '_total_size', '_size_requested', 'size_listener'
+    )
+    
+    def __init__(self, pattern: str, files: list, frames: list = None, name_info: tuple = None):
         """
         Initialize image sequence from pattern and file list.
         
         Args:
             pattern: Sequence pattern (e.g. 'render_####.jpg')
-            files: List of Path objects belonging to this sequence
+            files: Paths (Path objects or strings) belonging to this sequence
+            frames: Frame numbers of files, both already sorted by frame
+                (utils.group_sequence_names) - the names are not parsed again
+            name_info: (base_name, padding, separator) of the names, given with frames
         """
+        from .utils import detect_sequence_pattern, extract_frame_number
+        
         self.pattern = pattern
-        self.files = sorted(files, key=lambda p: self._extract_frame(p.name))
         
-        if not self.files:
+        if not files:
             raise ValueError("ImageSequence requires at least one file")
         
-        # Parse pattern to extract metadata
-        from .utils import detect_sequence_pattern, get_sequence_frame_range
-        
-        first_file = self.files[0]
-        pattern_info = detect_sequence_pattern(first_file.name)
-        
-        if pattern_info:
-            self.base_name, _, self.padding, self.separator = pattern_info
-        else:
-            # Fallback for single files treated as sequences
-            self.base_name = first_file.stem
-            self.padding = 0
-            self.separator = ''
-        
-        self.extension = first_file.suffix
-        self.directory = first_file.parent
-        
-        # Calculate frame range
-        self.first_frame, self.last_frame, self.missing_frames = get_sequence_frame_range(self.files)
-        
-        # Frame to file mapping for fast lookup
-        self._frame_map = {}
-        for file_path in self.files:
-            frame_num = self._extract_frame(file_path.name)
-            if frame_num is not None:
-                self._frame_map[frame_num] = file_path
+        paths = [os.fspath(p) for p in files]
+        if frames is None:
+            # Parse every name once - frame numbers sort the files and give the range
+            numbered = sorted(((extract_frame_number(os.path.basename(p)), p) for p in paths),
+                              key=lambda item: item[0])
+            frames = [frame for frame, p in numbered]
+            paths = [p for frame, p in numbered]
+            name_info = None
+        
+        directory, first_name = os.path.split(paths[0])
+        if name_info is None:
+            pattern_info = detect_sequence_pattern(first_name)
+            if pattern_info:
+                name_info = (pattern_info[0], pattern_info[2], pattern_info[3])
+            else:
+                # Fallback for single files treated as sequences
+                name_info = (os.path.splitext(first_name)[0], 0, '')
+        self.base_name, self.padding, self.separator = name_info
+        
+        self.extension = os.path.splitext(first_name)[1]
+        self.directory = Path(directory)
+        
+        self._frames = FrameRanges(frames)
+        self.first_frame = frames[0]
+        self.last_frame = frames[-1]
+        
+        # Paths are rebuilt from the frame numbers - kept only if a name doesn't round-trip
+        self._prefix = os.path.join(directory, f"{self.base_name}{self.separator}")
+        self._paths = None
+        if self.separator not in ('_', '.') or any(
+                path != self._frame_path_str(frame) for frame, path in zip(frames, paths)):
+            self._paths = paths
+        
+        self._total_size = None
+        self._size_requested = False
+        self.size_listener = None  # Callable(sequence) - called from a worker thread when total_size is known
+    
+    def _frame_path_str(self, frame):
+        """Path string of a frame number (names that round-trip)"""
+        return f"{self._prefix}{frame:0{self.padding}d}{self.extension}"
+    
+    def _path_str(self, index):
+        """Path string of the frame at a list index"""
+        if self._paths is not None:
+            return self._paths[index]
+        return self._frame_path_str(self._frames[index])
+    
+    def iter_path_strings(self):
+        """Path strings of all frames in order - no Path objects"""
+        if self._paths is not None:
+            return iter(self._paths)
+        return (self._frame_path_str(frame) for frame in self._frames)
     
-    def _extract_frame(self, filename: str) -> int:
-        """Extract frame number from filename"""
-        from .utils import extract_frame_number
-        return extract_frame_number(filename)
+    @property
+    def files(self):
+        """List-like view of the frame paths (Path objects built on access)"""
+        return SequenceFiles(self)
+    
+    @property
+    def missing_frames(self):
+        """List of missing frame numbers"""
+        return [frame for first, last in self._frames.holes() for frame in range(first, last + 1)]
     
     def get_frame_path(self, frame_number: int) -> Path:
         """
         Get file path for a specific frame number.
         Returns None if frame doesn't exist.
         """
-        return self._frame_map.get(frame_number)
+        index = self._frames.index(frame_number)
+        return Path(self._path_str(index)) if index >= 0 else None
     
     def get_frame_index(self, frame_number: int) -> int:
         """
         Get list index for a frame number.
         Returns -1 if frame doesn't exist.
         """
-        for i, file_path in enumerate(self.files):
-            if self._extract_frame(file_path.name) == frame_number:
-                return i
-        return -1
+        return self._frames.index(frame_number)
     
     def get_middle_frame(self) -> Path:
         """Get the middle frame of the sequence (for thumbnails)"""
-        if not self.files:
-            return None
-        middle_index = len(self.files) // 2
-        return self.files[middle_index]
+        return Path(self._path_str(len(self._frames) // 2))
     
     def get_first_frame_path(self) -> Path:
         """Get the first frame file path"""
-        return self.files[0] if self.files else None
+        return Path(self._path_str(0))
     
     def get_last_frame_path(self) -> Path:
         """Get the last frame file path"""
-        return self.files[-1] if self.files else None
+        return Path(self._path_str(len(self._frames) - 1))
     
     @property
     def frame_count(self) -> int:
         """Total number of frames in sequence"""
-        return len(self.files)
+        return len(self._frames)
     
     @property
     def is_continuous(self) -> bool:
         """Check if sequence has no missing frames"""
-        return len(self.missing_frames) == 0
+        return not self._frames.holes()
     
     @property
-    def total_size(self) -> int:
-        """Total size of all files in bytes"""
+    def total_size(self):
+        """
+        Total size of all files in bytes - None while it is being calculated.
+        
+        The first access starts compute_total_size() in the background; size_listener
+        is called once the value is known.
+        """
+        if self._total_size is None:
+            self.request_total_size()
+        return self._total_size
+    
+    def request_total_size(self):
+        """Calculate total_size in the background (once)"""
+        if self._total_size is not None or self._size_requested:
+            return
+        self._size_requested = True
+        _submit_sequence_size(self)
+    
+    def compute_total_size(self):
+        """Stat every frame and cache the total (blocking)"""
         total = 0
-        for file_path in self.files:
+        for path_str in self.iter_path_strings():
             try:
-                total += file_path.stat().st_size
-            except:
+                total += os.stat(path_str).st_size
+            except OSError:
                 pass
+        self._total_size = total
+        
+        listener = self.size_listener
+        if listener is not None:
+            listener(self)
         return total
     
     def __repr__(self):
         return f"ImageSequence('{self.pattern}', frames={self.frame_count}, range={self.first_frame}-{self.last_frame})"
     
     def __len__(self):
-        return len(self.files)
+        return len(self._frames)
 
 
 class AssetItem:
-    """Asset item representation with lazy stat loading"""
+    """
+    Asset item representation with lazy stat loading
+    
+    Kept small for 100k+ listings: __slots__, the path stored as a string (Path built
+    on first use), interned extension, one int of flags for folder / sequence / type
+    attributes, and the modified datetime derived from the timestamp on demand.
+    """
     
-    def __init__(self, file_path, lazy_load=False):
-        self.file_path = Path(file_path)
-        self.name = self.file_path.name
-        self.is_folder = self.file_path.is_dir()
-        self.extension = "" if self.is_folder else self.file_path.suffix.lower()
+    __slots__ = (
+        'path_str', '_path', 'name', 'extension', 'category', 'sequence',
+        '_flags', '_size', '_modified_time', '_sort_key'
+    )
+    
+    # _flags bits
+    _FOLDER = 1 << 0
+    _SEQUENCE = 1 << 1
+    _STAT_LOADED = 1 << 2
+    _GENERATE_THUMBNAIL = 1 << 3
+    _MAYA = 1 << 4
+    _IMAGE = 1 << 5
+    _SCRIPT = 1 << 6
+    _PDF = 1 << 7
+    _HDA = 1 << 8
+    _BLEND = 1 << 9
+    _SBSAR = 1 << 10
+    _VIDEO = 1 << 11
+    
+    # Registry category -> type flag
+    _CATEGORY_FLAGS = {
+        "maya": _MAYA,
+        "images": _IMAGE,
+        "scripts": _SCRIPT,
+        "text": _SCRIPT,
+        "pdf": _PDF,
+        "houdini": _HDA,
+        "blender": _BLEND,
+        "substance": _SBSAR,
+        "video": _VIDEO,
+    }
+    
+    # Per-extension (extension, category, flags) - registry lookups once per extension, not per item
+    _extension_info = {}
+    _extension_info_config = None  # File formats config the cache was built from
+    
+    def __init__(self, file_path, lazy_load=False, is_folder=None):
+        """
+        Args:
+            file_path: File or folder path
+            lazy_load: Defer stat() until size / date is needed
+            is_folder: Known folder flag - None stats the path to find out
+        """
+        if isinstance(file_path, Path):
+            self._path = file_path
+            self.path_str = str(file_path)
+        else:
+            self._path = None
+            self.path_str = os.fspath(file_path)
+        self.name = os.path.basename(self.path_str.rstrip('/\\')) or self.path_str
+        if is_folder is None:
+            is_folder = os.path.isdir(self.path_str)
         
         # Image sequence support
-        self.is_sequence = False
         self.sequence = None  # ImageSequence object if is_sequence=True
         
         # Lazy loading - csak akkor töltjük be a stat infót, ha kell
-        self._stat_loaded = False
         self._size = None
         self._modified_time = None
-        self._modified = None
+        self._sort_key = None  # See sort_key
+        
+        if is_folder:
+            self.extension = ""
+            self.category = None
+            self._flags = self._FOLDER
+        else:
+            extension = os.path.splitext(self.name)[1].lower()
+            info = AssetItem._extension_info.get(extension)
+            if info is None:
+                info = AssetItem._get_extension_info(extension)
+            self.extension, self.category, self._flags = info
         
         # Ha nem lazy load, azonnal betöltjük (backward compatibility)
         if not lazy_load:
             self._load_stat()
-        
+    
+    @classmethod
+    def _get_extension_info(cls, extension):
+        """Interned extension, registry category and type flags for extension (cached)"""
         # Get category from registry
-        self.category = get_extension_category(self.extension) if not self.is_folder else None
-        
-        # Fájltípus attribútumok - using registry
-        self.is_maya_file = self.category == "maya"
-        self.is_image_file = self.category == "images"
-        self.is_script_file = self.category in ["scripts", "text"]
-        self.is_pdf_file = self.category == "pdf"
-        self.is_hda_file = self.category == "houdini"
-        self.is_blend_file = self.category == "blender"
-        self.is_sbsar_file = self.category == "substance"
-        self.is_video_file = self.category == "video"
-        
+        category = get_extension_category(extension)
+        flags = cls._CATEGORY_FLAGS.get(category, 0)
         # Thumbnail generation - using registry
-        self.should_generate_thumbnail = not self.is_folder and utils_should_generate_thumbnail(self.extension)
+        if utils_should_generate_thumbnail(extension):
+            flags |= cls._GENERATE_THUMBNAIL
+        info = (sys.intern(extension), category, flags)
+        cls._extension_info[extension] = info
+        return info
+    
+    @classmethod
+    def sync_extension_info(cls):
+        """Drop cached registry lookups if the file formats config was reloaded since"""
+        from .utils import ensure_file_formats_config
+        config = ensure_file_formats_config()
+        if config is not cls._extension_info_config:
+            cls._extension_info.clear()
+            cls._extension_info_config = config
+    
+    def _set_flag(self, flag, value):
+        if value:
+            self._flags |= flag
+        else:
+            self._flags &= ~flag
+    
+    @property
+    def file_path(self):
+        """Path object - built on first access"""
+        if self._path is None:
+            self._path = Path(self.path_str)
+        return self._path
+    
+    @property
+    def is_folder(self):
+        return bool(self._flags & self._FOLDER)
+    
+    @property
+    def is_sequence(self):
+        return bool(self._flags & self._SEQUENCE)
+    
+    @is_sequence.setter
+    def is_sequence(self, value):
+        self._set_flag(self._SEQUENCE, value)
+    
+    @property
+    def should_generate_thumbnail(self):
+        return bool(self._flags & self._GENERATE_THUMBNAIL)
+    
+    @should_generate_thumbnail.setter
+    def should_generate_thumbnail(self, value):
+        self._set_flag(self._GENERATE_THUMBNAIL, value)
+    
+    # Fájltípus attribútumok - using registry
+    @property
+    def is_maya_file(self):
+        return bool(self._flags & self._MAYA)
+    
+    @property
+    def is_image_file(self):
+        return bool(self._flags & self._IMAGE)
+    
+    @property
+    def is_script_file(self):
+        return bool(self._flags & self._SCRIPT)
+    
+    @property
+    def is_pdf_file(self):
+        return bool(self._flags & self._PDF)
+    
+    @property
+    def is_hda_file(self):
+        return bool(self._flags & self._HDA)
+    
+    @property
+    def is_blend_file(self):
+        return bool(self._flags & self._BLEND)
+    
+    @property
+    def is_sbsar_file(self):
+        return bool(self._flags & self._SBSAR)
+    
+    @property
+    def is_video_file(self):
+        return bool(self._flags & self._VIDEO)
+    
+    @classmethod
+    def from_dir_entry(cls, entry, is_folder=None):
+        """
+        Create from an os.DirEntry without touching the file system again.
+        
+        The folder flag comes from the scandir() call. On Windows size and mtime came
+        with the listing too; elsewhere they are still loaded lazily (one stat).
+        
+        Args:
+            entry: os.DirEntry from os.scandir()
+            is_folder: Folder flag if the caller already classified the entry
+        """
+        if is_folder is None:
+            try:
+                is_folder = entry.is_dir()
+            except OSError:
+                is_folder = False
+        
+        asset = cls(entry.path, lazy_load=True, is_folder=is_folder)
+        if DIR_ENTRY_STAT_CACHED:
+            try:
+                asset._apply_stat(entry.stat())
+            except OSError:
+                pass  # Loaded lazily later
+        return asset
+    
+    @classmethod
+    def from_stat(cls, file_path, stat_info):
+        """Create from an os.stat() result - kind, size and mtime are already known"""
+        asset = cls(file_path, lazy_load=True, is_folder=stat.S_ISDIR(stat_info.st_mode))
+        asset._apply_stat(stat_info)
+        return asset
+    
+    @classmethod
+    def from_listing(cls, file_path, is_folder, size, mtime):
+        """Create from a stored listing entry (DirectoryListingCache) - no file system access"""
+        asset = cls(file_path, lazy_load=True, is_folder=is_folder)
+        asset._size = 0 if is_folder else size
+        asset._modified_time = mtime
+        asset._flags |= cls._STAT_LOADED
+        return asset
+    
+    def _apply_stat(self, stat_info):
+        """Take size / modified time from a stat result"""
+        self._size = 0 if self._flags & self._FOLDER else stat_info.st_size
+        self._modified_time = stat_info.st_mtime
+        self._flags |= self._STAT_LOADED
     
     def _load_stat(self):
         """Load file stat info (size, modified time) - called on demand"""
-        if self._stat_loaded:
+        if self._flags & self._STAT_LOADED:
             return
         
         try:
-            if self.file_path.exists():
-                stat_info = self.file_path.stat()
-                self._size = 0 if self.is_folder else stat_info.st_size
-                self._modified_time = stat_info.st_mtime
-                # Convert to datetime for filtering
-                self._modified = datetime.fromtimestamp(stat_info.st_mtime)
-            else:
-                self._size = 0
-                self._modified_time = 0
-                self._modified = datetime.fromtimestamp(0)
+            # One stat() - a missing file raises like a network error does
+            self._apply_stat(os.stat(self.path_str))
         except Exception as e:
             # Hálózati hiba esetén alapértékek
             self._size = 0
             self._modified_time = 0
-            self._modified = datetime.fromtimestamp(0)
-        
-        self._stat_loaded = True
+            self._flags |= self._STAT_LOADED
+    
+    @property
+    def sort_key(self):
+        """
+        Natural name sort key - folders first, ties broken by path so the order is total.
+        Computed on first use and kept (the name doesn't change once the item is listed).
+        """
+        key = self._sort_key
+        if key is None:
+            key = self._sort_key = (not self._flags & self._FOLDER, tuple(natural_sort_key(self.name)), self.path_str)
+        return key
     
     @property
     def size(self):
         """Lazy load size on first access"""
-        if not self._stat_loaded:
+        if not self._flags & self._STAT_LOADED:
             self._load_stat()
         return self._size
     
     @property
     def modified_time(self):
         """Lazy load modified_time on first access"""
-        if not self._stat_loaded:
+        if not self._flags & self._STAT_LOADED:
             self._load_stat()
         return self._modified_time
     
     @property
     def modified(self):
-        """Lazy load modified datetime on first access"""
-        if not self._stat_loaded:
-            self._load_stat()
-        return self._modified
+        """Modified time as datetime (for filtering) - lazy loads stat on first access"""
+        return datetime.fromtimestamp(self.modified_time)
     
     def refresh_modified_time(self):
         """
@@ -264,13 +788,9 @@ class AssetItem:
         Used for automatic thumbnail refresh detection.
         """
         try:
-            if self.file_path.exists():
-                stat_info = self.file_path.stat()
-                self._modified_time = stat_info.st_mtime
-                self._modified = datetime.fromtimestamp(stat_info.st_mtime)
-            else:
-                self._modified_time = 0
-                self._modified = datetime.fromtimestamp(0)
+            self._modified_time = os.stat(self.path_str).st_mtime
+        except FileNotFoundError:
+            self._modified_time = 0
         except Exception as e:
             # Hálózati hiba esetén ne módosítsd az értékeket
             pass
@@ -288,8 +808,10 @@ class AssetItem:
             return "Folder"
         
         if self.is_sequence and self.sequence:
-            # Show total sequence size
+            # Show total sequence size - calculated in the background on first access
             total_size = self.sequence.total_size
+            if total_size is None:
+                return "..."
             if total_size < 1024:
                 return f"{total_size} B"
             elif total_size < 1024 * 1024:
@@ -310,6 +832,660 @@ class AssetItem:
         return time.strftime("%Y-%m-%d %H:%M", time.localtime(self.modified_time))
 
 
+# ============================================================================
+# BACKGROUND STAT LOADING
+# ============================================================================
+
+class StatBatchLoader:
+    """
+    Loads stat info of AssetItems in the background, so painting never waits for a stat().
+    
+    Requested items are queued and stat-ed by a small thread pool in batches - newest
+    requests first (in the order given), so the rows on screen now come before the ones
+    scrolled past, and prefetch requests after all of them. Each finished batch is
+    reported with listener(assets), called in a worker thread.
+    """
+    
+    BATCH_SIZE = 16   # Items per batch - a page of rows spreads over several workers
+    MAX_WORKERS = 8   # Stats run concurrently - network latency, not CPU, is the limit
+    
+    def __init__(self, listener, max_workers=MAX_WORKERS):
+        self.listener = listener
+        self.max_workers = max_workers
+        self._queue = deque() # Items to stat, taken from the right (newest)
+        self._pending = {}    # id(asset) -> asset queued or being stat-ed
+        self._active = 0      # Drain tasks running
+        self._lock = threading.Lock()
+        self._executor = None
+    
+    def request(self, assets, prefetch=False):
+        """
+        Queue items without stat info (non-blocking) - queued or loaded ones are skipped
+        
+        Args:
+            assets: AssetItems to stat
+            prefetch: Not on screen yet - stat after everything else queued
+        """
+        # Taken from the right - newest requests start with their first item
+        assets = list(assets)
+        if not prefetch:
+            assets.reverse()
+        with self._lock:
+            add = self._queue.appendleft if prefetch else self._queue.append
+            for asset in assets:
+                if asset._flags & AssetItem._STAT_LOADED or id(asset) in self._pending:
+                    continue
+                self._pending[id(asset)] = asset
+                add(asset)
+            
+            # One drain task per batch waiting, up to max_workers
+            batches = -(-len(self._queue) // self.BATCH_SIZE)
+            start = max(0, min(batches, self.max_workers) - self._active)
+            self._active += start
+            if start and self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="StatLoader")
+        for _ in range(start):
+            self._executor.submit(self._drain)
+    
+    def clear(self):
+        """Drop queued items (a new listing) - batches being stat-ed still finish"""
+        with self._lock:
+            for asset in self._queue:
+                self._pending.pop(id(asset), None)
+            self._queue.clear()
+    
+    def is_pending(self, asset):
+        """Check if asset is queued or being stat-ed"""
+        return id(asset) in self._pending
+    
+    def _drain(self):
+        """Stat queued batches until the queue is empty (worker thread)"""
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._active -= 1
+                    return
+                pop = self._queue.pop
+                batch = [pop() for _ in range(min(self.BATCH_SIZE, len(self._queue)))]
+            
+            for asset in batch:
+                asset._load_stat()
+            
+            with self._lock:
+                for asset in batch:
+                    self._pending.pop(id(asset), None)
+            try:
+                self.listener(batch)
+            except Exception as e:
+                print(f"[StatLoader] Listener error: {e}")
+
+
+# ============================================================================
+# PARALLEL DIRECTORY WALK
+# ============================================================================
+
+PARALLEL_WALK_WORKERS = 8  # Directories listed concurrently - network latency, not CPU, is the limit
+
+
+def _list_directory(path):
+    """
+    One os.scandir() pass, classified like os.walk().
+    
+    Returns:
+        tuple or None: (dir_entries, file_entries, symlinked_dir_names), None if unreadable
+    """
+    dirs, files, links = [], [], set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry)
+                    try:
+                        if entry.is_symlink():
+                            links.add(entry.name)
+                    except OSError:
+                        pass
+                else:
+                    files.append(entry)
+                # Windows: size / mtime are part of the listing - keep them (no syscall)
+                if DIR_ENTRY_STAT_CACHED:
+                    try:
+                        entry.stat()
+                    except OSError:
+                        pass
+    except OSError:
+        # Skipped like os.walk() does without onerror
+        return None
+    return dirs, files, links
+
+
+def walk_parallel(top, max_workers=PARALLEL_WALK_WORKERS, cancel_event=None, stats=None, entries=False):
+    """
+    Drop-in replacement for os.walk(top) that lists directories concurrently.
+    
+    Yields (root, dirs, files) top-down in exactly the order os.walk() would. The
+    directories about to be yielded next are listed ahead by a bounded thread pool, so
+    on network shares up to max_workers directory round trips overlap. Pruning dirs in
+    place works like with os.walk(); symlinked directories are not followed.
+    
+    Args:
+        top: Root directory
+        max_workers: Pool width (directories listed at once)
+        cancel_event: Optional threading.Event - stops the walk when set
+        stats: Optional dict, filled with 'dirs', 'seconds' and 'dirs_per_sec'
+        entries: Yield os.DirEntry lists instead of names (no stat needed for AssetItems)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    top = os.fspath(top)
+    start_time = time.time()
+    dir_count = 0
+    prefetch = max_workers * 2
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DirWalker")
+    # Depth-first stack of [path, future]; the top of the stack is listed next
+    stack = [[top, executor.submit(_list_directory, top)]]
+    try:
+        while stack:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            
+            # Keep the pool busy with the directories coming up next - before popping, so the
+            # top always has a listing on the way (also after unreadable folders added no children)
+            for entry in stack[-1:-prefetch - 1:-1]:
+                if entry[1] is None:
+                    entry[1] = executor.submit(_list_directory, entry[0])
+            
+            root, future = stack.pop()
+            listing = future.result()
+            if listing is None:
+                continue
+            dirs, files, links = listing
+            dir_count += 1
+            
+            if not entries:
+                dirs = [entry.name for entry in dirs]
+                files = [entry.name for entry in files]
+            
+            yield root, dirs, files
+            
+            # Children in reverse, so the first one is on top - same order as os.walk
+            for child in reversed(dirs):
+                name = child.name if entries else child
+                if name not in links:
+                    stack.append([os.path.join(root, name), None])
+    finally:
+        # Limit reached or cancelled - drop listings nobody will read
+        executor.shutdown(wait=False, cancel_futures=True)
+        if stats is not None:
+            elapsed = time.time() - start_time
+            stats['dirs'] = dir_count
+            stats['seconds'] = elapsed
+            stats['dirs_per_sec'] = dir_count / elapsed if elapsed > 0 else 0.0
+
+
+class DirectoryScanner(QtCore.QThread):
+    """
+    Lists a folder (or a folder tree) off the GUI thread.
+    
+    AssetItems are created and filtered in the scanner thread and streamed to the
+    model in batches - the model inserts them with beginInsertRows/endInsertRows.
+    cancel() stops the walk at the next entry.
+    """
+    
+    batchReady = QtCore.Signal(int, object)       # (generation, [AssetItem, ...])
+    progress = QtCore.Signal(int, int, int, int)  # (generation, scanned_files, matched_files, loaded_files)
+    scanFinished = QtCore.Signal(int, object)     # (generation, result dict)
+    
+    BATCH_SIZE = 500        # Items per batch at most
+    BATCH_INTERVAL = 0.1    # Seconds - partial batches are sent at least this often
+    
+    def __init__(self, generation, root, recursive=False, search_mode=False, max_files=0,
+                 show_folders=True, supported_formats=(), filter_file_types=(),
+                 matcher=None, accept=None, needs_stat=False,
+                 record_listing=False, revalidate=False, listing_cache=None,
+                 dirs=None, known_dirs=(), skip_paths=frozenset(), parent=None):
+        """
+        Args:
+            generation: Scan id - results of superseded scans are ignored by the model
+            root: Folder to list (Path)
+            recursive: Walk subfolders too
+            search_mode: Recursive search - progress counts matches, limit is max_files
+            max_files: Stop after this many supported files (recursive only, 0 = no limit)
+            show_folders: List folders (direct subfolders of root only)
+            supported_formats: Extensions to list
+            filter_file_types: Only these extensions (empty = all supported)
+            matcher: SearchMatcher items must match (None = no search)
+            accept: Callable(AssetItem) -> bool for the remaining filters
+            needs_stat: Load stat info in the scanner thread (size / date filters)
+            record_listing: Keep every entry of the folder (before filters) for the listing caches
+            revalidate: Only record the listing (with stat info) - the model shows a cached one
+            listing_cache: DirectoryListingCache the recorded listing is written to
+            dirs: Partial rescan of a recursive listing - list only these folders of the tree
+            known_dirs: Folders of the tree already listed - other subfolders of dirs are walked
+            skip_paths: Items the model already has (load_more) - listed and counted, not sent again
+        """
+        super().__init__(parent)
+        self.generation = generation
+        self.root = Path(root)
+        self.recursive = recursive
+        self.search_mode = search_mode
+        self.max_files = max_files
+        self.show_folders = show_folders
+        self.supported_formats = set(supported_formats)
+        self.filter_file_types = set(filter_file_types)
+        self.matcher = matcher
+        self.accept = accept
+        self.needs_stat = needs_stat
+        self.revalidate = revalidate
+        self.listing_cache = listing_cache
+        self.dirs = dirs
+        self.known_dirs = known_dirs
+        self.skip_paths = skip_paths
+        self.path_str = str(self.root)  # Cache key
+        self.dir_mtime = None           # Folder mtime the listing belongs to
+        self._cancel_event = threading.Event()
+        
+        self._batch = []
+        self._last_flush = 0.0
+        self.file_count = 0      # Supported files seen
+        self.match_count = 0     # Files matching the search
+        self.loaded_count = 0    # Items sent to the model
+        self.scanned_paths = []  # Recursive: every listed path (kept for load_more)
+        self.listing = [] if (record_listing or revalidate) and dirs is None else None  # Unfiltered AssetItems of root
+        self.name_index = [] if recursive and dirs is None else None  # Recursive: (path, name, is_folder) before search
+        self.walked_dirs = []    # Recursive: every folder listed (for DirectoryChangeTracker)
+        self.listed_dirs = {}    # Partial: {folder: [subfolder, ...]} of the folders listed again
+        self.missing_dirs = []   # Partial: folders that could not be listed (deleted)
+        self.new_dirs = []       # Partial: subfolders new in the tree (walked completely)
+    
+    def cancel(self):
+        """Stop scanning (thread-safe) - the finished signal still fires"""
+        self._cancel_event.set()
+    
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+    
+    def run(self):
+        start_time = time.time()
+        limit_reached = False
+        error = None
+        
+        try:
+            if self.dirs is not None:
+                self._list_dirs()
+            elif self.recursive:
+                limit_reached = self._walk()
+            else:
+                self._list()
+        except Exception as e:
+            error = str(e)
+            print(f"File loading error: {e}")
+        
+        self._flush()
+        
+        if DEBUG_MODE:
+            print(f"[Scanner] {self.root}: {self.loaded_count} items in {time.time() - start_time:.2f}s"
+                  f"{' (cancelled)' if self.is_cancelled() else ''}")
+        
+        self.scanFinished.emit(self.generation, {
+            'cancelled': self.is_cancelled(),
+            'limit_reached': limit_reached,
+            'file_count': self.file_count,
+            'match_count': self.match_count,
+            'loaded_count': self.loaded_count,
+            'scanned_paths': self.scanned_paths,
+            'listing': self.listing,
+            'name_index': self.name_index,
+            'walked_dirs': self.walked_dirs,
+            'listed_dirs': self.listed_dirs,
+            'missing_dirs': self.missing_dirs,
+            'new_dirs': self.new_dirs,
+            'error': error
+        })
+        
+        # Persist after the model got its items - stat() per entry is not free outside Windows
+        if self.listing_cache is not None and self.listing is not None and error is None:
+            self._store_listing()
+    
+    def _list(self):
+        """Current folder only - os.scandir() gives the folder flag without an extra stat"""
+        match = self.matcher.match if self.matcher is not None else None
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if self._cancel_event.is_set():
+                    return
+                
+                # Skip hidden files/folders (starting with .)
+                if entry.name.startswith('.'):
+                    continue
+                
+                try:
+                    is_directory = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    # Handle permission errors or broken symlinks
+                    continue
+                
+                # Complete listing for the caches - the view filters below don't apply to it
+                asset = None
+                if self.listing is not None:
+                    asset = AssetItem.from_dir_entry(entry, is_directory)
+                    if self.revalidate:
+                        asset._load_stat()
+                        self.listing.append(asset)
+                        continue
+                    self.listing.append(asset)
+                
+                if is_directory:
+                    if not self.show_folders:
+                        continue
+                else:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in self.supported_formats:
+                        continue
+                    if self.filter_file_types and ext not in self.filter_file_types:
+                        continue
+                    self.file_count += 1
+                
+                if match is not None and not match(entry.name):
+                    continue
+                self._add(entry.path, entry.name, entry, is_directory, asset)
+    
+    def _walk(self):
+        """Folder tree (walk_parallel) - returns True if max_files was reached"""
+        from contextlib import closing
+        
+        root_str = str(self.root)
+        walk_stats = {}
+        limit_reached = False
+        
+        # Closing the walker drops directory listings still pending when we stop early
+        walker = walk_parallel(root_str, cancel_event=self._cancel_event, stats=walk_stats, entries=True)
+        with closing(walker):
+            for root, dir_entries, file_entries in walker:
+                self.walked_dirs.append(root)
+                
+                # Add folders if enabled (only direct subfolders in current dir)
+                if self.show_folders and root == root_str:
+                    self.name_index.extend((entry.path, entry.name, True) for entry in dir_entries
+                                           if not entry.name.startswith('.'))
+                    for entry in self._matching(dir_entries):
+                        if not entry.name.startswith('.'):
+                            self._add(entry.path, entry.name, entry, True)
+                
+                supported = []
+                for entry in file_entries:
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in self.supported_formats:
+                        continue
+                    if self.filter_file_types and ext not in self.filter_file_types:
+                        continue
+                    
+                    supported.append(entry)
+                    
+                    # Optional safety limit - stop scanning when we have enough
+                    if self.max_files and self.file_count + len(supported) >= self.max_files:
+                        limit_reached = True
+                        break
+                
+                # Search text is matched per folder, over the whole name list at once
+                self.file_count += len(supported)
+                self.name_index.extend((entry.path, entry.name, False) for entry in supported)
+                for entry in self._matching(supported):
+                    self._add(entry.path, entry.name, entry, False)
+                
+                if limit_reached or self._cancel_event.is_set():
+                    break
+        
+        if self._cancel_event.is_set():
+            print(f"⚠️ [FileSystemModel] Loading interrupted by user")
+        print(f"📂 [FileSystemModel] Scanned {walk_stats['dirs']} folders in {walk_stats['seconds']:.2f}s "
+              f"({walk_stats['dirs_per_sec']:.0f} dirs/s)")
+        return limit_reached
+    
+    def _list_dirs(self):
+        """Partial rescan - list the changed folders of the tree, walk subfolders new in it"""
+        from contextlib import closing
+        
+        root_str = str(self.root)
+        for path in self.dirs:
+            if self._cancel_event.is_set():
+                return
+            
+            listed = _list_directory(path)
+            if listed is None:
+                self.missing_dirs.append(path)
+                continue
+            dir_entries, file_entries, links = listed
+            
+            subdirs = []
+            if self.show_folders and path == root_str:
+                for entry in self._matching(dir_entries):
+                    if not entry.name.startswith('.'):
+                        self._add(entry.path, entry.name, entry, True)
+            for entry in dir_entries:
+                if entry.name in links:
+                    continue  # Not followed by the walk either
+                subdirs.append(entry.path)
+                if entry.path not in self.known_dirs:
+                    self.new_dirs.append(entry.path)
+            self.listed_dirs[path] = subdirs
+            self._add_files(file_entries)
+        
+        for new_dir in self.new_dirs:
+            walker = walk_parallel(new_dir, cancel_event=self._cancel_event, entries=True)
+            with closing(walker):
+                for root, dir_entries, file_entries in walker:
+                    self.walked_dirs.append(root)
+                    self._add_files(file_entries)
+    
+    def _add_files(self, file_entries):
+        """Supported files of one folder listing (partial rescan - no file limit)"""
+        supported = []
+        for entry in file_entries:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext not in self.supported_formats:
+                continue
+            if self.filter_file_types and ext not in self.filter_file_types:
+                continue
+            supported.append(entry)
+        
+        self.file_count += len(supported)
+        for entry in self._matching(supported):
+            self._add(entry.path, entry.name, entry, False)
+    
+    def _matching(self, entries):
+        """Entries whose name matches the search text (all without one)"""
+        if self.matcher is None:
+            return entries
+        return self.matcher.filter(entries, name_of)
+    
+    def _add(self, path, name, entry, is_folder, asset=None):
+        """Filter one listed item (search text is matched by the caller) and queue it for the next batch"""
+        if self.recursive:
+            self.scanned_paths.append(path)
+        if path in self.skip_paths:
+            return
+        
+        # Folder flag (and on Windows size / mtime) come from the listing - no stat here
+        if asset is None:
+            asset = AssetItem.from_dir_entry(entry, is_folder)
+        if self.needs_stat and not asset.is_folder:
+            asset._load_stat()
+        if self.accept is not None and not self.accept(asset):
+            return
+        
+        if self.matcher is not None and not asset.is_folder:
+            self.match_count += 1
+        self._batch.append(asset)
+        
+        now = time.time()
+        if len(self._batch) >= self.BATCH_SIZE or now - self._last_flush >= self.BATCH_INTERVAL:
+            self._flush(now)
+    
+    def _flush(self, now=None):
+        """Send queued items and progress to the model"""
+        self._last_flush = now or time.time()
+        if self._batch:
+            self.loaded_count += len(self._batch)
+            batch = self._batch
+            self._batch = []
+            self.batchReady.emit(self.generation, batch)
+        self.progress.emit(self.generation, self.file_count, self.match_count, self.loaded_count)
+    
+    def _store_listing(self):
+        """Write names, kinds, sizes and mtimes of the listing to the persistent cache"""
+        entries = []
+        for asset in self.listing:
+            if self._cancel_event.is_set():
+                return
+            # Items may be in the model already - read loaded stat info, don't load it into them
+            if asset._flags & AssetItem._STAT_LOADED:
+                size, mtime = asset._size, asset._modified_time
+            else:
+                try:
+                    stat_info = os.stat(asset.path_str)
+                    size, mtime = stat_info.st_size, stat_info.st_mtime
+                except OSError:
+                    size, mtime = 0, 0
+            entries.append((asset.name, asset.is_folder, 0 if asset.is_folder else size, mtime))
+        self.listing_cache.put(self.path_str, self.dir_mtime, entries)
+
+
+class DirectoryChangeTracker(QtCore.QObject):
+    """
+    Reports changed folders of a folder set (the current folder, a recursive listing's tree
+    or the folders of a collection).
+    
+    - QFileSystemWatcher on at most MAX_WATCHED_DIRS folders, closest to the root first
+      (OS watch handles are limited - inotify, kqueue file descriptors)
+    - Every folder's mtime is polled in a background thread as well, POLL_BATCH folders per
+      POLL_INTERVAL_MS - covers the unwatched part of large trees and network shares where
+      change notifications don't arrive
+    
+    Changes are collected for DEBOUNCE_MS and reported together by directoriesChanged.
+    """
+    
+    directoriesChanged = QtCore.Signal(object)  # [folder path, ...]
+    _polled = QtCore.Signal(object)             # (generation, [(folder, mtime), ...]) from the poll thread
+    
+    MAX_WATCHED_DIRS = 256
+    POLL_INTERVAL_MS = 3000
+    POLL_BATCH = 2000
+    DEBOUNCE_MS = 300
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._mark_changed)
+        
+        self._dirs = []            # Tracked folders, shallowest first
+        self._mtimes = {}          # folder -> mtime at the last poll (None = unreadable)
+        self._poll_position = 0
+        self._poll_running = False
+        self._generation = 0       # Bumped per folder set - polls of older sets are ignored
+        self._pending = set()
+        
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+        
+        self._debounce_timer = QtCore.QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._emit_changes)
+        
+        self._polled.connect(self._on_polled)
+    
+    def set_directories(self, dirs):
+        """
+        Track these folders - folders tracked before keep their watch and last seen mtime
+        
+        Args:
+            dirs: Folder path strings
+        """
+        dirs = sorted(set(dirs), key=lambda path: (path.count(os.sep), path))
+        if dirs == self._dirs:
+            return
+        
+        self._generation += 1
+        self._poll_running = False
+        self._dirs = dirs
+        self._poll_position = 0
+        tracked = set(dirs)
+        self._mtimes = {path: mtime for path, mtime in self._mtimes.items() if path in tracked}
+        self._pending &= tracked
+        
+        watched = set(self._watcher.directories())
+        wanted = set(dirs[:self.MAX_WATCHED_DIRS])
+        if watched - wanted:
+            self._watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            self._watcher.addPaths(sorted(wanted - watched))
+        
+        if dirs:
+            self._poll_timer.start()
+            self._poll()  # Baseline mtimes of new folders
+        else:
+            self._poll_timer.stop()
+        
+        if DEBUG_MODE:
+            print(f"[Tracker] {len(dirs)} folders tracked, {len(wanted)} watched")
+    
+    def clear(self):
+        """Stop tracking"""
+        self.set_directories([])
+    
+    def _mark_changed(self, path):
+        self._pending.add(path)
+        if not self._debounce_timer.isActive():
+            self._debounce_timer.start()
+    
+    def _emit_changes(self):
+        if self._pending:
+            dirs, self._pending = sorted(self._pending), set()
+            self.directoriesChanged.emit(dirs)
+    
+    def _poll(self):
+        """Stat the next POLL_BATCH folders in a background thread"""
+        if self._poll_running or not self._dirs:
+            return
+        
+        start = self._poll_position
+        batch = self._dirs[start:start + self.POLL_BATCH]
+        self._poll_position = start + len(batch) if start + len(batch) < len(self._dirs) else 0
+        
+        self._poll_running = True
+        threading.Thread(target=self._poll_worker, args=(self._generation, batch),
+                         name="DirPoll", daemon=True).start()
+    
+    def _poll_worker(self, generation, batch):
+        results = []
+        for path in batch:
+            try:
+                results.append((path, os.stat(path).st_mtime))
+            except OSError:
+                results.append((path, None))
+        self._polled.emit((generation, results))
+    
+    def _on_polled(self, payload):
+        generation, results = payload
+        if generation != self._generation:
+            return
+        self._poll_running = False
+        
+        for path, mtime in results:
+            # Folders seen for the first time only get their baseline
+            if path in self._mtimes and self._mtimes[path] != mtime:
+                self._mark_changed(path)
+            self._mtimes[path] = mtime
+
+
 class FileSystemModel(QAbstractListModel):
     """File system model for list view"""
     
@@ -319,16 +1495,38 @@ class FileSystemModel(QAbstractListModel):
         searchProgress = Signal(int, int)  # (scanned_files, matched_files) - for search in subfolders
         loadProgress = Signal(int, int)    # (loaded_files, total_scanned) - for include subfolders loading
         limitReached = Signal(int, int)    # (loaded_count, total_scanned) - when max files limit is hit
+        scanFinished = Signal()            # Background folder scan done - assets grouped, sorted and complete
+        assetsChanged = Signal(object)     # [thumbnail cache key, ...] - files changed on disk (update_from_disk)
+        sequenceSizeReady = Signal(object) # ImageSequence - total_size known (row repainted, preview can update)
+        _sequenceSizeReady = Signal(object)  # ImageSequence - total_size calculated in the background
+        _statsLoaded = Signal(object)        # [AssetItem, ...] - stat info loaded in the background
+        _sortStatsLoaded = Signal(int)       # Stat batch generation - size / date sort info loaded
     else:
         from PySide2.QtCore import Signal
         searchProgress = Signal(int, int)  # (scanned_files, matched_files) - for search in subfolders
         loadProgress = Signal(int, int)    # (loaded_files, total_scanned) - for include subfolders loading
         limitReached = Signal(int, int)    # (loaded_count, total_scanned) - when max files limit is hit
+        scanFinished = Signal()            # Background folder scan done - assets grouped, sorted and complete
+        assetsChanged = Signal(object)     # [thumbnail cache key, ...] - files changed on disk (update_from_disk)
+        sequenceSizeReady = Signal(object) # ImageSequence - total_size known (row repainted, preview can update)
+        _sequenceSizeReady = Signal(object)  # ImageSequence - total_size calculated in the background
+        _statsLoaded = Signal(object)        # [AssetItem, ...] - stat info loaded in the background
+        _sortStatsLoaded = Signal(int)       # Stat batch generation - size / date sort info loaded
+    
+    SORT_STAT_SYNC_LIMIT = 200  # Size / date sort: fewer items without stat info are stat-ed right away
+    FETCH_CHUNK = 1000          # Rows handed to views at a time (canFetchMore / fetchMore)
+    
+    # Item kinds of the view filter columns (see _filter_columns)
+    _KIND_FOLDER, _KIND_IMAGE, _KIND_SCRIPT, _KIND_OTHER = range(4)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.assets = []
         self._file_path_to_row = {}  # Fast lookup: file_path_str -> row_index
+        
+        # Views see the first _row_count items of assets - more are fetched as they scroll (fetchMore)
+        self._row_count = 0                 # Rows the views know about
+        self._row_limit = self.FETCH_CHUNK  # Streamed items become rows up to here
         self.current_path = None
         self.filter_text = ""
         
@@ -345,6 +1543,10 @@ class FileSystemModel(QAbstractListModel):
         # Search options
         self.case_sensitive_search = False
         self.regex_search = False
+        self.term_search = False   # AND / OR / -exclude / glob terms instead of one substring
+        self._matcher = None       # SearchMatcher of filter_text (see _search_matcher)
+        self._matcher_key = None   # (text, case_sensitive, regex, terms) it was compiled for
+        self._search_index = None  # Names of the last complete recursive listing (see _apply_search_index)
         self.search_in_subfolders = False  # Search in subfolders when search text is present
         
         # Advanced filters
@@ -358,6 +1560,12 @@ class FileSystemModel(QAbstractListModel):
         self.show_scripts = True  # Show script files by default
         self.collection_filter = []  # Collection filter (list of file paths)
         
+        # Loaded set - the rows are the part of it the view filters above let through
+        # (folders / images / scripts, size, date, file types); filter changes only mask it again
+        self._loaded_assets = None    # Every loaded item in display order (None in collection mode)
+        self._loaded_types = frozenset()  # File types it was listed with (empty = all supported)
+        self._filter_columns_cache = None  # Per-item columns of _loaded_assets the filters test
+        
         # Collection mode - when active, show collection files instead of directory
         self.collection_mode = False
         self.collection_files = []  # List of file paths to display in collection mode
@@ -365,6 +1573,10 @@ class FileSystemModel(QAbstractListModel):
         # Sorting
         self.sort_column = "name"  # "name", "size", "date", "type"
         self.sort_ascending = True
+        self._sorted_as = None       # (column, ascending) the rows are in - None after unsorted appends
+        self._stat_batch = None      # threading.Event cancelling the running size / date stat batch
+        self._stat_generation = 0    # Bumped per stat batch - results of older ones are ignored
+        self._sortStatsLoaded.connect(self._on_sort_stats_loaded)
         
         # Sequence grouping
         self.sequence_mode = False  # When True, group image sequences into single items
@@ -372,14 +1584,26 @@ class FileSystemModel(QAbstractListModel):
         
         # Recursive subfolder browsing
         self.include_subfolders = False
-        self.max_recursive_files = 10000  # Limit for "Include Subfolders" (shows all files)
+        self.max_recursive_files = 0  # Limit for "Include Subfolders" (0 = none - rows are fetched in chunks)
         self.max_search_files = 100000  # Higher limit for "Search Subfolders" (filtered results)
         
-        # Search interrupt flag
-        self._interrupt_search = False
+        # Background folder scan (see DirectoryScanner)
+        self._scanner = None           # Scan streaming into the model, None when idle
+        self._scanner_threads = set()  # Scanner threads still running (incl. cancelled ones)
+        self._scan_generation = 0      # Bumped per refresh - batches of older scans are ignored
+        self._pending_scan_assets = [] # Held back until the scan finishes (sequence mode)
+        self._reset_depth = 0          # Inside beginResetModel / endResetModel
+        self._pending_update_dirs = set() # Changed folders reported while a full scan was running
+        self._scanned_dirs = set()     # Folders of the current recursive listing (complete listings only)
         
         # Image sequence grouping
         self.sequence_mode = False  # When True, group image sequences into single items
+        self._sequenceSizeReady.connect(self._on_sequence_size_ready)
+        
+        # Size / date of rows on screen - stat-ed in the background, "..." until then
+        self._stat_loader = StatBatchLoader(self._statsLoaded.emit)
+        self._stat_requests = []  # Rows painted without stat info - queued together (see _request_stat)
+        self._statsLoaded.connect(self._on_stats_loaded)
         
         # Limit warning flag
         self.limit_reached = False  # Set to True when max_recursive_files limit is reached
@@ -387,33 +1611,48 @@ class FileSystemModel(QAbstractListModel):
         # Incremental loading state (for load_more functionality)
         self._all_scanned_paths = []  # All file paths found during last recursive scan
         self._current_display_limit = 0  # How many files are currently displayed
+        self._scan_file_limit = 0  # File limit the last recursive scan stopped at (load_more raises it)
         
         # Directory cache system - cache AssetItem objects instead of Path objects
+        # In-memory layer in front of the persistent listing cache; both hold complete
+        # folder listings (before filters), so filter changes never see a partial list
         self._dir_cache = {}  # {path_str: {'assets': [AssetItem], 'timestamp': float, 'mtime': float}}
         self._cache_max_size = 20  # Maximum number of cached directories
         self._cache_ttl = 300  # Cache time-to-live in seconds (5 minutes)
         self._cache_enabled = True
+        self._listing_cache = None  # DirectoryListingCache - set by the browser (see set_listing_cache)
     
     def _rebuild_path_index(self):
         """Rebuild the file path to row index mapping (O(n) operation)"""
         self._file_path_to_row = {}
         for row, asset in enumerate(self.assets):
-            self._file_path_to_row[str(asset.file_path)] = row
+            self._file_path_to_row[asset.path_str] = row
     
     def get_row_for_path(self, file_path):
         """Get row index for a file path (O(1) lookup)
         
         Args:
             file_path: File path as string
-            
+        
         Returns:
-            Row index (int) or None if not found
+            Row index (int) or None if not found (or not fetched by the views yet)
         """
-        return self._file_path_to_row.get(str(file_path))
+        row = self._file_path_to_row.get(str(file_path))
+        if row is None or row >= self._row_count:
+            return None
+        return row
+    
+    def beginResetModel(self):
+        """Override to track resets - refresh() only resets by itself outside of one"""
+        self._reset_depth += 1
+        super().beginResetModel()
     
     def endResetModel(self):
-        """Override to rebuild path index after model reset"""
+        """Override to rebuild path index after model reset - views get the first chunk of rows"""
+        self._row_limit = self.FETCH_CHUNK
+        self._row_count = min(len(self.assets), self._row_limit)
         super().endResetModel()
+        self._reset_depth = max(0, self._reset_depth - 1)
         self._rebuild_path_index()
     
     def set_custom_extensions(self, extensions):
@@ -483,6 +1722,15 @@ class FileSystemModel(QAbstractListModel):
         if DEBUG_MODE:
             print("[CACHE] Cache cleared")
     
+    def set_listing_cache(self, listing_cache):
+        """Use a persistent DirectoryListingCache behind the in-memory cache (None = memory only)"""
+        self._listing_cache = listing_cache
+    
+    def _assets_from_listing(self, path_str, entries):
+        """AssetItems for a stored listing - [(name, is_folder, size, mtime), ...]"""
+        return [AssetItem.from_listing(os.path.join(path_str, name), is_folder, size, mtime)
+                for name, is_folder, size, mtime in entries]
+    
     def set_cache_enabled(self, enabled):
         """Enable or disable caching"""
         self._cache_enabled = enabled
@@ -494,411 +1742,889 @@ class FileSystemModel(QAbstractListModel):
     def setPath(self, path):
         """Set current path"""
         self.beginResetModel()
-        self.current_path = Path(path)
-        self.refresh()
+        if Path(path) != self.current_path:
+            self._search_index = None  # Navigation walks the tree again
+        self.current_path = Path(path)
+        self.refresh()
+        self.endResetModel()
+    
+    def interrupt_search(self):
+        """Interrupt an ongoing search / folder scan (results so far are kept)"""
+        if self._scanner is not None:
+            self._scanner.cancel()
+    
+    def is_scanning(self):
+        """Check if a folder scan is streaming items into the model (background revalidation is not)"""
+        return self._scanner is not None and not self._scanner.revalidate
+    
+    def stop_scanning(self, timeout_ms=2000):
+        """Cancel all scanner threads and wait for them to exit (on close)"""
+        self._cancel_scan()
+        self._stat_loader.clear()
+        for scanner in list(self._scanner_threads):
+            scanner.cancel()
+            scanner.wait(timeout_ms)
+    
+    def update_from_disk(self):
+        """
+        List the current folder again in the background and apply only the differences:
+        rows are inserted / removed / moved and changed items get dataChanged, so selection,
+        scroll position and thumbnails of untouched items stay.
+        
+        Recursive listings, search results and collections are reloaded with refresh(force=True).
+        """
+        if (self.collection_mode or self.include_subfolders or self.filter_text or
+                not self.current_path or not self.current_path.exists()):
+            self.refresh(force=True)
+            return
+        
+        # A full scan is streaming in - it may have listed the changed entry already, check again after it
+        if self.is_scanning():
+            self._pending_update_dirs.add(str(self.current_path))
+            return
+        
+        # Supersedes a pending background check
+        self._cancel_scan()
+        self._start_scan(str(self.current_path), self._get_dir_mtime(self.current_path), revalidate=True)
+    
+    def update_directories(self, dirs):
+        """
+        Apply changes of these folders (reported by DirectoryChangeTracker) without a model reset.
+        
+        Recursive listings list only the changed folders again (and walk subfolders new in the
+        tree), the current folder goes through update_from_disk(), collections are rebuilt
+        and diffed.
+        
+        Args:
+            dirs: Changed folder paths
+        """
+        if self.collection_mode:
+            self._update_collection()
+            return
+        
+        if not (self.include_subfolders or (self.search_in_subfolders and self.filter_text)):
+            self.update_from_disk()
+            return
+        
+        # Limited listing - only a full reload can tell which files belong to it
+        if self.limit_reached or not self._scanned_dirs:
+            return
+        
+        if self.is_scanning():
+            self._pending_update_dirs.update(dirs)
+            return
+        
+        # A partial rescan still running is superseded - its folders are listed again too
+        dirs = set(dirs)
+        if self._scanner is not None and self._scanner.dirs is not None:
+            dirs.update(self._scanner.dirs)
+        self._cancel_scan()
+        self._start_scan(str(self.current_path), None, revalidate=True, dirs=sorted(dirs))
+    
+    def watch_directories(self):
+        """Folders whose changes affect the current view (for DirectoryChangeTracker)"""
+        if self.collection_mode:
+            return sorted({os.path.dirname(path.rstrip('/\\')) for path in self.collection_files})
+        if not self.current_path:
+            return []
+        if self.include_subfolders or (self.search_in_subfolders and self.filter_text):
+            return sorted(self._scanned_dirs)
+        return [str(self.current_path)]
+    
+    def _cancel_scan(self):
+        """Cancel the running scan - its remaining batches are ignored"""
+        if self._scanner is not None:
+            self._scanner.cancel()
+            self._scanner = None
+        self._scan_generation += 1
+        self._pending_update_dirs = set()
+    
+    def refresh(self, force=False):
+        """Refresh file list
+        
+        Cached listings are applied right away. Otherwise the folder is listed by a
+        DirectoryScanner thread: the model is emptied and filled in batches, then
+        grouped / sorted in place and scanFinished is emitted.
+        
+        Args:
+            force: If True, bypass cache and reload from filesystem
+        """
+        # A new listing replaces whatever is still being scanned (or waits for stat info)
+        self._cancel_scan()
+        self._stat_loader.clear()
+        AssetItem.sync_extension_info()
+        
+        if DEBUG_MODE:
+            print(f"[Model] refresh() called - force={force}, filter_text='{self.filter_text}', "
+                  f"search_in_subfolders={self.search_in_subfolders}, collection_mode={self.collection_mode}, "
+                  f"current_path={self.current_path}")
+        
+        # Collection mode - load files from collection list instead of directory
+        if self.collection_mode:
+            self._loaded_assets = None
+            self._load_collection_files()
+            return
+        
+        # Narrower file types are masked later, other ones need a listing of their own
+        self._loaded_types = frozenset(self.filter_file_types or ())
+        
+        if not self.current_path or not self.current_path.exists():
+            self._set_loaded([])
+            return
+        
+        # Search typed into a recursive listing - filter the names of its last walk
+        if force:
+            self._search_index = None
+        elif self._apply_search_index():
+            return
+        
+        # Check cache first (only for non-recursive mode and when not forcing)
+        # IMPORTANT: Cache is ONLY used when include_subfolders is OFF
+        # When toggling include_subfolders, force refresh to avoid showing stale data
+        path_str = str(self.current_path)
+        current_mtime = self._get_dir_mtime(self.current_path)
+        
+        cached_assets = None
+        revalidate = False
+        # Only use cache if:
+        # 1. Not forcing refresh (force=False)
+        # 2. NOT in subfolder mode (include_subfolders=False)
+        # 3. NOT in search subfolder mode with active search (search_in_subfolders=False OR no search text)
+        # 4. Cache is valid (not expired and directory not modified)
+        # The cache holds the complete listing, search text is applied like the other filters;
+        # the persistent cache only without search text (its revalidation records the full listing)
+        use_subfolders = self.include_subfolders or (self.search_in_subfolders and self.filter_text)
+        has_search_filter = bool(self.filter_text)
+        if not force and not use_subfolders and self._cache_enabled:
+            if self._is_cache_valid(path_str, current_mtime):
+                cached_assets = self._get_from_cache(path_str)
+            elif self._listing_cache is not None and not has_search_filter:
+                # Folder known from an earlier session - show it now, list it again in the background
+                # (the folder mtime does not change when a file is only modified in place)
+                entries = self._listing_cache.get(path_str, current_mtime)
+                if entries is not None:
+                    cached_assets = self._assets_from_listing(path_str, entries)
+                    self._add_to_cache(path_str, cached_assets, current_mtime)
+                    revalidate = True
+        
+        # Reset limit flag
+        self.limit_reached = False
+        
+        if cached_assets is None:
+            self._start_scan(path_str, current_mtime)
+            return
+        
+        try:
+            self._set_loaded(self._finalize_assets(self._filter_listing(cached_assets)))
+        except Exception as e:
+            print(f"File loading error: {e}")
+            self._set_loaded([])
+            return
+        
+        if revalidate:
+            self._start_scan(path_str, current_mtime, revalidate=True)
+    
+    def _search_index_key(self):
+        """What a recursive walk's name index depends on - besides the search text"""
+        return (str(self.current_path), frozenset(self.supported_formats), self._loaded_types)
+    
+    def _apply_search_index(self):
+        """
+        Show a recursive listing from the name index of the last walk of the same tree.
+        
+        When the search only narrows (longer word, extra term) the previous matches are
+        filtered, otherwise every name of the walk - the tree is walked again only on
+        navigation or a forced refresh.
+        
+        Returns:
+            bool: True if applied, False if the tree has to be walked
+        """
+        index = self._search_index
+        if (index is None or not (self.include_subfolders or (self.search_in_subfolders and self.filter_text)) or
+                index['key'] != self._search_index_key()):
+            return False
+        
+        matcher = self._search_matcher()
+        if matcher is index['matcher']:
+            matches = index['matches']
+        else:
+            source = index['matches'] if matcher is not None and matcher.narrows(index['matcher']) else index['entries']
+            matches = source if matcher is None else matcher.filter(source, itemgetter(1))
+            index['matcher'] = matcher
+            index['matches'] = matches
+        
+        # Items of earlier results are reused - stat info loaded for them stays
+        assets = index['assets']
+        listing = []
+        for path, name, is_folder in matches:
+            asset = assets.get(path)
+            if asset is None:
+                asset = assets[path] = AssetItem(path, lazy_load=True, is_folder=is_folder)
+            listing.append(asset)
+        
+        if DEBUG_MODE:
+            print(f"[Model] Search index: {len(matches)} of {len(index['entries'])} names match '{self.filter_text}'")
+        
+        self.limit_reached = False
+        self._all_scanned_paths = [path for path, name, is_folder in matches]
+        self._current_display_limit = len(self._all_scanned_paths)
+        self._set_loaded(self._finalize_assets(self._filter_listing(listing, matched=True)))
+        return True
+    
+    def _filter_listing(self, listing, matched=False):
+        """
+        Apply the load filters (search text, supported formats, loaded file types) to a cached
+        folder listing. The view filters are applied to the loaded set afterwards (see _visible).
+        
+        Args:
+            listing: Complete listing of the current folder (AssetItems, before filters)
+            matched: Listing already filtered by the search text
+        
+        Returns:
+            list: Filtered assets (not yet grouped or sorted)
+        """
+        # Search filter (folders too) - one pass over the names with the compiled matcher
+        matcher = self._search_matcher()
+        if matcher is not None and not matched:
+            listing = matcher.filter(listing, name_of)
+        
+        formats = frozenset(self.supported_formats)
+        if self._loaded_types:
+            formats = formats & self._loaded_types
+        return [asset for asset in listing if asset.is_folder or asset.extension in formats]
+    
+    def _filter_columns(self, assets, size=False, mtime=False):
+        """
+        Per-item columns the view filters test: kind, extension and - when a size / date filter
+        needs them - size and mtime (stat-ed on demand). Built once per loaded set, other lists
+        (scan batches) get columns of their own.
+        
+        Returns:
+            dict: {'kind': [...], 'ext': [...], 'size': [...] or None, 'mtime': [...] or None}
+        """
+        columns = self._filter_columns_cache
+        if (columns is None or assets is not self._loaded_assets or
+                columns['assets'] is not assets or columns['count'] != len(assets)):
+            folder, image, script = AssetItem._FOLDER, AssetItem._IMAGE, AssetItem._SCRIPT
+            kinds = [
+                self._KIND_FOLDER if flags & folder else
+                self._KIND_IMAGE if flags & image else
+                self._KIND_SCRIPT if flags & script else self._KIND_OTHER
+                for flags in map(attrgetter('_flags'), assets)
+            ]
+            columns = {'assets': assets, 'count': len(assets), 'kind': kinds,
+                       'ext': [asset.extension for asset in assets], 'size': None, 'mtime': None}
+            if assets is self._loaded_assets:
+                self._filter_columns_cache = columns
+        
+        # Folders pass size / date filters - they are never stat-ed for them
+        if size and columns['size'] is None:
+            columns['size'] = [0 if asset.is_folder else asset.size for asset in assets]
+        if mtime and columns['mtime'] is None:
+            columns['mtime'] = [0 if asset.is_folder else asset.modified_time for asset in assets]
+        return columns
+    
+    def _visible(self, assets):
+        """
+        Items of assets the view filters let through - a mask over the filter columns,
+        so changing a filter costs a few list passes and no reload.
+        
+        Returns:
+            list: Visible items (a new list, order kept)
+        """
+        hidden = set()
+        if not self.show_folders:
+            hidden.add(self._KIND_FOLDER)
+        if not self.show_images:
+            hidden.add(self._KIND_IMAGE)
+        if not self.show_scripts:
+            hidden.add(self._KIND_SCRIPT)
+        types = frozenset(self.filter_file_types or ())
+        sized = self.filter_min_size > 0 or self.filter_max_size > 0
+        dated = self.filter_date_from is not None or self.filter_date_to is not None
+        if not (hidden or types or sized or dated):
+            return list(assets)
+        
+        folder = self._KIND_FOLDER
+        columns = self._filter_columns(assets, size=sized, mtime=dated)
+        kinds = columns['kind']
+        mask = [kind not in hidden for kind in kinds]
+        
+        # Type, size and date filters apply to files only
+        if types:
+            mask = [keep and (kind == folder or ext in types)
+                    for keep, kind, ext in zip(mask, kinds, columns['ext'])]
+        if sized:
+            low, high = self.filter_min_size, self.filter_max_size or float('inf')
+            mask = [keep and (kind == folder or low <= size <= high)
+                    for keep, kind, size in zip(mask, kinds, columns['size'])]
+        if dated:
+            low = self.filter_date_from.timestamp() if self.filter_date_from is not None else float('-inf')
+            high = self.filter_date_to.timestamp() if self.filter_date_to is not None else float('inf')
+            mask = [keep and (kind == folder or low <= mtime <= high)
+                    for keep, kind, mtime in zip(mask, kinds, columns['mtime'])]
+        return list(compress(assets, mask))
+    
+    def _set_loaded(self, assets):
+        """Replace the loaded set (display order) and show what the view filters let through"""
+        self._loaded_assets = assets
+        self._set_assets(self._visible(assets))
+    
+    def _apply_loaded_diff(self, assets):
+        """
+        Replace the loaded set, applying the visible part as row differences (_apply_listing_diff).
+        Items the rows keep stay the loaded ones too.
+        
+        Returns:
+            list: Thumbnail cache keys of changed items
+        """
+        changed_keys = self._apply_listing_diff(self._visible(assets))
+        shown = {self._asset_key(asset): asset for asset in self.assets}
+        self._loaded_assets = [shown.get(self._asset_key(asset), asset) for asset in assets]
+        return changed_keys
+    
+    def _apply_view_filters(self, reload=False):
+        """
+        Show the loaded items the changed view filters let through - rows move with a layout
+        change (selection stays), nothing is listed, grouped or sorted again.
+        
+        Args:
+            reload: The loaded set lacks items the filters can show now - refresh instead
+        """
+        if reload or self._loaded_assets is None or self.collection_mode:
+            self.beginResetModel()
+            self.refresh()
+            self.endResetModel()
+            return
+        self._move_rows(self._visible(self._loaded_assets))
+    
+    def _finalize_assets(self, assets):
+        """
+        Store the ungrouped list, then group sequences and sort.
+        
+        Returns:
+            list: Assets in display order
+        """
+        # Store ungrouped assets BEFORE sequence grouping for quick toggle
+        self._ungrouped_assets = assets.copy()
+        
+        # Grouping and sorting work on self.assets in place - the model keeps its rows until applied
+        current_assets = self.assets
+        self.assets = assets
+        
+        # Group image sequences if sequence mode is enabled
+        if self.sequence_mode:
+            try:
+                self._group_sequences()
+            except Exception as e:
+                import traceback
+                print(f"[ERROR] Sequence grouping failed: {e}")
+                traceback.print_exc()
+                # Don't crash, just skip grouping
+        
+        # Apply sorting
+        try:
+            self._sort_assets()
+        except Exception as e:
+            import traceback
+            print(f"[ERROR] Sorting failed: {e}")
+            traceback.print_exc()
+        
+        final_assets, self.assets = self.assets, current_assets
+        return final_assets
+    
+    def _set_assets(self, assets):
+        """Replace the asset list - resets the model unless the caller already does"""
+        if self._reset_depth:
+            self.assets = assets
+            return
+        self.beginResetModel()
+        self.assets = assets
         self.endResetModel()
     
-    def interrupt_search(self):
-        """Interrupt an ongoing search operation"""
-        self._interrupt_search = True
-    
-    def refresh(self, force=False):
-        """Refresh file list
-        Args:
-            force: If True, bypass cache and reload from filesystem
+    def _start_scan(self, path_str, dir_mtime, revalidate=False, dirs=None, max_files=None, skip_paths=None):
         """
-        import time
-        start_time = time.time()
+        Empty the model and list the current folder in a DirectoryScanner thread
         
-        # Reset interrupt flag at start of refresh
-        self._interrupt_search = False
+        Args:
+            path_str: Current folder (cache key)
+            dir_mtime: Folder modification time before listing
+            revalidate: Keep the rows shown from the listing cache - only list again to compare
+            dirs: With revalidate - changed folders of the recursive listing to list again
+            max_files: File limit instead of the configured one (load_more)
+            skip_paths: Keep the rows shown and add only items not among these paths (load_more)
+        """
+        should_search_recursively = bool(self.include_subfolders or (self.search_in_subfolders and self.filter_text))
+        is_search_mode = bool(self.search_in_subfolders and self.filter_text)
+        # Listings of the current folder are cached complete - search text is applied on top
+        record_listing = self._cache_enabled and not should_search_recursively
         
         if DEBUG_MODE:
-            print(f"[Model] refresh() called - force={force}, filter_text='{self.filter_text}', "
-                  f"search_in_subfolders={self.search_in_subfolders}, collection_mode={self.collection_mode}, "
-                  f"current_path={self.current_path}")
+            print(f"[Model] should_search_recursively={should_search_recursively} "
+                  f"(include_subfolders={self.include_subfolders}, "
+                  f"search_in_subfolders={self.search_in_subfolders}, "
+                  f"filter_text='{self.filter_text}')")
+        
+        self._pending_scan_assets = []
+        if not revalidate and skip_paths is None:
+            self._set_loaded([])
+            self._ungrouped_assets = []
+            self._all_scanned_paths = []
+            self._current_display_limit = 0
+            self._scanned_dirs = set()
+        if max_files is None:
+            max_files = self.max_search_files if is_search_mode else self.max_recursive_files
+        
+        scanner = DirectoryScanner(
+            self._scan_generation,
+            self.current_path,
+            recursive=should_search_recursively,
+            search_mode=is_search_mode,
+            max_files=max_files,
+            supported_formats=self.supported_formats,
+            filter_file_types=self._loaded_types,
+            matcher=self._search_matcher(),
+            needs_stat=(self.filter_min_size > 0 or self.filter_max_size > 0 or dirs is not None or
+                        self.filter_date_from is not None or self.filter_date_to is not None or
+                        self.sort_column in ("size", "date")),
+            record_listing=record_listing,
+            revalidate=revalidate,
+            listing_cache=self._listing_cache if record_listing else None,
+            dirs=dirs,
+            known_dirs=frozenset(self._scanned_dirs) if dirs is not None else (),
+            skip_paths=skip_paths or frozenset()
+        )
+        scanner.path_str = path_str
+        scanner.dir_mtime = dir_mtime
+        scanner.batchReady.connect(self._on_scan_batch)
+        scanner.progress.connect(self._on_scan_progress)
+        scanner.scanFinished.connect(self._on_scan_finished)
+        # Keep a reference until the thread has exited - cancelled scans finish on their own
+        self._scanner_threads.add(scanner)
+        scanner.finished.connect(lambda s=scanner: self._scanner_threads.discard(s))
+        self._scanner = scanner
+        scanner.start()
+    
+    def _on_scan_batch(self, generation, batch):
+        """Insert a batch of scanned items (GUI thread)"""
+        if generation != self._scan_generation:
+            return
         
-        # Collection mode - load files from collection list instead of directory
-        if self.collection_mode:
-            self._load_collection_files()
+        # Grouping would reshuffle rows at the end - hold items until the scan finishes
+        # (partial rescans are merged into the rows shown at the end as well)
+        if self.sequence_mode or self._scanner.revalidate:
+            self._pending_scan_assets.extend(batch)
             return
         
-        if not self.current_path or not self.current_path.exists():
-            self.assets = []
+        self._loaded_assets.extend(batch)
+        self._sorted_as = None
+        self._append_rows(self._visible(batch))
+    
+    def _on_scan_progress(self, generation, scanned, matched, loaded):
+        """Forward scan progress (GUI thread)"""
+        if (generation != self._scan_generation or self._scanner is None or
+                not self._scanner.recursive or self._scanner.revalidate):
+            return
+        if self._scanner.search_mode:
+            self.searchProgress.emit(scanned, matched)
+        else:
+            self.loadProgress.emit(loaded, scanned)
+    
+    def _on_scan_finished(self, generation, result):
+        """Group, sort and cache the scanned listing (GUI thread)"""
+        if generation != self._scan_generation:
             return
         
-        # Check cache first (only for non-recursive mode and when not forcing)
-        # IMPORTANT: Cache is ONLY used when include_subfolders is OFF
-        # When toggling include_subfolders, force refresh to avoid showing stale data
-        path_str = str(self.current_path)
-        current_mtime = self._get_dir_mtime(self.current_path)
+        scanner = self._scanner
+        self._scanner = None
         
-        cached_assets = None
-        # Only use cache if:
-        # 1. Not forcing refresh (force=False)
-        # 2. NOT in subfolder mode (include_subfolders=False)
-        # 3. NOT in search subfolder mode with active search (search_in_subfolders=False OR no search text)
-        # 4. NOT filtering by search text (filter_text is empty)
-        # 5. Cache is valid (not expired and directory not modified)
-        use_subfolders = self.include_subfolders or (self.search_in_subfolders and self.filter_text)
-        has_search_filter = bool(self.filter_text)
-        if not force and not use_subfolders and not has_search_filter and self._is_cache_valid(path_str, current_mtime):
-            cached_assets = self._get_from_cache(path_str)
+        if scanner.revalidate:
+            if scanner.dirs is not None:
+                self._apply_partial_listing(scanner, result)
+            else:
+                self._apply_revalidated_listing(scanner, result)
+            return
         
-        try:
-            all_items = []
-            
-            # Reset limit flag
-            self.limit_reached = False
-            
-            # Determine if we should search recursively
-            # Use recursive search if:
-            # 1. include_subfolders is ON (always show all files), OR
-            # 2. search_in_subfolders is ON AND there's search text present
-            should_search_recursively = self.include_subfolders or (self.search_in_subfolders and self.filter_text)
-            
+        if scanner.recursive:
+            # Store results for potential load_more
+            self._all_scanned_paths = result['scanned_paths']
+            self._current_display_limit = len(result['scanned_paths'])
+            self._scan_file_limit = scanner.max_files
+            if result['limit_reached']:
+                self.limit_reached = True
+                self.limitReached.emit(result['loaded_count'], result['file_count'])
+            elif not result['cancelled'] and not result['error']:
+                # Complete tree - its folders can be tracked and rescanned one by one
+                self._scanned_dirs = set(result['walked_dirs'])
+        
+        # Sort (and group) in place - rows only move, unless sequences were grouped
+        # (load_more in sequence mode: frames of the continued walk may join sequences shown)
+        regroup = self.sequence_mode and bool(scanner.skip_paths)
+        listed = self._ungrouped_assets if regroup else self._loaded_assets
+        finalized = self._finalize_assets(listed + self._pending_scan_assets)
+        self._pending_scan_assets = []
+        if not regroup:
+            self._loaded_assets = finalized
+        final_assets = self._visible(finalized)
+        
+        # Names of a complete walk - later searches in this tree filter them instead of walking again
+        if (result['name_index'] is not None and not result['limit_reached'] and
+                not result['cancelled'] and not result['error']):
+            entries = result['name_index']
+            self._search_index = {
+                'key': self._search_index_key(),
+                'entries': entries,
+                'matcher': scanner.matcher,
+                'matches': entries if scanner.matcher is None else scanner.matcher.filter(entries, itemgetter(1)),
+                'assets': {asset.path_str: asset for asset in self._ungrouped_assets},
+            }
+        if regroup:
+            self._apply_loaded_diff(finalized)
+        elif len(final_assets) == len(self.assets):
+            self._move_rows(final_assets)
+        else:
+            self._set_assets(final_assets)
+        
+        # Add to cache only complete, unfiltered listings of the current folder
+        if result['listing'] is not None and not result['cancelled'] and not result['error']:
+            self._add_to_cache(scanner.path_str, result['listing'], scanner.dir_mtime)
+        
+        self.scanFinished.emit()
+        
+        if self._pending_update_dirs:
+            dirs, self._pending_update_dirs = self._pending_update_dirs, set()
+            self.update_directories(dirs)
+    
+    def _apply_revalidated_listing(self, scanner, result):
+        """Compare a fresh listing with the rows shown (cached listing / watcher update) - apply the differences"""
+        if result['cancelled'] or result['error']:
+            return
+        
+        def signature(assets):
+            return sorted((asset.name, asset.is_folder, asset.size, asset.modified_time) for asset in assets)
+        
+        listing = result['listing']
+        cache_entry = self._dir_cache.get(scanner.path_str)
+        if cache_entry is not None and signature(cache_entry['assets']) == signature(listing):
             if DEBUG_MODE:
-                print(f"[Model] should_search_recursively={should_search_recursively} "
-                      f"(include_subfolders={self.include_subfolders}, "
-                      f"search_in_subfolders={self.search_in_subfolders}, "
-                      f"filter_text='{self.filter_text}')")
-            
-            if should_search_recursively:
-                # Recursive mode - collect files from all subfolders
-                file_count = 0
-                match_count = 0
-                loaded_count = 0
-                
-                # Determine which limit to use
-                is_search_mode = self.search_in_subfolders and self.filter_text
-                max_files = self.max_search_files if is_search_mode else self.max_recursive_files
-                
-                # Collect file paths as strings (memory efficient)
-                collected_paths = []
-                
-                for root, dirs, files in os.walk(self.current_path):
-                    # Check for interrupt
-                    if self._interrupt_search:
-                        print(f"⚠️ [FileSystemModel] Loading interrupted by user")
-                        break
-                    
-                    root_path = Path(root)
-                    
-                    # Add folders if enabled (only direct subfolders in current dir)
-                    if self.show_folders and root == str(self.current_path):
-                        for dir_name in dirs:
-                            if not dir_name.startswith('.'):
-                                if self.filter_text:
-                                    if self._matches_search(dir_name, self.filter_text):
-                                        collected_paths.append(str(root_path / dir_name))
-                                        loaded_count += 1
-                                else:
-                                    collected_paths.append(str(root_path / dir_name))
-                                    loaded_count += 1
-                    
-                    # Add files
-                    for file_name in files:
-                        ext = os.path.splitext(file_name)[1].lower()
-                        if ext in self.supported_formats:
-                            if self.filter_file_types and ext not in self.filter_file_types:
-                                continue
-                            
-                            file_count += 1
-                            
-                            # Apply search filter if in search mode
-                            if is_search_mode:
-                                if self._matches_search(file_name, self.filter_text):
-                                    collected_paths.append(str(root_path / file_name))
-                                    match_count += 1
-                                    loaded_count += 1
-                                
-                                if file_count % 100 == 0:
-                                    self.searchProgress.emit(file_count, match_count)
-                                    try:
-                                        if PYSIDE_VERSION == 6:
-                                            from PySide6.QtWidgets import QApplication
-                                        else:
-                                            from PySide2.QtWidgets import QApplication
-                                        QApplication.processEvents()
-                                    except:
-                                        pass
-                            else:
-                                # No search filter - add all files
-                                collected_paths.append(str(root_path / file_name))
-                                loaded_count += 1
-                                
-                                if file_count % 100 == 0:
-                                    self.loadProgress.emit(loaded_count, file_count)
-                                    try:
-                                        if PYSIDE_VERSION == 6:
-                                            from PySide6.QtWidgets import QApplication
-                                        else:
-                                            from PySide2.QtWidgets import QApplication
-                                        QApplication.processEvents()
-                                    except:
-                                        pass
-                            
-                            # Safety limit - stop scanning when we have enough
-                            if file_count >= max_files:
-                                self.limit_reached = True
-                                self.limitReached.emit(loaded_count, file_count)
-                                break
-                    
-                    if file_count >= max_files:
-                        break
-                
-                # Store results for potential load_more
-                self._all_scanned_paths = collected_paths
-                self._current_display_limit = len(collected_paths)
-                
-                # Convert collected string paths to Path objects (lazy conversion)
-                all_items = [Path(p) for p in collected_paths]
-                
-                # Emit final progress
-                if is_search_mode:
-                    self.searchProgress.emit(file_count, match_count)
-                else:
-                    self.loadProgress.emit(loaded_count, file_count)
-                
-                # Final UI update
-                try:
-                    if PYSIDE_VERSION == 6:
-                        from PySide6.QtWidgets import QApplication
-                    else:
-                        from PySide2.QtWidgets import QApplication
-                    QApplication.processEvents()
-                except:
-                    pass
+                print(f"[CACHE] Revalidated {scanner.path_str}: unchanged")
+            return
+        
+        self._add_to_cache(scanner.path_str, listing, scanner.dir_mtime)
+        changed_keys = self._apply_loaded_diff(self._finalize_assets(self._filter_listing(listing)))
+        if changed_keys:
+            self.assetsChanged.emit(changed_keys)
+        self.scanFinished.emit()
+    
+    def _apply_partial_listing(self, scanner, result):
+        """Merge a partial rescan of a recursive listing into the rows shown - only the changed folders are replaced"""
+        new_assets = self._pending_scan_assets
+        self._pending_scan_assets = []
+        if result['cancelled'] or result['error']:
+            return
+        
+        listed_dirs = {path: set(subdirs) for path, subdirs in result['listed_dirs'].items()}
+        self._search_index = None  # Names of the tree changed - the next search walks it again
+        
+        # Folders gone from the tree: unreadable ones and subfolders a listed folder no longer has
+        gone_dirs = set(result['missing_dirs'])
+        for path in self._scanned_dirs:
+            parent = os.path.dirname(path)
+            if parent in listed_dirs and path not in listed_dirs[parent]:
+                gone_dirs.add(path)
+        
+        # Files of listed folders were listed again, new subfolders were walked - old rows there are replaced
+        replaced_trees = gone_dirs | set(result['new_dirs'])
+        
+        def outdated(path):
+            parent = os.path.dirname(path)
+            if parent in listed_dirs:
+                return True
+            return self._is_in_trees(parent, replaced_trees, scanner.path_str)
+        
+        # Previous display order first, so items with equal sort keys don't swap rows
+        current_assets = self._ungrouped_assets if self.sequence_mode else self._loaded_assets
+        old_rows = {asset.path_str: row for row, asset in enumerate(current_assets)}
+        merged = [asset for asset in current_assets if not outdated(asset.path_str)] + new_assets
+        merged.sort(key=lambda asset: old_rows.get(asset.path_str, len(old_rows)))
+        changed_keys = self._apply_loaded_diff(self._finalize_assets(merged))
+        
+        self._scanned_dirs = {path for path in self._scanned_dirs
+                              if not self._is_in_trees(path, gone_dirs, scanner.path_str)}
+        self._scanned_dirs.update(result['walked_dirs'])
+        
+        if DEBUG_MODE:
+            print(f"[Model] Partial rescan of {len(listed_dirs)} folders, {len(result['new_dirs'])} new, "
+                  f"{len(gone_dirs)} gone")
+        if changed_keys:
+            self.assetsChanged.emit(changed_keys)
+        self.scanFinished.emit()
+    
+    @staticmethod
+    def _is_in_trees(path, roots, top):
+        """Check if path is one of roots or inside one (walks up to top at most)"""
+        while path not in roots:
+            if path == top:
+                return False
+            parent = os.path.dirname(path)
+            if parent == path:
+                return False
+            path = parent
+        return True
+    
+    @staticmethod
+    def _asset_key(asset):
+        """Identity of a row across listings - sequences by pattern, first frame may change"""
+        if asset.is_sequence and asset.sequence:
+            return os.path.join(str(asset.sequence.directory), asset.sequence.pattern)
+        return asset.path_str
+    
+    @staticmethod
+    def _asset_signature(asset):
+        """What has to match for a row to be unchanged (stat info as loaded - never stats)"""
+        if asset.is_sequence and asset.sequence:
+            sequence = asset.sequence
+            return (asset._size, asset._modified_time, sequence.frame_count, sequence.first_frame, sequence.last_frame)
+        return (asset._size, asset._modified_time)
+    
+    @staticmethod
+    def _row_ranges(rows):
+        """Sorted row numbers -> [(first, last), ...] of contiguous runs"""
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
             else:
-                # Normal mode - only current folder
-                
-                # Check if we have cached AssetItem objects
-                if cached_assets is not None:
-                    # Use cached AssetItem objects but still apply ALL filters!
-                    
-                    # Check if we need stat info for size/date filtering
-                    needs_stat_for_filter = (
-                        self.filter_min_size > 0 or 
-                        self.filter_max_size > 0 or 
-                        self.filter_date_from is not None or 
-                        self.filter_date_to is not None
-                    )
-                    
-                    # Load stat info if needed
-                    if needs_stat_for_filter:
-                        for asset in cached_assets:
-                            if not asset.is_folder:
-                                asset._load_stat()
-                    
-                    filtered_assets = []
-                    for asset in cached_assets:
-                        # Apply folder visibility filter
-                        if asset.is_folder:
-                            if not self.show_folders:
-                                continue
-                            # Apply search filter to folders too
-                            if self.filter_text:
-                                if not self._matches_search(asset.name, self.filter_text):
-                                    continue
-                            filtered_assets.append(asset)
-                            continue
-                        
-                        # Apply file type filter
-                        ext = asset.extension
-                        if self.filter_file_types:
-                            # Only specific types
-                            if ext not in self.filter_file_types:
-                                continue
-                            if ext not in self.supported_formats:
-                                continue
-                        else:
-                            # All supported types
-                            if ext not in self.supported_formats:
-                                continue
-                        
-                        # Apply show_images filter
-                        if asset.is_image_file and not self.show_images:
-                            continue
-                        
-                        # Apply show_scripts filter
-                        if asset.is_script_file and not self.show_scripts:
-                            continue
-                        
-                        # Apply size filter
-                        if self.filter_min_size > 0 or self.filter_max_size > 0:
-                            size = asset.size
-                            if self.filter_min_size > 0 and size < self.filter_min_size:
-                                continue
-                            if self.filter_max_size > 0 and size > self.filter_max_size:
-                                continue
-                        
-                        # Apply date filter
-                        if self.filter_date_from or self.filter_date_to:
-                            mod_time = asset.modified
-                            if self.filter_date_from and mod_time < self.filter_date_from:
-                                continue
-                            if self.filter_date_to and mod_time > self.filter_date_to:
-                                continue
-                        
-                        # Apply search filter
-                        if self.filter_text:
-                            if not self._matches_search(asset.name, self.filter_text):
-                                continue
-                        
-                        filtered_assets.append(asset)
-                    
-                    self.assets = filtered_assets
-                else:
-                    # No cache - load from filesystem using os.scandir() for maximum performance
-                    # scandir() returns DirEntry objects with cached stat info (1 filesystem call!)
-                    all_items = []
-                    
-                    # Use os.scandir() - much faster than iterdir() + glob()
-                    # DirEntry.is_dir() uses cached data from the initial scandir() call
-                    for entry in os.scandir(self.current_path):
-                        # Skip hidden files/folders (starting with .)
-                        if entry.name.startswith('.'):
-                            continue
-                        
-                        # Check if it's a directory
-                        try:
-                            is_directory = entry.is_dir(follow_symlinks=False)
-                        except OSError:
-                            # Handle permission errors or broken symlinks
-                            continue
-                        
-                        if is_directory:
-                            # Add folder if folders are enabled
-                            if self.show_folders:
-                                all_items.append(Path(entry.path))
-                        else:
-                            # Check file extension
-                            ext = Path(entry.name).suffix.lower()
-                            
-                            # Apply file type filters
-                            if self.filter_file_types:
-                                # Only specific types
-                                if ext in self.filter_file_types and ext in self.supported_formats:
-                                    all_items.append(Path(entry.path))
-                            else:
-                                # All supported types
-                                if ext in self.supported_formats:
-                                    all_items.append(Path(entry.path))
-            
-            # Only process if we didn't use cache
-            if cached_assets is None:
-                if DEBUG_MODE:
-                    print(f"[Model] No cache - loaded {len(all_items)} items from filesystem")
-                
-                # Filter based on search text (applies to both folders and files)
-                if self.filter_text:
-                    all_items = [f for f in all_items if self._matches_search(f.name, self.filter_text)]
-                    if DEBUG_MODE:
-                        print(f"[Model] After search filter: {len(all_items)} items")
-                
-                # Convert to AssetItem objects with LAZY LOADING
-                self.assets = [AssetItem(f, lazy_load=True) for f in all_items]
-                
-                if DEBUG_MODE:
-                    print(f"[Model] Created {len(self.assets)} AssetItem objects")
-                
-                # Apply advanced filters
-                # Ellenőrizzük, hogy kell-e stat info (méret/dátum szűrés)
-                needs_stat_for_filter = (
-                    self.filter_min_size > 0 or 
-                    self.filter_max_size > 0 or 
-                    self.filter_date_from is not None or 
-                    self.filter_date_to is not None
-                )
-                
-                # Ha kell stat info szűréshez, batch-ben töltjük be
-                if needs_stat_for_filter:
-                    for asset in self.assets:
-                        if not asset.is_folder:  # Csak fájlokhoz kell
-                            asset._load_stat()
-                
-                filtered_assets = []
-                for asset in self.assets:
-                    # Check if folders should be shown
-                    if asset.is_folder:
-                        if self.show_folders:
-                            filtered_assets.append(asset)
-                        continue
-                    
-                    # Check if images should be shown
-                    if asset.is_image_file and not self.show_images:
-                        continue
-                    
-                    # Check if scripts should be shown
-                    if asset.is_script_file and not self.show_scripts:
-                        continue
-                    
-                    # Size filter (for files only) - már be van töltve ha kell
-                    if self.filter_min_size > 0 and asset.size < self.filter_min_size:
-                        continue
-                    if self.filter_max_size > 0 and asset.size > self.filter_max_size:
-                        continue
-                    
-                    # Date filter (for files only) - már be van töltve ha kell
-                    if self.filter_date_from and asset.modified < self.filter_date_from:
-                        continue
-                    if self.filter_date_to and asset.modified > self.filter_date_to:
-                        continue
-                    
-                    filtered_assets.append(asset)
-                
-                self.assets = filtered_assets
-            
-            # Store ungrouped assets BEFORE sequence grouping for quick toggle
-            self._ungrouped_assets = self.assets.copy()
-            
-            # Group image sequences if sequence mode is enabled
-            if self.sequence_mode:
-                try:
-                    # print(f"[DEBUG] Grouping sequences for {len(self.assets)} assets...")
-                    self._group_sequences()
-                    # print(f"[DEBUG] After grouping: {len(self.assets)} assets")
-                except Exception as e:
-                    import traceback
-                    print(f"[ERROR] Sequence grouping failed: {e}")
-                    traceback.print_exc()
-                    # Don't crash, just skip grouping
-            
-            # Apply sorting
-            try:
-                self._sort_assets()
-            except Exception as e:
-                import traceback
-                print(f"[ERROR] Sorting failed: {e}")
-                traceback.print_exc()
-            
-            # Add to cache AFTER filtering and sorting (only if we loaded from filesystem)
-            # BUT: Don't cache if we have search filter or other filters applied
-            # because cache should only store the raw directory contents
-            if cached_assets is None and not self.filter_text:
-                self._add_to_cache(path_str, self.assets, current_mtime)
-            
-        except Exception as e:
-            print(f"File loading error: {e}")
-            self.assets = []
+                ranges.append([row, row])
+        return ranges
+    
+    def _apply_listing_diff(self, new_assets):
+        """
+        Turn the current rows into new_assets (grouped and sorted) without a model reset.
+        
+        Unchanged items keep their AssetItem, changed ones are replaced in place (dataChanged),
+        the rest is removed / inserted in contiguous runs.
+        
+        Returns:
+            list: Thumbnail cache keys of changed items (their thumbnails are outdated)
+        """
+        new_by_key = {self._asset_key(asset): asset for asset in new_assets}
+        
+        # Removed rows - from the bottom so the row numbers of earlier runs stay valid
+        removed_rows = [row for row, asset in enumerate(self.assets) if self._asset_key(asset) not in new_by_key]
+        for first, last in reversed(self._row_ranges(removed_rows)):
+            self._remove_rows(first, last)
+        
+        # Changed items are replaced, unchanged ones stay the shown object
+        changed_rows = []
+        changed_keys = []
+        for row, asset in enumerate(self.assets):
+            key = self._asset_key(asset)
+            new_asset = new_by_key[key]
+            if not asset._flags & AssetItem._STAT_LOADED and not asset.is_sequence:
+                # Never looked at - nothing shown depends on its stat info, adopt the fresh one
+                if new_asset._flags & AssetItem._STAT_LOADED:
+                    asset._size, asset._modified_time = new_asset._size, new_asset._modified_time
+                    asset._flags |= AssetItem._STAT_LOADED
+                new_by_key[key] = asset
+            elif (new_asset._flags & AssetItem._STAT_LOADED or new_asset.is_sequence) and \
+                    self._asset_signature(asset) != self._asset_signature(new_asset):
+                self.assets[row] = new_asset
+                changed_rows.append(row)
+                changed_keys.append(str(asset.sequence.pattern) if asset.is_sequence and asset.sequence
+                                    else asset.path_str)
+            else:
+                new_by_key[key] = asset
+        for first, last in self._row_ranges(changed_rows):
+            self._emit_rows_changed(first, last)
+        
+        # Final order - a changed size / date can move rows that were already there
+        target = [new_by_key[self._asset_key(asset)] for asset in new_assets]
+        shown = set(map(id, self.assets))
+        kept_order = [asset for asset in target if id(asset) in shown]
+        if any(a is not b for a, b in zip(kept_order, self.assets)):
+            self._move_rows(kept_order)
+        
+        # Added rows - the list matches target up to each run, so its index is the row
+        row = 0
+        while row < len(target):
+            if id(target[row]) in shown:
+                row += 1
+                continue
+            end = row
+            while end < len(target) and id(target[end]) not in shown:
+                end += 1
+            self._insert_rows(row, target[row:end])
+            row = end
+        
+        self._rebuild_path_index()
+        
+        if DEBUG_MODE:
+            print(f"[Model] Listing update: -{len(removed_rows)} rows, ~{len(changed_rows)} changed, "
+                  f"{len(self.assets)} rows now")
+        return changed_keys
+    
+    def _move_rows(self, new_order):
+        """
+        Reorder rows with layoutChanged - keeps selection and scroll position.
+        new_order may also drop or add items (view filters): rows of dropped items lose their
+        persistent indexes (selection), added ones get rows of their own. As many rows as
+        fetched stay fetched - items moved past them lose their persistent indexes too.
+        """
+        self.layoutAboutToBeChanged.emit()
+        row_count = min(len(new_order), max(self._row_count, self._row_limit))
+        new_rows = {id(asset): row for row, asset in enumerate(new_order[:row_count])}
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            row = new_rows.get(id(self.assets[index.row()])) if index.row() < len(self.assets) else None
+            new_indexes.append(row)
+        self.assets = new_order
+        self._row_count = row_count
+        new_indexes = [QModelIndex() if row is None else self.index(row, index.column())
+                       for row, index in zip(new_indexes, old_indexes)]
+        self._rebuild_path_index()
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def _insert_rows(self, row, items):
+        """Insert items at row - as rows if the views fetched that far, past the fetched rows silently"""
+        if not items:
+            return
+        if row > self._row_count:
+            self.assets[row:row] = items
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(items) - 1)
+        self.assets[row:row] = items
+        self._row_count += len(items)
+        self.endInsertRows()
+    
+    def _append_rows(self, items):
+        """
+        Append items (streamed scan batches, load_more). They become rows while the views
+        have fetched every row so far, up to _row_limit - the rest waits for fetchMore.
+        """
+        first = len(self.assets)
+        shown = max(0, min(len(items), self._row_limit - first)) if first == self._row_count else 0
+        self._insert_rows(first, items[:shown])
+        self.assets.extend(items[shown:])
+        for row, asset in enumerate(items, first):
+            self._file_path_to_row[asset.path_str] = row
+    
+    def _remove_rows(self, first, last):
+        """Remove items first..last - row removal is signalled for the fetched part"""
+        fetched_last = min(last, self._row_count - 1)
+        if fetched_last < first:
+            del self.assets[first:last + 1]
+            return
+        self.beginRemoveRows(QModelIndex(), first, fetched_last)
+        del self.assets[first:last + 1]
+        self._row_count -= fetched_last - first + 1
+        self.endRemoveRows()
+    
+    def _emit_rows_changed(self, first, last):
+        """dataChanged for rows first..last - only the fetched ones exist for the views"""
+        last = min(last, self._row_count - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0))
     
     def _sort_assets(self):
-        """Sort assets based on current sort settings"""
-        # Batch load stat info if sorting by size or date
-        if self.sort_column in ["size", "date"]:
-            for asset in self.assets:
-                if not asset.is_folder:
-                    asset._load_stat()
+        """
+        Sort assets based on current sort settings.
+        
+        Every key ends in the cached name key (AssetItem.sort_key), so the order is total:
+        descending is exactly ascending reversed, which setSortOrder uses for direction flips.
+        Size / date of items without stat info count as 0 until a background batch loads them.
+        """
+        if self.sort_column in ("size", "date"):
+            self._load_sort_stats()
         
         if self.sort_column == "name":
             # Natural sorting: 1, 2, 10 instead of 1, 10, 2
-            self.assets.sort(key=lambda x: (not x.is_folder, natural_sort_key(x.name)), reverse=not self.sort_ascending)
+            key = attrgetter('sort_key')
         elif self.sort_column == "size":
-            self.assets.sort(key=lambda x: (not x.is_folder, x.size), reverse=not self.sort_ascending)
+            key = lambda x: (not x.is_folder, x._size or 0, x.sort_key)
         elif self.sort_column == "date":
-            self.assets.sort(key=lambda x: (not x.is_folder, x.modified), reverse=not self.sort_ascending)
+            key = lambda x: (not x.is_folder, x._modified_time or 0, x.sort_key)
         elif self.sort_column == "type":
-            self.assets.sort(key=lambda x: (not x.is_folder, x.extension.lower()), reverse=not self.sort_ascending)
+            key = lambda x: (not x.is_folder, x.extension, x.sort_key)
+        else:
+            return
+        self.assets.sort(key=key, reverse=not self.sort_ascending)
+        self._sorted_as = (self.sort_column, self.sort_ascending)
+    
+    def _sorted_assets(self, assets=None):
+        """Assets (default: the rows) in sort order (a new list - rows are not touched)"""
+        current_assets = self.assets
+        self.assets = list(current_assets if assets is None else assets)
+        try:
+            self._sort_assets()
+        finally:
+            sorted_assets, self.assets = self.assets, current_assets
+        return sorted_assets
+    
+    def _load_sort_stats(self):
+        """
+        Size / date sort: items without stat info are stat-ed in a background batch and
+        the rows re-sorted when it is done - small listings are loaded right away.
+        """
+        # Folders sort by date but not by size
+        with_folders = self.sort_column == "date"
+        missing = [asset for asset in self.assets
+                   if not asset._flags & AssetItem._STAT_LOADED and (with_folders or not asset.is_folder)]
+        if len(missing) <= self.SORT_STAT_SYNC_LIMIT:
+            for asset in missing:
+                asset._load_stat()
+            return
+        
+        if self._stat_batch is not None:
+            self._stat_batch.set()
+        cancel_event = threading.Event()
+        self._stat_batch = cancel_event
+        self._stat_generation += 1
+        
+        if DEBUG_MODE:
+            print(f"[Model] Loading stat info of {len(missing)} items for the {self.sort_column} sort")
+        threading.Thread(target=self._stat_batch_worker, args=(self._stat_generation, missing, cancel_event),
+                         name="SortStat", daemon=True).start()
+    
+    def _stat_batch_worker(self, generation, assets, cancel_event):
+        """Load stat info of assets (background thread)"""
+        for asset in assets:
+            if cancel_event.is_set():
+                return
+            asset._load_stat()
+        self._sortStatsLoaded.emit(generation)
+    
+    def _on_sort_stats_loaded(self, generation):
+        """Stat batch done - move rows into size / date order (GUI thread)"""
+        if generation != self._stat_generation:
+            return
+        self._stat_batch = None
+        if self.sort_column not in ("size", "date") or self.is_scanning():
+            return  # A finishing scan sorts anyway
+        self._sort_rows()
+    
+    def _sort_rows(self, flipped=False):
+        """
+        Move the rows into the current sort order. The loaded set is sorted with them, so
+        items a filter change shows later come in the same order.
+        
+        Args:
+            flipped: Only the direction changed - reverse instead of sorting
+        """
+        loaded = self._loaded_assets
+        new_order = None
+        if loaded is not None:
+            loaded = self._loaded_assets = loaded[::-1] if flipped else self._sorted_assets(loaded)
+            shown = set(map(id, self.assets))
+            new_order = [asset for asset in loaded if id(asset) in shown]
+        if new_order is None or len(new_order) != len(self.assets):
+            # Rows set from outside the loaded set (advanced filters) - sort them by themselves
+            new_order = self.assets[::-1] if flipped else self._sorted_assets()
+        if flipped:
+            self._sorted_as = (self.sort_column, self.sort_ascending)
+        self._move_rows(new_order)
     
     def _group_sequences(self):
         """
@@ -906,7 +2632,7 @@ class FileSystemModel(QAbstractListModel):
         Modifies self.assets in-place to replace sequence files with single sequence items.
         Groups sequences PER FOLDER to avoid memory issues with subfolders.
         """
-        from .utils import group_image_sequences
+        from .utils import group_sequence_names
         from collections import defaultdict
         
         if DEBUG_MODE:
@@ -937,8 +2663,7 @@ class FileSystemModel(QAbstractListModel):
             # Group image files by their parent directory
             files_by_folder = defaultdict(list)
             for asset in image_files:
-                folder = asset.file_path.parent
-                files_by_folder[folder].append(asset)
+                files_by_folder[os.path.dirname(asset.path_str)].append(asset)
             
             if DEBUG_MODE:
                 print(f"[Model] Grouping {len(image_files)} images across {len(files_by_folder)} folders")
@@ -947,44 +2672,37 @@ class FileSystemModel(QAbstractListModel):
             sequence_assets = []
             total_sequences = 0
             for folder, folder_assets in files_by_folder.items():
-                # Convert AssetItems to Path objects for this folder only
-                image_paths = [asset.file_path for asset in folder_assets]
+                # Group into sequences (only within this folder) - each name parsed once,
+                # results refer back to folder_assets by index
+                sequences, singles = group_sequence_names([asset.name for asset in folder_assets])
                 
-                # Group into sequences (only within this folder)
-                sequences_dict = group_image_sequences(image_paths)
+                if DEBUG_MODE and sequences:
+                    print(f"[Model] Folder {os.path.basename(folder)}: {len(sequences)} sequences "
+                          f"from {len(folder_assets)} images")
+                    total_sequences += len(sequences)
                 
-                sequences_in_folder = sum(1 for files in sequences_dict.values() if len(files) > 1)
-                if DEBUG_MODE and sequences_in_folder > 0:
-                    print(f"[Model] Folder {folder.name}: {sequences_in_folder} sequences from {len(folder_assets)} images")
-                    total_sequences += sequences_in_folder
+                # Create AssetItems for sequences
+                for pattern, (name_info, frames, indices) in sequences.items():
+                    file_list = [folder_assets[index].path_str for index in indices]
+                    sequence = ImageSequence(pattern, file_list, frames, name_info)
+                    # Size column / preview ask for total_size - repaint the row once it is known
+                    sequence.size_listener = self._sequenceSizeReady.emit
+                    
+                    # Use first file as the base AssetItem
+                    asset = AssetItem(file_list[0], lazy_load=True, is_folder=False)
+                    
+                    # Mark as sequence and attach sequence object
+                    asset.is_sequence = True
+                    asset.sequence = sequence
+                    asset.name = pattern  # Display pattern instead of filename
+                    
+                    # Ensure thumbnail generation is enabled for sequences
+                    asset.should_generate_thumbnail = True
+                    
+                    sequence_assets.append(asset)
                 
-                # Create AssetItems for sequences and single files
-                for pattern, file_list in sequences_dict.items():
-                    if len(file_list) > 1:
-                        # This is a sequence - create a sequence AssetItem
-                        sequence = ImageSequence(pattern, file_list)
-                        
-                        # Use first file as the base AssetItem
-                        first_file = file_list[0]
-                        asset = AssetItem(first_file, lazy_load=True)
-                        
-                        # Mark as sequence and attach sequence object
-                        asset.is_sequence = True
-                        asset.sequence = sequence
-                        asset.name = pattern  # Display pattern instead of filename
-                        
-                        # Ensure thumbnail generation is enabled for sequences
-                        asset.should_generate_thumbnail = True
-                        
-                        sequence_assets.append(asset)
-                    else:
-                        # Single file - keep original AssetItem
-                        # Find original asset
-                        file_path = file_list[0]
-                        for original_asset in folder_assets:
-                            if original_asset.file_path == file_path:
-                                sequence_assets.append(original_asset)
-                                break
+                # Single files - keep original AssetItems
+                sequence_assets.extend(folder_assets[index] for index in singles)
             
             # Replace assets list: folders + sequences + other files
             self.assets = folders + sequence_assets + other_files
@@ -992,96 +2710,143 @@ class FileSystemModel(QAbstractListModel):
             # No image files to group
             self.assets = folders + other_files
     
+    def request_stats(self, rows, prefetch=False):
+        """
+        Load stat info of these rows in the background - dataChanged is emitted for them
+        once it arrives.
+        
+        Args:
+            rows: Row numbers (out of range ones are skipped)
+            prefetch: Rows not on screen yet - stat-ed after the ones painted
+        """
+        assets = self.assets
+        self._stat_loader.request((assets[row] for row in rows if 0 <= row < len(assets)), prefetch)
+    
+    def _on_stats_loaded(self, assets):
+        """A background stat batch is done - repaint its rows, one dataChanged per run (GUI thread)"""
+        rows = []
+        for asset in assets:
+            row = self._file_path_to_row.get(asset.path_str)
+            if row is not None and row < len(self.assets) and self.assets[row] is asset:
+                rows.append(row)
+        for first, last in self._row_ranges(sorted(rows)):
+            self._emit_rows_changed(first, last)
+    
+    def _request_stat(self, asset):
+        """Stat asset in the background - a paint pass asks row by row, the rows are queued as one request"""
+        if not self._stat_requests:
+            QtCore.QTimer.singleShot(0, self._flush_stat_requests)
+        self._stat_requests.append(asset)
+    
+    def _flush_stat_requests(self):
+        """Queue the rows painted without stat info since the last event loop pass"""
+        assets, self._stat_requests = self._stat_requests, []
+        self._stat_loader.request(assets)
+    
+    def _size_text(self, asset):
+        """Size column text - "..." while stat info is loaded in the background"""
+        if not asset._flags & (AssetItem._STAT_LOADED | AssetItem._FOLDER) and not asset.is_sequence:
+            self._request_stat(asset)
+            return "..."
+        return asset.get_size_string()
+    
+    def _modified_text(self, asset):
+        """Date column text - "..." while stat info is loaded in the background"""
+        if not asset._flags & AssetItem._STAT_LOADED:
+            self._request_stat(asset)
+            return "..."
+        return asset.get_modified_string()
+    
+    def _on_sequence_size_ready(self, sequence):
+        """Background total_size of a sequence is known - repaint its row, notify the preview (GUI thread)"""
+        row = self._file_path_to_row.get(sequence._path_str(0))
+        if row is not None and row < len(self.assets) and self.assets[row].sequence is sequence:
+            self._emit_rows_changed(row, row)
+        self.sequenceSizeReady.emit(sequence)
+    
+    def _search_matcher(self):
+        """
+        SearchMatcher for the current search text and options - compiled once per change
+        (case / regex / term options are set directly by the browser, so they are part of the key)
+        
+        Returns:
+            SearchMatcher or None without search text
+        """
+        if not self.filter_text:
+            return None
+        key = (self.filter_text, self.case_sensitive_search, self.regex_search, self.term_search)
+        if key != self._matcher_key:
+            self._matcher = SearchMatcher(*key)
+            self._matcher_key = key
+        return self._matcher
+    
     def _matches_search(self, filename, search_text):
         """
         Check if filename matches search text
         Supports case-sensitive and regex search based on settings
         """
-        if self.regex_search:
-            # Regex search
-            try:
-                import re
-                flags = 0 if self.case_sensitive_search else re.IGNORECASE
-                return bool(re.search(search_text, filename, flags))
-            except re.error:
-                # Invalid regex - fall back to plain text search
-                pass
-        
-        # Plain text search
-        if self.case_sensitive_search:
-            return search_text in filename
-        else:
-            return search_text.lower() in filename.lower()
+        if search_text == self.filter_text:
+            return bool(self._search_matcher()(filename))
+        return bool(SearchMatcher(search_text, self.case_sensitive_search, self.regex_search, self.term_search)(filename))
     
     def setSortOrder(self, column, ascending=True):
-        """Set sort order"""
-        self.beginResetModel()
+        """Set sort order - rows are moved (selection stays), a direction flip only reverses them"""
+        flipped = self._sorted_as == (column, not ascending)
         self.sort_column = column
         self.sort_ascending = ascending
-        self._sort_assets()
-        self.endResetModel()
+        self._sort_rows(flipped)
     
     def setFilterText(self, text):
         """Set filter text"""
         if self.filter_text != text:
             self.beginResetModel()
             self.filter_text = text
-            # When clearing search (text is empty), force refresh to ensure 
-            # we get current directory state (not cached subfolder results)
-            if text == "":
-                force_refresh = True
-            else:
-                force_refresh = False
-            self.refresh(force=force_refresh)
+            self._search_matcher()
+            # Caches hold complete listings (search text is applied on top), so clearing
+            # the search needs no forced reload either
+            self.refresh()
             self.endResetModel()
     
+    def _needs_types(self, types):
+        """Check if the loaded set lacks files of these types (empty = all supported)"""
+        return bool(self._loaded_types) and not (types and self._loaded_types.issuperset(types))
+    
     def setFilterFileTypes(self, types):
         """Set file type filter - list of extensions like ['.ma', '.mb']"""
-        self.beginResetModel()
+        reload = self._needs_types(types)
         self.filter_file_types = types
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters(reload)
     
     def setFilterSize(self, min_size=0, max_size=0):
         """Set size filter in bytes"""
-        self.beginResetModel()
         self.filter_min_size = min_size
         self.filter_max_size = max_size
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters()
     
     def setFilterDate(self, date_from=None, date_to=None):
         """Set date filter - datetime objects"""
-        self.beginResetModel()
         self.filter_date_from = date_from
         self.filter_date_to = date_to
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters()
     
     def setShowFolders(self, show):
         """Toggle folder visibility"""
-        self.beginResetModel()
         self.show_folders = show
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters()
     
     def setShowImages(self, show):
         """Toggle image file visibility"""
-        self.beginResetModel()
         self.show_images = show
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters()
     
     def setShowScripts(self, show):
         """Toggle script file visibility"""
-        self.beginResetModel()
         self.show_scripts = show
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters()
     
     def clearFilters(self):
         """Clear all advanced filters"""
-        self.beginResetModel()
+        reload = self._needs_types([])
         self.filter_file_types = []
         self.filter_min_size = 0
         self.filter_max_size = 0
@@ -1090,8 +2855,7 @@ class FileSystemModel(QAbstractListModel):
         self.show_folders = True
         self.show_images = True
         self.show_scripts = True
-        self.refresh()  # Filters are now properly applied to cached assets
-        self.endResetModel()
+        self._apply_view_filters(reload)
     
     def setCollectionFilter(self, file_paths):
         """Switch to collection mode and show only collection files"""
@@ -1154,6 +2918,20 @@ class FileSystemModel(QAbstractListModel):
             import traceback
             print(f"[ERROR] Sorting failed: {e}")
             traceback.print_exc()
+        
+        # The regrouped list is the loaded set - rows are what the view filters let through
+        if not self.collection_mode:
+            self._loaded_assets = self.assets
+            self.assets = self._visible(self.assets)
+    
+    def _update_collection(self):
+        """Rebuild the collection listing and apply it as row differences (watched folders changed)"""
+        current_assets = self.assets
+        self._load_collection_files()
+        new_assets, self.assets = self.assets, current_assets
+        changed_keys = self._apply_listing_diff(new_assets)
+        if changed_keys:
+            self.assetsChanged.emit(changed_keys)
     
     def _load_collection_files(self):
         """Load files and folders from collection list (collection mode)"""
@@ -1164,16 +2942,18 @@ class FileSystemModel(QAbstractListModel):
             for file_path_str in self.collection_files:
                 file_path = Path(file_path_str)
                 
-                # Check if file/folder exists
-                if not file_path.exists():
+                # One stat answers exists / folder / size / date
+                try:
+                    stat_info = file_path.stat()
+                except OSError:
                     continue
                 
                 # Handle folders
-                if file_path.is_dir():
+                if stat.S_ISDIR(stat_info.st_mode):
                     # Always show the folder itself if show_folders is enabled
                     if self.show_folders:
                         try:
-                            asset = AssetItem(file_path, lazy_load=False)
+                            asset = AssetItem.from_stat(file_path, stat_info)
                             all_assets.append(asset)
                         except Exception as e:
                             if DEBUG_MODE:
@@ -1181,14 +2961,13 @@ class FileSystemModel(QAbstractListModel):
                     
                     # If include_subfolders is enabled, also load all files from this folder recursively
                     if self.include_subfolders:
-                        # OPTIMIZED: Use os.walk instead of rglob for better memory efficiency
-                        for root, dirs, files in os.walk(str(file_path)):
-                            root_path = Path(root)
-                            for file_name in files:
-                                item_path = root_path / file_name
+                        # OPTIMIZED: Use walk_parallel instead of rglob for better memory efficiency
+                        for root, dir_entries, file_entries in walk_parallel(str(file_path), entries=True):
+                            for entry in file_entries:
+                                item_path = entry.path
                                 
                                 # Check if extension is supported
-                                ext = item_path.suffix.lower()
+                                ext = os.path.splitext(entry.name)[1].lower()
                                 if ext not in self.supported_formats:
                                     continue
                                 
@@ -1198,7 +2977,7 @@ class FileSystemModel(QAbstractListModel):
                                 
                                 # Create AssetItem with LAZY LOADING
                                 try:
-                                    asset = AssetItem(item_path, lazy_load=True)
+                                    asset = AssetItem.from_dir_entry(entry, is_folder=False)
                                     
                                     # Apply size filter
                                     if self.filter_min_size > 0 and asset.size < self.filter_min_size:
@@ -1221,7 +3000,7 @@ class FileSystemModel(QAbstractListModel):
                     continue
                 
                 # Handle files
-                if not file_path.is_file():
+                if not stat.S_ISREG(stat_info.st_mode):
                     continue
                 
                 # Check if extension is supported
@@ -1235,7 +3014,7 @@ class FileSystemModel(QAbstractListModel):
                 
                 # Create AssetItem
                 try:
-                    asset = AssetItem(file_path, lazy_load=False)
+                    asset = AssetItem.from_stat(file_path, stat_info)
                     
                     # Apply size filter
                     if self.filter_min_size > 0 and asset.size < self.filter_min_size:
@@ -1258,7 +3037,7 @@ class FileSystemModel(QAbstractListModel):
             
             # Apply search filter (applies to both folders and files)
             if self.filter_text:
-                self.assets = [asset for asset in all_assets if self._matches_search(asset.name, self.filter_text)]
+                self.assets = self._search_matcher().filter(all_assets, name_of)
             else:
                 self.assets = all_assets
             
@@ -1272,7 +3051,30 @@ class FileSystemModel(QAbstractListModel):
             self.assets = []
     
     def rowCount(self, parent=QModelIndex()):
-        return len(self.assets)
+        # Only fetched rows - assets may also be replaced from outside (advanced filters)
+        return min(self._row_count, len(self.assets))
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        """
+        More items than rows - or a scan is still streaming in after the last row, so
+        a view scrolled to the end lets the next items become rows as they arrive.
+        """
+        if parent.isValid():
+            return False
+        return self._row_count < len(self.assets) or self.is_scanning()
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Hand the next FETCH_CHUNK items to the views (called as they scroll to the end)"""
+        if parent.isValid():
+            return
+        first = self._row_count
+        self._row_limit = first + self.FETCH_CHUNK
+        count = min(self.FETCH_CHUNK, len(self.assets) - first)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._row_count += count
+        self.endInsertRows()
     
     def columnCount(self, parent=QModelIndex()):
         """Return number of columns: Name, Size, Date, Type"""
@@ -1297,9 +3099,9 @@ class FileSystemModel(QAbstractListModel):
             if column == 0:  # Name
                 return asset.get_display_name()
             elif column == 1:  # Size
-                return asset.get_size_string()
+                return self._size_text(asset)
             elif column == 2:  # Date Modified
-                return asset.get_modified_string()
+                return self._modified_text(asset)
             elif column == 3:  # Type
                 if asset.is_folder:
                     return "Folder"
@@ -1336,8 +3138,8 @@ class FileSystemModel(QAbstractListModel):
                 <div style="border-top: 1px solid #555; padding-top: 6px;">
                     <div style="margin: 2px 0;"><span style="color: #999;">📍 Path:</span> <span style="color: #ddd;">{path_str}</span></div>
                     <div style="margin: 2px 0;"><span style="color: #999;">📦 Type:</span> <span style="color: {color}; font-weight: bold;">{file_type}</span></div>
-                    <div style="margin: 2px 0;"><span style="color: #999;">📊 Size:</span> <span style="color: #ddd; font-weight: bold;">{asset.get_size_string()}</span></div>
-                    <div style="margin: 2px 0;"><span style="color: #999;">📅 Modified:</span> <span style="color: #ddd; font-weight: bold;">{asset.get_modified_string()}</span></div>
+                    <div style="margin: 2px 0;"><span style="color: #999;">📊 Size:</span> <span style="color: #ddd; font-weight: bold;">{self._size_text(asset)}</span></div>
+                    <div style="margin: 2px 0;"><span style="color: #999;">📅 Modified:</span> <span style="color: #ddd; font-weight: bold;">{self._modified_text(asset)}</span></div>
                 </div>
             </div>
             """
@@ -1456,98 +3258,21 @@ class FileSystemModel(QAbstractListModel):
         return False
     
     def load_more(self, increment=10000):
-        """Load more files when limit was reached.
-        On first call, performs full scan to find all files.
-        On subsequent calls, uses cached results.
+        """
+        Continue a recursive listing that stopped at its file limit.
+        
+        The tree is walked again by a DirectoryScanner thread with a higher limit - items
+        already shown are skipped, new ones stream in as rows like during the first scan.
+        scanFinished (and limitReached, if the new limit is hit too) fire when it is done.
         
         Args:
-            increment: How many more files to display (default 10000)
+            increment: How many more files to load (default 10000)
         """
-        import time
-        
-        if not self.limit_reached:
+        if not self.limit_reached or self.is_scanning():
             return
         
-        load_start = time.time()
-        previous_count = len(self.assets)
-        
-        # If no cached scan exists, perform FULL scan now
-        if not self._all_scanned_paths or len(self._all_scanned_paths) == self._current_display_limit:
-            print(f"📂 [FileSystemModel] Performing full scan to find all files...")
-            scan_start = time.time()
-            
-            # Do a complete scan without limit
-            all_paths = []
-            is_search_mode = self.search_in_subfolders and self.filter_text
-            
-            for root, dirs, files in os.walk(self.current_path):
-                if self._interrupt_search:
-                    break
-                
-                root_path = Path(root)
-                
-                # Add folders
-                if self.show_folders and root == str(self.current_path):
-                    for dir_name in dirs:
-                        if not dir_name.startswith('.'):
-                            if self.filter_text:
-                                if self._matches_search(dir_name, self.filter_text):
-                                    all_paths.append(str(root_path / dir_name))
-                            else:
-                                all_paths.append(str(root_path / dir_name))
-                
-                # Add files
-                for file_name in files:
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext in self.supported_formats:
-                        if self.filter_file_types and ext not in self.filter_file_types:
-                            continue
-                        
-                        if is_search_mode:
-                            if self._matches_search(file_name, self.filter_text):
-                                all_paths.append(str(root_path / file_name))
-                        else:
-                            all_paths.append(str(root_path / file_name))
-            
-            self._all_scanned_paths = all_paths
-            scan_time = time.time() - scan_start
-            print(f"   Full scan completed in {scan_time:.2f}s - found {len(all_paths)} total files")
-        
-        # Calculate new display limit
-        old_limit = self._current_display_limit
-        new_limit = min(old_limit + increment, len(self._all_scanned_paths))
-        
-        print(f"📂 [FileSystemModel] Loading {new_limit - old_limit} more files ({old_limit} → {new_limit} out of {len(self._all_scanned_paths)} total)...")
-        
-        # Get the additional paths to display
-        additional_paths = self._all_scanned_paths[old_limit:new_limit]
-        
-        # Convert to Path objects and create AssetItems
-        print(f"   Creating AssetItem objects...")
-        creation_start = time.time()
-        additional_items = [Path(p) for p in additional_paths]
-        additional_assets = [AssetItem(f, lazy_load=True) for f in additional_items]
-        creation_time = time.time() - creation_start
-        print(f"   AssetItem creation took {creation_time:.2f}s")
-        
-        # Add to existing assets
-        self.beginResetModel()
-        self.assets.extend(additional_assets)
-        self._current_display_limit = new_limit
-        
-        # Check if we reached the end
-        if new_limit >= len(self._all_scanned_paths):
-            self.limit_reached = False
-            print(f"✓ [FileSystemModel] All files loaded ({len(self.assets)} total)")
-        else:
-            self.limit_reached = True
-            print(f"⚠️ [FileSystemModel] {len(self._all_scanned_paths) - new_limit} more files available")
-        
-        self.endResetModel()
-        
-        elapsed = time.time() - load_start
-        added = len(self.assets) - previous_count
-        print(f"✓ [FileSystemModel] Loaded {added} additional files (total: {len(self.assets)}) in {elapsed:.2f}s")
-
-
-        return False
+        self.limit_reached = False
+        self._cancel_scan()
+        self._start_scan(str(self.current_path), None,
+                         max_files=self._scan_file_limit + increment,
+                         skip_paths=frozenset(asset.path_str for asset in self._ungrouped_assets))
@@ -1112,6 +1112,7 @@ class PreviewPanel(QWidget):
         self.config = config
         self.metadata_manager = metadata_manager  # For tag-based color management
         self.current_assets = []
+        self._sequence_size_row = None  # (ImageSequence, value QLabel) of a "Calculating..." Total Size row
         self.current_pixmap = None  # Store scaled preview pixmap
         self.full_res_pixmap = None  # Store full resolution pixmap for zoom
         self.preview_cache = {}  # Cache: file_path -> (pixmap, resolution)
@@ -3718,13 +3719,14 @@ class PreviewPanel(QWidget):
     
     def clear_metadata(self):
         """Clear metadata labels"""
+        self._sequence_size_row = None
         while self.metadata_layout.count():
             item = self.metadata_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
     
     def add_metadata_row(self, icon, label, value):
-        """Add a metadata row with icon, label, and value"""
+        """Add a metadata row with icon, label, and value - returns the value QLabel"""
         row_widget = QWidget()
         row_layout = QHBoxLayout(row_widget)
         row_layout.setContentsMargins(0, 1, 0, 1)
@@ -3750,6 +3752,15 @@ class PreviewPanel(QWidget):
         
         # Add the row widget to metadata layout
         self.metadata_layout.addWidget(row_widget)
+        return value_widget
+    
+    def update_sequence_size(self, sequence):
+        """Background total_size of a sequence is known - fill in its "Calculating..." row if previewed"""
+        if self._sequence_size_row is None or self._sequence_size_row[0] is not sequence:
+            return
+        _, value_widget = self._sequence_size_row
+        self._sequence_size_row = None
+        value_widget.setText(self.format_file_size(sequence.total_size))
     
     def add_compact_exif_header(self, meta):
         """Add compact EXIF header (Adobe Bridge style)
@@ -4048,7 +4059,12 @@ class PreviewPanel(QWidget):
             if not seq.is_continuous and seq.missing_frames:
                 missing_count = len(seq.missing_frames)
                 self.add_metadata_row("⚠️", "Missing", f"{missing_count} frames")
-            self.add_metadata_row("💾", "Total Size", self.format_file_size(seq.total_size))
+            total_size = seq.total_size  # None while calculated in the background
+            if total_size is None:
+                # Filled in by update_sequence_size() once the background calculation is done
+                self._sequence_size_row = (seq, self.add_metadata_row("💾", "Total Size", "Calculating..."))
+            else:
+                self.add_metadata_row("💾", "Total Size", self.format_file_size(total_size))
             
             # File type
             file_type = asset.extension.upper() + " sequence"
@@ -4557,7 +4573,12 @@ class PreviewPanel(QWidget):
             if not seq.is_continuous and seq.missing_frames:
                 missing_count = len(seq.missing_frames)
                 self.add_metadata_row("⚠️", "Missing", f"{missing_count} frames")
-            self.add_metadata_row("💾", "Total Size", self.format_file_size(seq.total_size))
+            total_size = seq.total_size  # None while calculated in the background
+            if total_size is None:
+                # Filled in by update_sequence_size() once the background calculation is done
+                self._sequence_size_row = (seq, self.add_metadata_row("💾", "Total Size", "Calculating..."))
+            else:
+                self.add_metadata_row("💾", "Total Size", self.format_file_size(total_size))
         
         # If this is a video file, add video-specific metadata
         if asset.is_video_file:
@@ -53,6 +53,9 @@ class SettingsManager:
                 "confirm_delete": True,
                 "auto_refresh": False,
                 "refresh_interval": 5,  # seconds
+                "listing_cache_enabled": True,  # Remember folder listings across sessions
+                "listing_cache_size_mb": 50,  # Folder listing cache size in MB
+                "listing_cache_ttl_days": 30,  # Listings not validated for this long are dropped
                 "ui_font": "Segoe UI"  # Default UI font family (Windows standard, matches Maya UI)
             },
             # Thumbnail settings
@@ -60,9 +63,11 @@ class SettingsManager:
                 "size": 128,
                 "memory_cache_size": 2000,  # Number of thumbnails in RAM
                 "cache_size_mb": 500,  # Disk cache size in MB
+                "packed_cache": False,  # Store disk cache thumbnails in pack files (applies after restart)
                 "quality": "medium",  # low, medium, high
                 "generate_for_3d": True,
-                "worker_threads": 0  # 0 = Auto-detect based on CPU cores (max 12), 1-12 = manual override
+                "worker_threads": 0,  # 0 = Auto-detect based on CPU cores (max 12), 1-12 = manual override
+                "background_generation": True  # Generate thumbnails for the rest of the folder while idle
             },
             # Preview settings
             "preview": {
@@ -82,7 +87,8 @@ class SettingsManager:
                 "show_hidden": False,
                 "case_sensitive_search": False,
                 "regex_search": False,
-                "max_recursive_files": 10000,  # Maximum files when browsing subfolders
+                "term_search": False,  # AND / OR / -exclude / glob terms instead of one substring
+                "max_recursive_files": 0,  # Maximum files when browsing subfolders (0 = no limit)
                 "max_search_files": 100000  # Maximum files when searching in subfolders
             },
             # Advanced Filters - saved filter presets
@@ -244,6 +250,40 @@ class GeneralSettingsTab(QWidget):
         behavior_group.setLayout(behavior_layout)
         layout.addWidget(behavior_group)
         
+        # Folder listing cache group
+        listing_cache_group = QGroupBox("Folder Listing Cache")
+        listing_cache_layout = QVBoxLayout()
+        
+        self.listing_cache_cb = QCheckBox("Remember folder listings between sessions")
+        self.listing_cache_cb.setChecked(self.settings.get("general", "listing_cache_enabled", True))
+        self.listing_cache_cb.setToolTip(
+            "Known folders are shown right away from the cache and checked for changes in the background"
+        )
+        listing_cache_layout.addWidget(self.listing_cache_cb)
+        
+        listing_size_layout = QHBoxLayout()
+        listing_size_layout.addWidget(QLabel("    Max cache size:"))
+        self.listing_cache_size_spin = QSpinBox()
+        self.listing_cache_size_spin.setRange(5, 1000)
+        self.listing_cache_size_spin.setValue(self.settings.get("general", "listing_cache_size_mb", 50))
+        self.listing_cache_size_spin.setSuffix(" MB")
+        listing_size_layout.addWidget(self.listing_cache_size_spin)
+        listing_size_layout.addStretch()
+        listing_cache_layout.addLayout(listing_size_layout)
+        
+        listing_ttl_layout = QHBoxLayout()
+        listing_ttl_layout.addWidget(QLabel("    Keep listings for:"))
+        self.listing_cache_ttl_spin = QSpinBox()
+        self.listing_cache_ttl_spin.setRange(1, 365)
+        self.listing_cache_ttl_spin.setValue(self.settings.get("general", "listing_cache_ttl_days", 30))
+        self.listing_cache_ttl_spin.setSuffix(" days")
+        listing_ttl_layout.addWidget(self.listing_cache_ttl_spin)
+        listing_ttl_layout.addStretch()
+        listing_cache_layout.addLayout(listing_ttl_layout)
+        
+        listing_cache_group.setLayout(listing_cache_layout)
+        layout.addWidget(listing_cache_group)
+        
         # Database group
         database_group = QGroupBox("Database")
         database_layout = QVBoxLayout()
@@ -389,6 +429,9 @@ class GeneralSettingsTab(QWidget):
         self.settings.set("general", "confirm_delete", self.confirm_delete_cb.isChecked())
         self.settings.set("general", "auto_refresh", self.auto_refresh_cb.isChecked())
         self.settings.set("general", "refresh_interval", self.refresh_spin.value())
+        self.settings.set("general", "listing_cache_enabled", self.listing_cache_cb.isChecked())
+        self.settings.set("general", "listing_cache_size_mb", self.listing_cache_size_spin.value())
+        self.settings.set("general", "listing_cache_ttl_days", self.listing_cache_ttl_spin.value())
 
 
 class ThumbnailSettingsTab(QWidget):
@@ -494,6 +537,15 @@ class ThumbnailSettingsTab(QWidget):
         worker_threads_layout.addStretch()
         performance_layout.addLayout(worker_threads_layout)
         
+        # Background generation (idle fill of the disk cache for the whole folder)
+        self.background_generation_cb = QCheckBox("Generate thumbnails for the whole folder in the background")
+        self.background_generation_cb.setChecked(self.settings.get("thumbnails", "background_generation", True))
+        self.background_generation_cb.setToolTip(
+            "While nothing on screen is waiting, generate thumbnails for the rest of the folder\n"
+            "so scrolling later shows them instantly. Uses at most half of the worker threads."
+        )
+        performance_layout.addWidget(self.background_generation_cb)
+        
         # Info label
         perf_info = QLabel(
             "⚡ Multithreading speeds up thumbnail generation for large files (TIFF, EXR, HDR).\n"
@@ -535,6 +587,15 @@ class ThumbnailSettingsTab(QWidget):
         cache_size_layout.addStretch()
         cache_layout.addLayout(cache_size_layout)
         
+        # Packed disk cache (few large files instead of one file per thumbnail)
+        self.packed_cache_cb = QCheckBox("Store disk cache in pack files")
+        self.packed_cache_cb.setChecked(self.settings.get("thumbnails", "packed_cache", False))
+        self.packed_cache_cb.setToolTip(
+            "Append thumbnails to a few large pack files instead of one JPEG per thumbnail.\n"
+            "Faster on network drives and with antivirus scanning. Requires restart."
+        )
+        cache_layout.addWidget(self.packed_cache_cb)
+        
         clear_cache_layout = QHBoxLayout()
         self.cache_info_label = QLabel("Current cache size: Calculating...")
         clear_cache_layout.addWidget(self.cache_info_label)
@@ -597,8 +658,10 @@ class ThumbnailSettingsTab(QWidget):
         self.settings.set("thumbnails", "quality", quality_map[self.quality_combo.currentIndex()])
         self.settings.set("thumbnails", "memory_cache_size", self.memory_cache_spin.value())
         self.settings.set("thumbnails", "cache_size_mb", self.cache_size_spin.value())
+        self.settings.set("thumbnails", "packed_cache", self.packed_cache_cb.isChecked())
         self.settings.set("thumbnails", "generate_for_3d", self.generate_3d_cb.isChecked())
         self.settings.set("thumbnails", "worker_threads", self.worker_threads_spin.value())
+        self.settings.set("thumbnails", "background_generation", self.background_generation_cb.isChecked())
 
 
 class PreviewSettingsTab(QWidget):
@@ -780,6 +843,11 @@ class FiltersSettingsTab(QWidget):
         self.regex_search_cb.setChecked(self.settings.get("filters", "regex_search", False))
         search_layout.addWidget(self.regex_search_cb)
         
+        self.term_search_cb = QCheckBox("Search terms (AND, OR / |, -exclude, *globs, \"quoted text\")")
+        self.term_search_cb.setChecked(self.settings.get("filters", "term_search", False))
+        self.term_search_cb.setToolTip("Off: the search text is matched as one substring, spaces included")
+        search_layout.addWidget(self.term_search_cb)
+        
         search_group.setLayout(search_layout)
         layout.addWidget(search_group)
         
@@ -789,7 +857,8 @@ class FiltersSettingsTab(QWidget):
         
         # Description
         recursive_desc = QLabel(
-            "When 'Include Subfolders' is enabled, limit the maximum number of files to load for performance."
+            "When 'Include Subfolders' is enabled, optionally limit the maximum number of files to load. "
+            "Rows are added to the view in chunks as you scroll, so large trees don't need a limit."
         )
         recursive_desc.setWordWrap(True)
         recursive_desc.setStyleSheet("QLabel { color: #888; font-size: 9px; padding: 5px; }")
@@ -799,11 +868,12 @@ class FiltersSettingsTab(QWidget):
         max_files_layout = QHBoxLayout()
         max_files_layout.addWidget(QLabel("Max files (Include Subfolders):"))
         self.max_recursive_spin = QSpinBox()
-        self.max_recursive_spin.setRange(100, 100000)
+        self.max_recursive_spin.setRange(0, 1000000)
         self.max_recursive_spin.setSingleStep(1000)
-        self.max_recursive_spin.setValue(self.settings.get("filters", "max_recursive_files", 10000))
+        self.max_recursive_spin.setSpecialValueText("No limit")
+        self.max_recursive_spin.setValue(self.settings.get("filters", "max_recursive_files", 0))
         self.max_recursive_spin.setSuffix(" files")
-        self.max_recursive_spin.setToolTip("Limit when browsing all files in subfolders (Include Subfolders checkbox)")
+        self.max_recursive_spin.setToolTip("Limit when browsing all files in subfolders (Include Subfolders checkbox)\n0 = no limit - rows are fetched as you scroll")
         max_files_layout.addWidget(self.max_recursive_spin)
         max_files_layout.addStretch()
         recursive_layout.addLayout(max_files_layout)
@@ -846,6 +916,7 @@ class FiltersSettingsTab(QWidget):
         self.settings.set("filters", "show_hidden", self.show_hidden_cb.isChecked())
         self.settings.set("filters", "case_sensitive_search", self.case_sensitive_cb.isChecked())
         self.settings.set("filters", "regex_search", self.regex_search_cb.isChecked())
+        self.settings.set("filters", "term_search", self.term_search_cb.isChecked())
         self.settings.set("filters", "max_recursive_files", self.max_recursive_spin.value())
         self.settings.set("filters", "max_search_files", self.max_search_spin.value())
 
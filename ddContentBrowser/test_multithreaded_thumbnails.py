@@ -90,15 +90,16 @@ def test_multithreaded_generation():
         # Track completed thumbnails
         completed = []
         
-        def on_ready(file_path, pixmap):
-            completed.append(file_path)
-            print(f"  ✓ Thumbnail ready: {Path(file_path).name}")
+        def on_ready(batch):
+            for file_path, pixmap in batch:
+                completed.append(file_path)
+                print(f"  ✓ Thumbnail ready: {Path(file_path).name}")
         
         def on_failed(file_path, error):
             print(f"  ✗ Failed: {Path(file_path).name} - {error}")
         
         # Connect signals
-        generator.thumbnail_ready.connect(on_ready)
+        generator.thumbnails_ready.connect(on_ready)
         generator.generation_failed.connect(on_failed)
         
         # Start generator
@@ -110,7 +111,7 @@ def test_multithreaded_generation():
         
         for file_path in test_files:
             mtime = file_path.stat().st_mtime
-            generator.add_to_queue(str(file_path), mtime, asset=None)
+            generator.add_to_queue(str(file_path), mtime, priority=True, asset=None)
         
         # Wait for completion
         print("Processing...")
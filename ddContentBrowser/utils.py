@@ -469,7 +469,8 @@ def generate_default_file_formats_config():
                 "thumbnail": {
                     "generate": category_data["generate_thumbnail"],
                     "method": thumbnail_method,
-                    "max_size_mb": 50 if thumbnail_method == "qimage_optimized" else None
+                    "max_size_mb": 50 if thumbnail_method == "qimage_optimized" else None,
+                    "backend": "thread"
                 },
                 "maya_import_type": maya_import_type
             }
@@ -668,7 +669,8 @@ def get_extension_config(extension):
             "thumbnail": {
                 "generate": category_data["generate_thumbnail"],
                 "method": thumbnail_method,
-                "max_size_mb": 50 if thumbnail_method == "qimage_optimized" else None
+                "max_size_mb": 50 if thumbnail_method == "qimage_optimized" else None,
+                "backend": "thread"
             },
             "maya_import_type": maya_import_type
         }
@@ -719,6 +721,21 @@ def get_thumbnail_method(extension):
     return thumbnail_config.get("method", "none")
 
 
+def get_thumbnail_backend(extension):
+    """
+    Get where thumbnails for extension are generated.
+    
+    'thread' suits decoders that release the GIL (OpenCV, TurboJPEG). 'process' runs
+    GIL-bound decoders (psd-tools, PIL, numpy tonemapping) in a worker process pool.
+    
+    Returns:
+        str: 'thread' (default) or 'process'
+    """
+    ext_config = get_extension_config(extension)
+    backend = ext_config.get("thumbnail", {}).get("backend", "thread")
+    return backend if backend in ("thread", "process") else "thread"
+
+
 def get_maya_import_type(extension):
     """
     Get Maya import type string for extension.
@@ -755,10 +772,16 @@ def get_extensions_for_thumbnail_method(method):
 # IMAGE SEQUENCE DETECTION
 # ============================================================================
 
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+# Frame number patterns of detect_sequence_pattern(), matched against the stem
+_FRAME_PATTERN = re.compile(r'^(.+?)[_.](\d+)$')      # name_0001 / name.0001
+_HASH_PATTERN = re.compile(r'^(.+?)(#+)$')             # name####
+_PRINTF_PATTERN = re.compile(r'^(.+?)%0?(\d+)d$')      # name%04d
+
 
 def detect_sequence_pattern(filename):
     """
@@ -779,10 +802,13 @@ def detect_sequence_pattern(filename):
         'anim####.png' -> ('anim', None, 4, '')
         'frame%04d.tif' -> ('frame', None, 4, '%')
     """
-    stem = Path(filename).stem
-    
+    return _parse_sequence_stem(os.path.splitext(filename)[0])
+
+
+def _parse_sequence_stem(stem):
+    """detect_sequence_pattern() of a name without extension"""
     # Pattern 1: name_0001 or name.0001 (most common)
-    match = re.match(r'^(.+?)[_.](\d+)$', stem)
+    match = _FRAME_PATTERN.match(stem)
     if match:
         base_name = match.group(1)
         frame_str = match.group(2)
@@ -790,14 +816,14 @@ def detect_sequence_pattern(filename):
         return (base_name, int(frame_str), len(frame_str), separator)
     
     # Pattern 2: name#### (hash padding)
-    match = re.match(r'^(.+?)(#+)$', stem)
+    match = _HASH_PATTERN.match(stem)
     if match:
         base_name = match.group(1).rstrip('_.')  # Remove trailing separator if any
         padding = len(match.group(2))
         return (base_name, None, padding, '#')
     
     # Pattern 3: name%04d (printf style)
-    match = re.match(r'^(.+?)%0?(\d+)d$', stem)
+    match = _PRINTF_PATTERN.match(stem)
     if match:
         base_name = match.group(1).rstrip('_.')
         padding = int(match.group(2)) if match.group(2) else 1
@@ -806,6 +832,64 @@ def detect_sequence_pattern(filename):
     return None
 
 
+def group_sequence_names(names: List[str]) -> Tuple[Dict[str, tuple], List[int]]:
+    """
+    Group the file names of one folder into sequences - every name is parsed once.
+    
+    Args:
+        names: File names (images only)
+    
+    Returns:
+        tuple: (sequences, singles)
+            sequences: {sequence key: ((base_name, padding, separator), frames, indices)} for
+                keys with 2+ files - frames sorted, indices into names in the same order
+            singles: Indices of names that are not part of a sequence
+    
+    Example:
+        ['render_0002.jpg', 'other.png', 'render_0001.jpg'] ->
+            ({'render_####.jpg': (('render', 4, '_'), [1, 2], [2, 0])}, [1])
+    """
+    parsed = {}
+    name_infos = {}
+    singles = []
+    
+    for index, name in enumerate(names):
+        stem, ext = os.path.splitext(name)
+        pattern_info = _parse_sequence_stem(stem)
+        if pattern_info is None:
+            singles.append(index)
+            continue
+        
+        base_name, frame_num, padding, separator = pattern_info
+        if separator == '#':
+            seq_key = f"{base_name}{'#' * padding}{ext}"
+        elif separator == '%':
+            seq_key = f"{base_name}%0{padding}d{ext}"
+        else:
+            seq_key = f"{base_name}{separator}{'#' * padding}{ext}"
+        
+        # (frame, index) pairs - hash / printf names have no frame number, they sort as 0
+        frames = parsed.get(seq_key)
+        if frames is None:
+            # Base name, padding and separator are part of the key - the same for all its names
+            frames = parsed[seq_key] = []
+            name_infos[seq_key] = (base_name, padding, separator)
+        frames.append((frame_num or 0, index))
+    
+    sequences = {}
+    for seq_key, frames in parsed.items():
+        if len(frames) == 1:
+            # Only one file - not really a sequence
+            singles.append(frames[0][1])
+            continue
+        frames.sort()  # By frame, ties in listing order
+        sequences[seq_key] = (name_infos[seq_key],
+                              [frame for frame, index in frames],
+                              [index for frame, index in frames])
+    
+    return sequences, singles
+
+
 def group_image_sequences(file_paths: List[Path]) -> Dict[str, List[Path]]:
     """
     Group image files into sequences.
@@ -823,49 +907,14 @@ def group_image_sequences(file_paths: List[Path]) -> Dict[str, List[Path]]:
             'other.png': [other.png]  # Single file
         }
     """
-    sequences = {}
-    single_files = {}
-    
-    for path in file_paths:
-        pattern_info = detect_sequence_pattern(path.name)
-        
-        if pattern_info:
-            base_name, frame_num, padding, separator = pattern_info
-            ext = path.suffix
-            
-            # Create sequence key
-            if separator == '#':
-                # Already has hash padding
-                seq_key = f"{base_name}{'#' * padding}{ext}"
-            elif separator == '%':
-                # Printf style
-                seq_key = f"{base_name}%0{padding}d{ext}"
-            else:
-                # Underscore or dot separator with numeric padding
-                seq_key = f"{base_name}{separator}{'#' * padding}{ext}"
-            
-            if seq_key not in sequences:
-                sequences[seq_key] = []
-            sequences[seq_key].append(path)
-        else:
-            # Not a sequence - treat as single file
-            single_files[path.name] = [path]
-    
-    # Sort each sequence by frame number
-    for seq_key, files in sequences.items():
-        sequences[seq_key] = sorted(files, key=lambda p: extract_frame_number(p.name))
-    
-    # Filter out single-file "sequences" - move them to single_files
-    actual_sequences = {}
-    for seq_key, files in sequences.items():
-        if len(files) > 1:
-            actual_sequences[seq_key] = files
-        else:
-            # Only one file - not really a sequence
-            single_files[files[0].name] = files
+    sequences, singles = group_sequence_names([path.name for path in file_paths])
     
-    # Merge sequences and single files
-    return {**actual_sequences, **single_files}
+    grouped = {seq_key: [file_paths[index] for index in indices]
+               for seq_key, (name_info, frames, indices) in sequences.items()}
+    # Single files
+    for index in singles:
+        grouped[file_paths[index].name] = [file_paths[index]]
+    return grouped
 
 
 def extract_frame_number(filename: str) -> int:
@@ -1904,6 +1904,61 @@ class MayaStyleListView(QListView):
         # Accept the event to prevent default handling
         event.accept()
     
+    def visible_row_range(self):
+        """
+        Get first and last row intersecting the viewport.
+        
+        Probes indexAt() on lines along the top and bottom of the viewport, half an item
+        apart, so the cost depends on the number of visible items - not on the row count.
+        (A single corner probe is not enough: it misses whenever it lands in the spacing
+        between items.)
+        
+        Returns:
+            tuple: (first_row, last_row) or (None, None) if no item is visible
+        """
+        model = self.model()
+        if model is None or model.rowCount() == 0:
+            return None, None
+        
+        viewport_rect = self.viewport().rect()
+        if viewport_rect.isEmpty():
+            return None, None
+        
+        # Uniform item sizes - the first item tells the probe spacing for all of them
+        item_rect = self.visualRect(model.index(0, 0))
+        step_x = max(2, item_rect.width() // 2)
+        step_y = max(2, item_rect.height() // 2)
+        probe_xs = list(range(viewport_rect.left(), viewport_rect.right(), step_x)) + [viewport_rect.right()]
+        
+        def rows_on_line(y):
+            rows = (self.indexAt(QPoint(x, y)).row() for x in probe_xs)
+            return [row for row in rows if row >= 0]
+        
+        # First row: scan down from the top edge
+        first_row = None
+        y = viewport_rect.top()
+        while y <= viewport_rect.bottom():
+            rows = rows_on_line(y)
+            if rows:
+                first_row = min(rows)
+                break
+            y += step_y
+        
+        if first_row is None:
+            return None, None
+        
+        # Last row: scan up from the bottom edge (stops early when the view is full)
+        last_row = first_row
+        y = viewport_rect.bottom()
+        while y >= viewport_rect.top():
+            rows = rows_on_line(y)
+            if rows:
+                last_row = max(rows)
+                break
+            y -= step_y
+        
+        return first_row, last_row
+    
     def mousePressEvent(self, event):
         """Handle mouse press - Middle button for batch import, Left button for selection/drag"""
         if event.button() == Qt.MiddleButton: